@@ -1,4 +1,9 @@
 from .lexer import BslLexer, SdblLexer  # noqa
+from .incremental import IncrementalBslLexer  # noqa
+from .parallel import parallel_get_tokens  # noqa
+from .stream import BslStreamLexer, lex_file  # noqa
+from .lines import highlight_lines  # noqa
+from .precompiled import warmup  # noqa
 
 
-__all__ = ["BslLexer", "SdblLexer"]
\ No newline at end of file
+__all__ = ["BslLexer", "SdblLexer", "IncrementalBslLexer", "BslStreamLexer", "lex_file", "highlight_lines", "parallel_get_tokens", "warmup"]
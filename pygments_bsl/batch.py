@@ -0,0 +1,229 @@
+"""Highlight a whole source tree in one run.
+
+::
+
+    pygments-bsl-batch src/ -o site/src -f html -O linenos=table
+    pygments-bsl-batch src/ --jobs 8
+
+Every ``*.bsl``, ``*.os`` and ``*.sdbl`` file below the source directory is
+formatted by a pool of worker processes that compile the lexer tables once.
+The output goes next to each file (``Module.bsl.html``) or into the same
+relative path below ``--output``. A manifest keeps the content hash of
+every file, so unchanged files are skipped on the next run; the hash also
+covers the formatter, its options and the package version. It is written to
+the output directory, or below ``<cache dir>/batch`` when the output goes
+next to the sources, so the source tree only gets the formatted files.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from fnmatch import fnmatch
+from pathlib import Path
+
+from pygments import highlight
+from pygments.formatters import get_formatter_by_name
+from pygments.util import ClassNotFound
+
+from .lexer import BslLexer, SdblLexer
+from .precompiled import cache_dir, package_version, warmup
+
+MANIFEST_NAME = '.pygments-bsl-batch.json'
+LEXERS = (BslLexer, SdblLexer)
+
+_lexers = {}
+
+
+def lexer_for(path):
+    for lexer_cls in LEXERS:
+        if any(fnmatch(path.name.lower(), pattern) for pattern in lexer_cls.filenames):
+            return lexer_cls
+    return None
+
+
+def output_suffix(formatter):
+    for pattern in getattr(formatter, 'filenames', ()):
+        if pattern.startswith('*.'):
+            return pattern[1:]
+    return f'.{formatter.aliases[0]}'
+
+
+def parse_options(values):
+    """Parse ``-O key=value,key=value`` like ``pygmentize`` does."""
+    options = {}
+    for value in values or ():
+        for item in value.split(','):
+            item = item.strip()
+            if not item:
+                continue
+            key, sep, option = item.partition('=')
+            options[key.strip()] = option.strip() if sep else True
+    return options
+
+
+def settings_digest(formatter_name, options):
+    settings = json.dumps([formatter_name, options, package_version()], sort_keys=True)
+    return hashlib.sha256(settings.encode('utf-8')).hexdigest()
+
+
+def manifest_path(source, output=None):
+    """Return the manifest of a run over ``source`` writing to ``output``
+    (``None``: next to the sources)."""
+    if output is not None:
+        return Path(output) / MANIFEST_NAME
+    name = hashlib.sha256(str(Path(source).resolve()).encode('utf-8', 'surrogatepass')).hexdigest()
+    return cache_dir() / 'batch' / f'{name[:32]}.json'
+
+
+def collect(source):
+    """Return the sorted source files below ``source`` that a lexer handles."""
+    files = []
+    for root, dirs, names in os.walk(source):
+        dirs[:] = sorted(name for name in dirs if not name.startswith('.'))
+        for name in sorted(names):
+            path = Path(root) / name
+            if lexer_for(path) is not None:
+                files.append(path)
+    return files
+
+
+def _warm_worker():
+    # the tables come from the on-disk cache the parent filled
+    for lexer_cls in LEXERS:
+        _lexers[lexer_cls] = lexer_cls()
+
+
+def highlight_file(task):
+    """Format one file; runs in a worker process.
+
+    ``task`` is ``(source, target, previous digest, settings, formatter, options)``.
+    Returns ``(status, digest, size, error)`` where status is ``written``,
+    ``skipped`` or ``failed``.
+    """
+    source, target, previous, settings, formatter_name, options = task
+    try:
+        data = Path(source).read_bytes()
+        digest = hashlib.sha256(settings.encode('ascii') + data).hexdigest()
+        if digest == previous and Path(target).exists():
+            return 'skipped', digest, len(data), None
+        lexer_cls = lexer_for(Path(source))
+        lexer = _lexers.get(lexer_cls)
+        if lexer is None:
+            lexer = _lexers[lexer_cls] = lexer_cls()
+        formatter = get_formatter_by_name(formatter_name, **options)
+        result = highlight(data.decode('utf-8-sig'), lexer, formatter)
+        Path(target).parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(result, bytes):
+            Path(target).write_bytes(result)
+        else:
+            Path(target).write_text(result, encoding='utf-8')
+    except Exception as exc:
+        return 'failed', None, 0, f'{type(exc).__name__}: {exc}'
+    return 'written', digest, len(data), None
+
+
+def load_manifest(path):
+    try:
+        data = json.loads(Path(path).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_manifest(path, manifest):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(manifest, indent=1, sort_keys=True, ensure_ascii=False) + '\n', encoding='utf-8')
+
+
+def format_summary(counts, size, elapsed, failures):
+    total = sum(counts.values())
+    lines = [
+        f'{total} files: {counts["written"]} written, {counts["skipped"]} unchanged, '
+        f'{counts["failed"]} failed in {elapsed:.2f}s',
+        f'{total / elapsed if elapsed else 0.0:.1f} files/s, '
+        f'{size / 1e6 / elapsed if elapsed else 0.0:.2f} MB/s',
+    ]
+    lines.extend(f'FAILED {path}: {error}' for path, error in failures)
+    return '\n'.join(lines)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='pygments-bsl-batch',
+        description='Highlight every BSL/SDBL file of a source tree.',
+    )
+    parser.add_argument('source', help='directory with the source files')
+    parser.add_argument('-o', '--output',
+                        help='output directory (default: next to each source file)')
+    parser.add_argument('-f', '--formatter', default='html',
+                        help='Pygments formatter name (default: %(default)s)')
+    parser.add_argument('-O', dest='options', action='append', metavar='OPTIONS',
+                        help='formatter options as key=value[,key=value] (repeatable)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='worker processes, 1 formats in this process (default: %(default)s)')
+    parser.add_argument('--force', action='store_true',
+                        help='format all files even when their content did not change')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    source = Path(args.source)
+    if not source.is_dir():
+        print(f'Not a directory: {source}', file=sys.stderr)
+        return 2
+    options = parse_options(args.options)
+    try:
+        formatter = get_formatter_by_name(args.formatter, **options)
+    except ClassNotFound as exc:
+        print(exc, file=sys.stderr)
+        return 2
+
+    output = Path(args.output) if args.output else source
+    suffix = output_suffix(formatter)
+    manifest_file = manifest_path(source, args.output)
+    previous = {} if args.force else load_manifest(manifest_file)
+    settings = settings_digest(args.formatter, options)
+
+    files = collect(source)
+    tasks = []
+    for path in files:
+        relative = path.relative_to(source).as_posix()
+        target = (output / relative).with_name(path.name + suffix)
+        tasks.append((str(path), str(target), previous.get(relative), settings, args.formatter, options))
+
+    started = time.perf_counter()
+    if args.jobs > 1 and len(tasks) > 1:
+        # the embedded query lexers too, the workers create them on demand
+        warmup()
+        with ProcessPoolExecutor(args.jobs, initializer=_warm_worker) as executor:
+            results = list(executor.map(highlight_file, tasks, chunksize=max(len(tasks) // (args.jobs * 8), 1)))
+    else:
+        results = [highlight_file(task) for task in tasks]
+    elapsed = time.perf_counter() - started
+
+    manifest = {}
+    counts = {'written': 0, 'skipped': 0, 'failed': 0}
+    size = 0
+    failures = []
+    for path, (status, digest, length, error) in zip(files, results):
+        relative = path.relative_to(source).as_posix()
+        counts[status] += 1
+        size += length
+        if digest is not None:
+            manifest[relative] = digest
+        if error is not None:
+            failures.append((relative, error))
+    save_manifest(manifest_file, manifest)
+
+    print(format_summary(counts, size, elapsed, failures))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,438 @@
+"""Throughput benchmarks for the BSL/SDBL lexers.
+
+Run from a source checkout::
+
+    python -m pygments_bsl.bench
+    python -m pygments_bsl.bench --case big.bsl --repeat 5
+    python -m pygments_bsl.bench --case big.bsl --normalized
+    python -m pygments_bsl.bench --save-baseline
+    python -m pygments_bsl.bench --scaling query-heavy --sizes 256KB,1MB,10MB
+    python -m pygments_bsl.bench --snippets 50000
+    python -m pygments_bsl.bench --lex-file 50MB
+
+Every case lexes one of the files from ``tests/examplefiles`` and reports
+tokens/sec, MB/s, peak memory and the first-call (cold compile) latency next
+to the best warm latency. The case is also lexed with the stock ``regex``
+engine and its ``speedup`` is the ratio of the two tokens/sec, which does
+not depend on the machine. When a baseline file exists the run fails if any
+case loses more than ``--max-regression`` percent of its speedup.
+``--normalized`` adds a row per case lexed with ``get_tokens_normalized``,
+which skips the copies of the Pygments input preprocessing.
+
+``--scaling`` lexes generated modules (``pygments_bsl.corpus``) of growing
+size instead, one row per size gives the throughput-vs-size curve;
+``--snippets`` lexes many tiny generated snippets with one lexer;
+``--lex-file`` writes a generated module to a temporary file and lexes it
+with ``pygments_bsl.stream.lex_file``, window by window.
+"""
+
+import argparse
+import gc
+import json
+import re
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from . import corpus, precompiled
+from .engine import first_char_test
+from .lexer import BslLexer, ConstraintLogicLexer, SdblLexer, SdblQueryLexer
+from .stream import WINDOW_SIZE, lex_file
+
+ROOT = Path(__file__).resolve().parents[1]
+EXAMPLES_DIR = ROOT / 'tests' / 'examplefiles'
+DEFAULT_BASELINE = ROOT / 'benchmarks' / 'baseline.json'
+DEFAULT_MAX_REGRESSION = 10.0
+DEFAULT_REPEAT = 3
+DEFAULT_SCALING_SIZES = ('64KB', '256KB', '1MB', '4MB')
+# the speedups of the cases are measured against this engine
+REFERENCE_ENGINE = 'regex'
+# small texts are lexed several times per timed turn of a speedup
+MIN_TURN_SECONDS = 0.02
+
+LEXER_CLASSES = (BslLexer, SdblLexer, SdblQueryLexer, ConstraintLogicLexer)
+
+CASES = (
+    (BslLexer, 'bsl/big.bsl'),
+    (BslLexer, 'bsl/samples.bsl'),
+    (BslLexer, 'bsl/samples.os'),
+    (SdblLexer, 'sdbl/samples.sdbl'),
+    (SdblQueryLexer, 'sdbl/samples.sdbl'),
+    (ConstraintLogicLexer, 'sdbl/samples.sdbl'),
+)
+
+
+def case_name(lexer_cls, path):
+    return f'{lexer_cls.__name__}:{path}'
+
+
+def reset_compiled_tables():
+    """Drop the processed token tables so the next lexer call compiles again.
+
+    The on-disk table cache is kept but never written, the cold numbers show
+    a new process.
+    """
+    for lexer_cls in LEXER_CLASSES:
+        if '_tokens' in lexer_cls.__dict__:
+            del lexer_cls._tokens
+    re.purge()
+    first_char_test.cache_clear()
+    precompiled.reset()
+
+
+def _consume(lexer, text, normalized=False):
+    count = 0
+    for _ in lexer.get_tokens_normalized(text) if normalized else lexer.get_tokens(text):
+        count += 1
+    return count
+
+
+def _warm_time(lexer, text, repeat=DEFAULT_REPEAT, normalized=False):
+    """Return the best of ``repeat`` runs over ``text`` in seconds."""
+    warm = None
+    for _ in range(max(repeat, 1)):
+        started = time.perf_counter()
+        _consume(lexer, text, normalized)
+        elapsed = time.perf_counter() - started
+        warm = elapsed if warm is None else min(warm, elapsed)
+    return warm
+
+
+def measure_speedup(lexer_cls, text, repeat=DEFAULT_REPEAT, options=None, normalized=False):
+    """Return how many times faster ``lexer_cls(**options)`` lexes ``text``
+    than the ``REFERENCE_ENGINE``.
+
+    The two are timed in turns, so a busy machine slows both of them.
+    """
+    options = options or {}
+    lexer = lexer_cls(**options)
+    reference = lexer_cls(**{**options, 'engine': REFERENCE_ENGINE})
+    _consume(lexer, text, normalized)
+    first = _warm_time(lexer, text, 1, normalized)
+    loops = max(1, int(MIN_TURN_SECONDS / first)) if first else 1
+    _consume(reference, text, normalized)
+
+    def turn(lexer):
+        # like timeit, a collection must not land in one of the two turns
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            for _ in range(loops):
+                _consume(lexer, text, normalized)
+            return time.perf_counter() - started
+        finally:
+            gc.enable()
+
+    warm = reference_warm = None
+    for _ in range(max(repeat, 1)):
+        elapsed = turn(lexer)
+        warm = elapsed if warm is None else min(warm, elapsed)
+        elapsed = turn(reference)
+        reference_warm = elapsed if reference_warm is None else min(reference_warm, elapsed)
+    return reference_warm / warm if warm else 0.0
+
+
+def run_case(lexer_cls, text, repeat=DEFAULT_REPEAT, options=None, normalized=False):
+    options = options or {}
+    size = len(text.encode('utf-8'))
+
+    reset_compiled_tables()
+    started = time.perf_counter()
+    tokens = _consume(lexer_cls(**options), text, normalized)
+    cold = time.perf_counter() - started
+
+    lexer = lexer_cls(**options)
+    warm = _warm_time(lexer, text, repeat, normalized)
+
+    tracemalloc.start()
+    try:
+        _consume(lexer, text, normalized)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'bytes': size,
+        'tokens': tokens,
+        'cold_ms': cold * 1000,
+        'warm_ms': warm * 1000,
+        'tokens_per_sec': tokens / warm if warm else 0.0,
+        'mb_per_sec': size / 1e6 / warm if warm else 0.0,
+        'peak_mb': peak / 1e6,
+    }
+
+
+def corpus_lexer(profile):
+    return SdblLexer if profile == 'sdbl' else BslLexer
+
+
+def run_scaling(profile, sizes=DEFAULT_SCALING_SIZES, repeat=DEFAULT_REPEAT, options=None):
+    """Run a case per size on generated modules of ``profile``."""
+    lexer_cls = corpus_lexer(profile)
+    results = {}
+    for size in sizes:
+        text = corpus.generate(corpus.parse_size(size), profile)
+        results[f'{lexer_cls.__name__}:{profile}:{size}'] = run_case(lexer_cls, text, repeat, options)
+    return results
+
+
+def run_snippets(count, profile=corpus.DEFAULT_PROFILE, repeat=DEFAULT_REPEAT, options=None):
+    """Lex ``count`` generated snippets with one lexer, like a docs build does."""
+    options = options or {}
+    lexer_cls = corpus_lexer(profile)
+    snippets = corpus.generate_snippets(count, profile)
+    size = sum(len(snippet.encode('utf-8')) for snippet in snippets)
+
+    def consume_all(lexer):
+        return sum(_consume(lexer, snippet) for snippet in snippets)
+
+    reset_compiled_tables()
+    started = time.perf_counter()
+    tokens = consume_all(lexer_cls(**options))
+    cold = time.perf_counter() - started
+
+    lexer = lexer_cls(**options)
+    warm = None
+    for _ in range(max(repeat, 1)):
+        started = time.perf_counter()
+        consume_all(lexer)
+        elapsed = time.perf_counter() - started
+        warm = elapsed if warm is None else min(warm, elapsed)
+
+    tracemalloc.start()
+    try:
+        consume_all(lexer)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        f'{lexer_cls.__name__}:{profile}:{count} snippets': {
+            'bytes': size,
+            'tokens': tokens,
+            'cold_ms': cold * 1000,
+            'warm_ms': warm * 1000,
+            'tokens_per_sec': tokens / warm if warm else 0.0,
+            'mb_per_sec': size / 1e6 / warm if warm else 0.0,
+            'peak_mb': peak / 1e6,
+        },
+    }
+
+
+def run_file(size, profile=corpus.DEFAULT_PROFILE, repeat=DEFAULT_REPEAT, options=None,
+             window_size=WINDOW_SIZE):
+    """Lex a generated module of ``size`` from a file with ``lex_file``."""
+    options = options or {}
+    fd, path = tempfile.mkstemp(suffix='.bsl')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as fh:
+            fh.write(corpus.generate(corpus.parse_size(size), profile))
+        nbytes = os.path.getsize(path)
+
+        def consume(batch):
+            pass
+
+        def lex():
+            return lex_file(path, consume, window_size=window_size, **options)
+
+        reset_compiled_tables()
+        started = time.perf_counter()
+        tokens = lex()
+        cold = time.perf_counter() - started
+
+        warm = None
+        for _ in range(max(repeat, 1)):
+            started = time.perf_counter()
+            lex()
+            elapsed = time.perf_counter() - started
+            warm = elapsed if warm is None else min(warm, elapsed)
+
+        tracemalloc.start()
+        try:
+            lex()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    finally:
+        os.unlink(path)
+
+    return {
+        f'BslLexer:{profile}:{size} lex_file': {
+            'bytes': nbytes,
+            'tokens': tokens,
+            'cold_ms': cold * 1000,
+            'warm_ms': warm * 1000,
+            'tokens_per_sec': tokens / warm if warm else 0.0,
+            'mb_per_sec': nbytes / 1e6 / warm if warm else 0.0,
+            'peak_mb': peak / 1e6,
+        },
+    }
+
+
+def select_cases(patterns=None, cases=CASES):
+    if not patterns:
+        return list(cases)
+    return [
+        (lexer_cls, path) for lexer_cls, path in cases
+        if any(pattern in case_name(lexer_cls, path) for pattern in patterns)
+    ]
+
+
+def run(cases, examples_dir=EXAMPLES_DIR, repeat=DEFAULT_REPEAT, options=None, normalized=False):
+    """Run ``cases``, through ``get_tokens_normalized`` with ``normalized``
+    (the case names then end in ``normalized``), with their ``speedup``
+    over the ``REFERENCE_ENGINE``."""
+    results = {}
+    suffix = ' normalized' if normalized else ''
+    for lexer_cls, path in cases:
+        # read_text() already turns \r\n into \n
+        text = (Path(examples_dir) / path).read_text(encoding='utf-8')
+        result = run_case(lexer_cls, text, repeat, options, normalized)
+        result['speedup'] = measure_speedup(lexer_cls, text, repeat, options, normalized)
+        results[case_name(lexer_cls, path) + suffix] = result
+    return results
+
+
+def compare(results, baseline, max_regression=DEFAULT_MAX_REGRESSION):
+    """Return ``(case, baseline, current)`` speedups for every case slower
+    than allowed; cases without a speedup are not compared."""
+    regressions = []
+    floor = 1.0 - max_regression / 100.0
+    for name, result in results.items():
+        expected = baseline.get(name, {}).get('speedup')
+        actual = result.get('speedup')
+        if expected and actual is not None and actual < expected * floor:
+            regressions.append((name, expected, actual))
+    return regressions
+
+
+def load_baseline(path):
+    data = json.loads(Path(path).read_text(encoding='utf-8'))
+    return data.get('cases', {})
+
+
+def save_baseline(path, results):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        'python': '.'.join(str(part) for part in sys.version_info[:3]),
+        'reference_engine': REFERENCE_ENGINE,
+        'cases': {
+            name: {'speedup': round(result['speedup'], 3)}
+            for name, result in sorted(results.items()) if 'speedup' in result
+        },
+    }
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+
+
+def format_results(results):
+    header = (
+        f'{"case":<40} {"KB":>8} {"tokens":>8} {"cold ms":>9} {"warm ms":>9}'
+        f' {"tokens/s":>10} {"MB/s":>6} {"peak MB":>8} {"speedup":>8}'
+    )
+    lines = [header, '-' * len(header)]
+    for name, result in results.items():
+        lines.append(
+            f'{name:<40} {result["bytes"] / 1024:>8.1f} {result["tokens"]:>8}'
+            f' {result["cold_ms"]:>9.1f} {result["warm_ms"]:>9.1f}'
+            f' {result["tokens_per_sec"]:>10.0f} {result["mb_per_sec"]:>6.2f}'
+            f' {result["peak_mb"]:>8.2f}'
+            + (f' {result["speedup"]:>7.2f}x' if 'speedup' in result else f' {"-":>8}')
+        )
+    return '\n'.join(lines)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m pygments_bsl.bench',
+        description='Benchmark the BSL/SDBL lexers on the example files.',
+    )
+    parser.add_argument('--case', action='append', metavar='PATTERN',
+                        help='run only cases whose name contains PATTERN (repeatable)')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='warm runs per case, the best one is reported (default: %(default)s)')
+    parser.add_argument('--examples', default=str(EXAMPLES_DIR),
+                        help='directory with bsl/ and sdbl/ example files')
+    parser.add_argument('--baseline', default=str(DEFAULT_BASELINE),
+                        help='baseline JSON file (default: %(default)s)')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='write the results to the baseline file instead of comparing')
+    parser.add_argument('--max-regression', type=float, default=DEFAULT_MAX_REGRESSION,
+                        help='allowed speedup loss in percent (default: %(default)s)')
+    parser.add_argument('--normalized', action='store_true',
+                        help='also lex every case with get_tokens_normalized (no input preprocessing)')
+    parser.add_argument('--scaling', action='append', choices=corpus.PROFILES, metavar='PROFILE',
+                        help='lex generated modules of PROFILE at every --sizes size (repeatable): '
+                             + ', '.join(corpus.PROFILES))
+    parser.add_argument('--sizes', default=','.join(DEFAULT_SCALING_SIZES),
+                        help='comma separated module sizes for --scaling (default: %(default)s)')
+    parser.add_argument('--snippets', type=int, metavar='COUNT',
+                        help='lex COUNT generated snippets with one lexer')
+    parser.add_argument('--snippet-profile', choices=corpus.PROFILES, default=corpus.DEFAULT_PROFILE,
+                        help='profile of the --snippets code (default: %(default)s)')
+    parser.add_argument('--lex-file', metavar='SIZE',
+                        help='lex a generated module of SIZE (e.g. 50MB) from a file with lex_file')
+    parser.add_argument('--window', default='1MB',
+                        help='window size of --lex-file (default: 1MB)')
+    parser.add_argument('--file-profile', choices=[profile for profile in corpus.PROFILES if profile != 'sdbl'],
+                        default=corpus.DEFAULT_PROFILE,
+                        help='profile of the --lex-file module (default: %(default)s)')
+    parser.add_argument('--json', action='store_true', help='print raw results as JSON')
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    generated = bool(args.scaling) or args.snippets is not None or args.lex_file is not None
+    cases = select_cases(args.case) if args.case or not generated else []
+    if not cases and not generated:
+        print('No benchmark cases selected.', file=sys.stderr)
+        return 2
+    sizes = [size.strip() for size in args.sizes.split(',') if size.strip()]
+    try:
+        for size in sizes:
+            corpus.parse_size(size)
+        if args.lex_file is not None:
+            corpus.parse_size(args.lex_file)
+        window_size = corpus.parse_size(args.window)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    results = run(cases, args.examples, args.repeat)
+    if args.normalized:
+        results.update(run(cases, args.examples, args.repeat, normalized=True))
+    for profile in args.scaling or ():
+        results.update(run_scaling(profile, sizes, args.repeat))
+    if args.snippets is not None:
+        results.update(run_snippets(args.snippets, args.snippet_profile, args.repeat))
+    if args.lex_file is not None:
+        results.update(run_file(args.lex_file, args.file_profile, args.repeat, window_size=window_size))
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+    else:
+        print(format_results(results))
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        save_baseline(baseline_path, results)
+        print(f'Baseline written to {baseline_path}')
+        return 0
+    if not baseline_path.exists():
+        return 0
+
+    regressions = compare(results, load_baseline(baseline_path), args.max_regression)
+    for name, expected, actual in regressions:
+        print(
+            f'REGRESSION {name}: {actual:.2f}x the {REFERENCE_ENGINE} engine, baseline {expected:.2f}x '
+            f'(-{(1 - actual / expected) * 100:.1f}%, allowed -{args.max_regression:g}%)',
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
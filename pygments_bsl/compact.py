@@ -0,0 +1,96 @@
+"""Token streams as flat arrays of offsets and type ids.
+
+``list(lexer.get_tokens(text))`` holds a tuple and a fresh substring for
+every token, which for a large module is many times the size of the text.
+``lexer.tokenize_compact(text)`` returns a ``CompactTokens`` buffer instead:
+the start and end offsets of the tokens in ``array('I')`` columns, a small
+integer type id per token and the table of the token types. Values are
+sliced from the text only when they are asked for::
+
+    tokens = BslLexer().tokenize_compact(text)
+    for index in range(len(tokens)):
+        if tokens.tokentype(index) in Comment:
+            print(tokens.starts[index], tokens.value(index))
+
+Like ``get_tokens_unprocessed`` the text is lexed as given, the offsets
+index ``tokens.text``.
+"""
+
+from array import array
+
+_OFFSET_TYPECODE = 'I' if array('I').itemsize >= 4 else 'L'
+# type ids are bytes until a stream has more distinct token types
+_BYTE_TYPES = 256
+
+
+class CompactTokens:
+    """Tokens of ``text`` as the columns ``starts``, ``ends`` and ``types``;
+    ``types`` holds indexes into the ``table`` of token types."""
+
+    __slots__ = ('text', 'starts', 'ends', 'types', 'table')
+
+    def __init__(self, text, starts, ends, types, table):
+        self.text = text
+        self.starts = starts
+        self.ends = ends
+        self.types = types
+        self.table = table
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, index):
+        """Return token ``index`` as ``(index in text, tokentype, value)``."""
+        start = self.starts[index]
+        return start, self.table[self.types[index]], self.text[start:self.ends[index]]
+
+    def __iter__(self):
+        return self.get_tokens_unprocessed()
+
+    def tokentype(self, index):
+        return self.table[self.types[index]]
+
+    def value(self, index):
+        return self.text[self.starts[index]:self.ends[index]]
+
+    def get_tokens_unprocessed(self):
+        """Yield ``(index, tokentype, value)`` like the lexer did."""
+        text = self.text
+        table = self.table
+        for start, end, type_id in zip(self.starts, self.ends, self.types):
+            yield start, table[type_id], text[start:end]
+
+    def get_tokens(self):
+        """Yield ``(tokentype, value)`` like the lexer did."""
+        text = self.text
+        table = self.table
+        for start, end, type_id in zip(self.starts, self.ends, self.types):
+            yield table[type_id], text[start:end]
+
+    @property
+    def nbytes(self):
+        """Size of the offset and type id columns in bytes."""
+        return sum(column.itemsize * len(column) for column in (self.starts, self.ends, self.types))
+
+
+def tokenize(lexer, text):
+    """Lex ``text`` with ``lexer`` into a ``CompactTokens`` buffer, the
+    values are never sliced out of it (see ``get_token_spans``)."""
+    ids = {}
+    starts = array(_OFFSET_TYPECODE)
+    ends = array(_OFFSET_TYPECODE)
+    types = array('B')
+    add_start = starts.append
+    add_end = ends.append
+    add_type = types.append
+    for start, end, token in lexer.get_token_spans(text):
+        type_id = ids.get(token)
+        if type_id is None:
+            type_id = ids[token] = len(ids)
+            if type_id == _BYTE_TYPES:
+                types = array('H', types)
+                add_type = types.append
+        add_start(start)
+        add_end(end)
+        add_type(type_id)
+    return CompactTokens(text, starts, ends, types, tuple(ids))
@@ -0,0 +1,290 @@
+"""Deterministic synthetic BSL/SDBL sources for scaling benchmarks.
+
+::
+
+    python tools/gen_corpus.py --size 10MB --profile query-heavy -o big-query.bsl
+    python tools/gen_corpus.py --snippets 50000 --output snippets/
+
+Modules are built from the constructs the lexers recognize: regions,
+compilation directives, procedures and functions with documentation
+comments and type lists, ``НСтр`` localized strings, ``Запрос.Текст`` query
+literals, conditions, loops and calls. The same size, profile and seed
+always produce the same text.
+
+``mixed``
+    ordinary application module code.
+``query-heavy``
+    most procedures build and run queries.
+``comment-heavy``
+    long documentation and line comments around little code.
+``sdbl``
+    standalone query text for ``SdblLexer``.
+"""
+
+import argparse
+import random
+import re
+import sys
+from pathlib import Path
+
+PROFILES = ('mixed', 'query-heavy', 'comment-heavy', 'sdbl')
+DEFAULT_PROFILE = 'mixed'
+DEFAULT_SEED = 1
+
+# statement kinds and their weights per BSL profile
+_STATEMENTS = {
+    'mixed': (('assignment', 6), ('condition', 3), ('loop', 2), ('call', 4), ('locale', 2),
+              ('query', 1), ('comment', 1), ('try', 1)),
+    'query-heavy': (('assignment', 2), ('condition', 1), ('loop', 1), ('call', 1), ('query', 6)),
+    'comment-heavy': (('assignment', 2), ('call', 1), ('locale', 1), ('comment', 8)),
+}
+_DOC_LINES = {'mixed': 1, 'query-heavy': 1, 'comment-heavy': 4}
+_SIZE_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+
+_NOUNS = (
+    'Документ', 'Контрагент', 'Номенклатура', 'Склад', 'Организация', 'Договор', 'Сумма',
+    'Количество', 'Цена', 'Период', 'Валюта', 'Партнер', 'Заказ', 'Строка', 'Результат',
+    'Данные', 'Параметры', 'Настройки', 'Таблица', 'Отбор',
+)
+_VERBS = ('Заполнить', 'Проверить', 'Получить', 'Рассчитать', 'Записать', 'Обновить', 'Сформировать')
+_TYPES = ('Строка', 'Число', 'Булево', 'Дата', 'Массив', 'Структура', 'Соответствие', 'ТаблицаЗначений')
+_ELEMENT_TYPES = ('Строка', 'Число', 'СправочникСсылка.Номенклатура', 'ДокументСсылка.ЗаказКлиента')
+_DIRECTIVES = ('&НаСервере', '&НаКлиенте', '&НаСервереБезКонтекста', '&НаКлиентеНаСервереБезКонтекста')
+_TABLES = (
+    'Справочник.Номенклатура', 'Справочник.Контрагенты', 'Документ.ЗаказКлиента',
+    'РегистрНакопления.ТоварыНаСкладах', 'РегистрСведений.ЦеныНоменклатуры',
+)
+_FIELDS = ('Ссылка', 'Наименование', 'Код', 'Количество', 'Сумма', 'Цена', 'Период', 'Организация')
+_WORDS = (
+    'значение', 'документа', 'для', 'текущего', 'пользователя', 'параметр', 'заполняется',
+    'при', 'записи', 'если', 'не', 'указан', 'возвращает', 'список', 'строк',
+)
+
+
+class _Writer:
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.lines = []
+        self.size = 0
+
+    def line(self, text='', indent=0):
+        text = '\t' * indent + text
+        self.lines.append(text)
+        self.size += len(text.encode('utf-8')) + 1
+
+    def name(self):
+        return self.rng.choice(_NOUNS) + self.rng.choice(_NOUNS)
+
+    def sentence(self, words=8):
+        text = ' '.join(self.rng.choice(_WORDS) for _ in range(words))
+        return text[0].upper() + text[1:] + '.'
+
+
+def parse_size(value):
+    """Parse ``10MB``, ``512KB`` or a plain byte count."""
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([KMG]?B?)\s*', str(value), re.IGNORECASE)
+    if match is None:
+        raise ValueError(f'invalid size: {value!r}')
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).upper().rstrip('B')])
+
+
+def _query(out, indent, rng):
+    table = rng.choice(_TABLES)
+    fields = rng.sample(_FIELDS, 3)
+    out.line('Запрос = Новый Запрос;', indent)
+    out.line('Запрос.Текст =', indent)
+    out.line('\t"ВЫБРАТЬ', indent)
+    for number, field in enumerate(fields):
+        comma = ',' if number < len(fields) - 1 else ''
+        out.line(f'\t|\tТаблица.{field} КАК {field}{comma}', indent)
+    out.line('\t|ИЗ', indent)
+    out.line(f'\t|\t{table} КАК Таблица', indent)
+    out.line('\t|ГДЕ', indent)
+    out.line(f'\t|\tТаблица.{fields[0]} = &{fields[0]}', indent)
+    out.line('\t|\tИ НЕ Таблица.ПометкаУдаления', indent)
+    out.line('\t|УПОРЯДОЧИТЬ ПО', indent)
+    out.line(f'\t|\t{fields[1]} УБЫВ";', indent)
+    out.line(f'Запрос.УстановитьПараметр("{fields[0]}", {out.name()});', indent)
+    out.line('Выборка = Запрос.Выполнить().Выбрать();', indent)
+    out.line('Пока Выборка.Следующий() Цикл', indent)
+    out.line(f'{out.name()} = Выборка.{fields[1]};', indent + 1)
+    out.line('КонецЦикла;', indent)
+
+
+def _statement(out, kind, indent, rng):
+    if kind == 'assignment':
+        out.line(f'{out.name()} = {out.name()}.{rng.choice(_NOUNS)} * {rng.randint(1, 999)} + 0.5;', indent)
+    elif kind == 'condition':
+        out.line(f'Если {out.name()} = Неопределено ИЛИ НЕ ЗначениеЗаполнено({out.name()}) Тогда', indent)
+        out.line(f'{out.name()} = Истина;', indent + 1)
+        out.line('Иначе', indent)
+        out.line(f'{out.name()} = "{rng.choice(_NOUNS)}";', indent + 1)
+        out.line('КонецЕсли;', indent)
+    elif kind == 'loop':
+        out.line(f'Для Каждого Элемент Из {out.name()} Цикл', indent)
+        out.line(f'Элемент.{rng.choice(_NOUNS)} = Элемент.{rng.choice(_NOUNS)} + 1;', indent + 1)
+        out.line('КонецЦикла;', indent)
+    elif kind == 'call':
+        out.line(f'{rng.choice(_VERBS)}{rng.choice(_NOUNS)}({out.name()}, Новый Массив, Ложь);', indent)
+    elif kind == 'locale':
+        noun = rng.choice(_NOUNS)
+        out.line('Сообщение = НСтр("ru = \'Не заполнено поле %1\'; en = \'Field %1 is empty\'");', indent)
+        out.line(f'ОбщегоНазначения.СообщитьПользователю(СтрШаблон(Сообщение, "{noun}"));', indent)
+    elif kind == 'query':
+        _query(out, indent, rng)
+    elif kind == 'comment':
+        out.line(f'// {out.sentence(rng.randint(4, 14))}', indent)
+    else:
+        out.line('Попытка', indent)
+        out.line(f'{rng.choice(_VERBS)}{rng.choice(_NOUNS)}();', indent + 1)
+        out.line('Исключение', indent)
+        out.line('ВызватьИсключение ПодробноеПредставлениеОшибки(ИнформацияОбОшибке());', indent + 1)
+        out.line('КонецПопытки;', indent)
+
+
+def _method(out, profile, rng):
+    kinds, weights = zip(*_STATEMENTS[profile])
+    function = rng.random() < 0.4
+    name = rng.choice(_VERBS) + rng.choice(_NOUNS)
+    params = [out.name() for _ in range(rng.randint(0, 3))]
+
+    out.line(f'// {out.sentence()}')
+    for _ in range(_DOC_LINES[profile] - 1):
+        out.line(f'// {out.sentence(12)}')
+    if params:
+        out.line('//')
+        out.line('// Параметры:')
+        for param in params:
+            if rng.random() < 0.5:
+                out.line(f'//   {param} - Массив из {rng.choice(_ELEMENT_TYPES)} - {out.sentence(4)}')
+            else:
+                out.line(f'//   {param} - {rng.choice(_TYPES)} - {out.sentence(4)}')
+    if function:
+        out.line('//')
+        out.line('// Возвращаемое значение:')
+        out.line(f'//   {rng.choice(_TYPES)} - {out.sentence(5)}')
+    out.line('//')
+    out.line(rng.choice(_DIRECTIVES))
+    keyword = 'Функция' if function else 'Процедура'
+    export = ' Экспорт' if rng.random() < 0.5 else ''
+    out.line(f'{keyword} {name}({", ".join(params)}){export}')
+    out.line()
+    for kind in rng.choices(kinds, weights, k=rng.randint(3, 8)):
+        _statement(out, kind, 1, rng)
+    if function:
+        out.line()
+        out.line(f'Возврат {out.name()};', 1)
+    out.line()
+    out.line('КонецФункции' if function else 'КонецПроцедуры')
+    out.line()
+
+
+def _sdbl_query(out, rng):
+    table = rng.choice(_TABLES)
+    fields = rng.sample(_FIELDS, 4)
+    out.line('ВЫБРАТЬ РАЗРЕШЕННЫЕ ПЕРВЫЕ 100')
+    for field in fields[:-1]:
+        out.line(f'\tТаблица.{field} КАК {field},')
+    out.line(f'\tЕСТЬNULL(Итоги.{fields[-1]}, 0) КАК {fields[-1]}')
+    out.line(f'ПОМЕСТИТЬ ВТ_{rng.choice(_NOUNS)}')
+    out.line('ИЗ')
+    out.line(f'\t{table} КАК Таблица')
+    out.line(f'\t\tЛЕВОЕ СОЕДИНЕНИЕ {rng.choice(_TABLES)} КАК Итоги')
+    out.line(f'\t\tПО Таблица.Ссылка = Итоги.{fields[0]}')
+    out.line('ГДЕ')
+    out.line(f'\tТаблица.{fields[1]} В (&{fields[1]})')
+    out.line(f'\tИ Таблица.Период МЕЖДУ &НачалоПериода И &КонецПериода // {out.sentence(3)}')
+    out.line(';')
+    out.line()
+
+
+def generate(size, profile=DEFAULT_PROFILE, seed=DEFAULT_SEED):
+    """Return a module of at least ``size`` UTF-8 bytes, ending after a whole construct."""
+    if profile not in PROFILES:
+        raise ValueError(f'unknown profile: {profile!r}')
+    rng = random.Random(f'{profile}:{seed}')
+    out = _Writer(rng)
+    if profile == 'sdbl':
+        while out.size < size:
+            _sdbl_query(out, rng)
+        return '\n'.join(out.lines) + '\n'
+
+    region = 0
+    while out.size < size:
+        region += 1
+        out.line(f'#Область {rng.choice(_NOUNS)}{region}')
+        out.line()
+        for _ in range(rng.randint(2, 6)):
+            _method(out, profile, rng)
+            if out.size >= size:
+                break
+        out.line('#КонецОбласти')
+        out.line()
+    return '\n'.join(out.lines) + '\n'
+
+
+def generate_snippets(count, profile=DEFAULT_PROFILE, seed=DEFAULT_SEED):
+    """Return ``count`` small snippets, one construct each."""
+    if profile not in PROFILES:
+        raise ValueError(f'unknown profile: {profile!r}')
+    rng = random.Random(f'snippets:{profile}:{seed}')
+    snippets = []
+    for _ in range(count):
+        out = _Writer(rng)
+        if profile == 'sdbl':
+            _sdbl_query(out, rng)
+        else:
+            kinds, weights = zip(*_STATEMENTS[profile])
+            _statement(out, rng.choices(kinds, weights)[0], 0, rng)
+        snippets.append('\n'.join(out.lines) + '\n')
+    return snippets
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='gen_corpus.py',
+        description='Generate deterministic synthetic BSL/SDBL sources.',
+    )
+    parser.add_argument('--size', default='1MB',
+                        help='module size, e.g. 10MB, 512KB (default: %(default)s)')
+    parser.add_argument('--profile', choices=PROFILES, default=DEFAULT_PROFILE,
+                        help='kind of code (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                        help='random seed (default: %(default)s)')
+    parser.add_argument('--snippets', type=int, metavar='COUNT',
+                        help='write COUNT snippet files into the --output directory instead of one module')
+    parser.add_argument('-o', '--output',
+                        help='output file, or directory for --snippets (default: stdout)')
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    suffix = '.sdbl' if args.profile == 'sdbl' else '.bsl'
+    if args.snippets is not None:
+        if not args.output:
+            parser.error('--snippets needs --output DIRECTORY')
+        directory = Path(args.output)
+        directory.mkdir(parents=True, exist_ok=True)
+        snippets = generate_snippets(args.snippets, args.profile, args.seed)
+        width = len(str(len(snippets)))
+        for number, snippet in enumerate(snippets):
+            (directory / f'snippet{number:0{width}d}{suffix}').write_text(snippet, encoding='utf-8')
+        return 0
+
+    try:
+        size = parse_size(args.size)
+    except ValueError as exc:
+        parser.error(str(exc))
+    text = generate(size, args.profile, args.seed)
+    if args.output:
+        Path(args.output).write_text(text, encoding='utf-8')
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
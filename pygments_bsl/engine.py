@@ -0,0 +1,578 @@
+"""Alternative state machine drivers for the BSL/SDBL regex lexers.
+
+Pygments' ``RegexLexer`` tries every rule of the current state one by one.
+The drivers here run the same processed token tables (``cls._tokens``) with
+a different rule selection strategy and produce exactly the same tokens:
+
+``regex``
+    the stock Pygments loop.
+``combined``
+    every state is compiled into one alternation with a named group per rule,
+    a single ``match()`` picks the winning rule.
+``dispatch`` (default)
+    the rules of a state are indexed by the characters they can start with,
+    only the candidates for the character at ``pos`` are tried.
+
+The engine is chosen per lexer instance with the ``engine`` option.
+"""
+
+import operator
+import re
+import time
+from functools import lru_cache
+from itertools import islice
+
+from pygments.filter import apply_filters
+from pygments.lexer import Future
+from pygments.token import Error, Text, Whitespace, _TokenType
+from pygments.util import get_bool_opt, get_choice_opt, get_int_opt
+
+from . import compact, tokencache
+from .literals import hold, holding_index, release
+from .precompiled import cached_first_chars, compile_pattern
+
+try:
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_constants
+    import sre_parse
+
+STOCK_ENGINE = 'regex'
+DEFAULT_ENGINE = 'dispatch'
+
+_TYPE_AND_VALUE = operator.itemgetter(1, 2)
+_SPAN_END = operator.itemgetter(1)
+# tokens pulled between two looks at the clock under a time budget
+BUDGET_BATCH = 64
+
+
+def apply_transition(statestack, new_state):
+    if isinstance(new_state, tuple):
+        for state in new_state:
+            if state == '#pop':
+                if len(statestack) > 1:
+                    statestack.pop()
+            elif state == '#push':
+                statestack.append(statestack[-1])
+            else:
+                statestack.append(state)
+    elif isinstance(new_state, int):
+        if abs(new_state) >= len(statestack):
+            del statestack[1:]
+        else:
+            del statestack[new_state:]
+    elif new_state == '#push':
+        statestack.append(statestack[-1])
+    else:
+        raise ValueError(f'wrong state def: {new_state!r}')
+
+
+class TokenAction:
+    """Rule action emitting the whole match as one token of ``token(lexer, match)``.
+
+    The engines yield the token without calling a generator; ``token`` may
+    only use ``group()``, ``start()``, ``end()`` and ``string`` of the match.
+    Called like any other Pygments callback it yields the same token.
+    """
+
+    def __init__(self, token):
+        self.token = token
+
+    def __call__(self, lexer, match):
+        yield match.start(), self.token(lexer, match), match.group()
+
+
+class SpanAction:
+    """Rule action yielding the tokens of a match as ``(start, end, tokentype)``.
+
+    ``spans(lexer, match)`` only reads offsets; the engines slice the values
+    out of the text for ``get_tokens_unprocessed`` and pass the spans on as
+    they are for ``get_token_spans``. Called like any other Pygments callback
+    it yields the same tokens.
+    """
+
+    def __init__(self, spans):
+        self.spans = spans
+
+    def __call__(self, lexer, match):
+        text = match.string
+        for start, end, token in self.spans(lexer, match):
+            yield start, token, text[start:end]
+
+
+def bygroups(*args):
+    """``pygments.lexer.bygroups`` for groups of token types, as a ``SpanAction``."""
+    def callback(lexer, match):
+        for index, token in enumerate(args, 1):
+            if token is not None:
+                start, end = match.span(index)
+                if start < end:
+                    yield start, end, token
+    return SpanAction(callback)
+
+
+def sequential_matcher(rules):
+    def match(text, pos):
+        for rule in rules:
+            m = rule[0](text, pos)
+            if m:
+                return m, rule
+        return None
+    return match
+
+
+def combined_matcher(rules):
+    patterns = [rexmatch.__self__ for rexmatch, _, _ in rules]
+    if len(rules) < 2 or len({pattern.flags for pattern in patterns}) != 1:
+        return sequential_matcher(rules)
+
+    flags = patterns[0].flags
+    # with VERBOSE a newline closes a possible comment at the end of a rule
+    tail = '\n' if flags & re.VERBOSE else ''
+    rex = compile_pattern(
+        '|'.join(f'(?P<r{idx}>{pattern.pattern}{tail})' for idx, pattern in enumerate(patterns)),
+        flags,
+    )
+    by_group = {rex.groupindex[f'r{idx}']: (idx, rule) for idx, rule in enumerate(rules)}
+    # rules whose matcher is not a plain pattern (string starts that look the
+    # quote up) only qualify through the master pattern, their own match decides
+    guarded = {
+        idx: sequential_matcher(rules[idx + 1:])
+        for idx, pattern in enumerate(patterns)
+        if not isinstance(pattern, re.Pattern)
+    }
+    master = rex.match
+
+    def match(text, pos):
+        m = master(text, pos)
+        if m is None:
+            return None
+        idx, rule = by_group[m.lastindex]
+        if idx in guarded:
+            m = rule[0](text, pos)
+            if m is None:
+                return guarded[idx](text, pos)
+            return m, rule
+        action = rule[1]
+        if action is not None and type(action) is not _TokenType and type(action) is not TokenAction:
+            # callbacks and bygroups address the groups of their own pattern
+            m = rule[0](text, pos)
+        return m, rule
+    return match
+
+
+_ANY_CHAR = r'[\s\S]'
+_CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: r'\d',
+    sre_constants.CATEGORY_NOT_DIGIT: r'\D',
+    sre_constants.CATEGORY_SPACE: r'\s',
+    sre_constants.CATEGORY_NOT_SPACE: r'\S',
+    sre_constants.CATEGORY_WORD: r'\w',
+    sre_constants.CATEGORY_NOT_WORD: r'\W',
+}
+_SCOPED_FLAGS = ((re.IGNORECASE, 'i'), (re.DOTALL, 's'))
+_ZERO_WIDTH = (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT)
+_REPEATS = tuple(
+    getattr(sre_constants, name)
+    for name in ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT')
+    if hasattr(sre_constants, name)
+)
+
+
+def _char(code):
+    return f'\\U{code:08x}'
+
+
+def _class_item(op, av):
+    if op is sre_constants.LITERAL:
+        return _char(av)
+    if op is sre_constants.RANGE:
+        return f'{_char(av[0])}-{_char(av[1])}'
+    return _CATEGORIES[av]
+
+
+def _first_chars(subpattern):
+    """Return ``(alternatives, nullable)`` for a parsed (sub)pattern.
+
+    ``alternatives`` are regexes matching one character the subpattern can
+    start with, ``nullable`` tells whether it can match an empty string.
+    Anything not understood is treated as "any character, maybe empty".
+    """
+    alternatives = []
+    for op, av in subpattern:
+        nullable = False
+        if op in _ZERO_WIDTH:
+            continue
+        if op is sre_constants.LITERAL:
+            alternatives.append(_char(av))
+        elif op is sre_constants.NOT_LITERAL:
+            alternatives.append(f'[^{_char(av)}]')
+        elif op is sre_constants.ANY:
+            alternatives.append('.')
+        elif op is sre_constants.IN:
+            negate = bool(av) and av[0][0] is sre_constants.NEGATE
+            items = ''.join(_class_item(item_op, item_av) for item_op, item_av in av[negate:])
+            alternatives.append(f'[^{items}]' if negate else f'[{items}]')
+        elif op is sre_constants.BRANCH:
+            for branch in av[1]:
+                branch_alternatives, branch_nullable = _first_chars(branch)
+                alternatives.extend(branch_alternatives)
+                nullable = nullable or branch_nullable
+        elif op is sre_constants.SUBPATTERN:
+            _, add_flags, del_flags, inner = av
+            inner_alternatives, nullable = _first_chars(inner)
+            scope = ''.join(letter for flag, letter in _SCOPED_FLAGS if add_flags & flag)
+            unscope = ''.join(letter for flag, letter in _SCOPED_FLAGS if del_flags & flag)
+            if scope or unscope:
+                flags = scope + (f'-{unscope}' if unscope else '')
+                inner_alternatives = [f'(?{flags}:{alt})' for alt in inner_alternatives]
+            alternatives.extend(inner_alternatives)
+        elif op in _REPEATS:
+            inner_alternatives, nullable = _first_chars(av[2])
+            alternatives.extend(inner_alternatives)
+            nullable = nullable or av[0] == 0
+        else:
+            return [_ANY_CHAR], True
+        if not nullable:
+            return alternatives, False
+    return alternatives, True
+
+
+def _analyse_parsed(parsed):
+    """Return ``(regex, nullable)`` for a parse tree, ``regex`` is ``None``
+    when unknown."""
+    try:
+        alternatives, nullable = _first_chars(parsed)
+    except KeyError:
+        return None, True
+    return '|'.join(dict.fromkeys(alternatives)), nullable
+
+
+def _analyse_first_chars(pattern, flags):
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except re.error:
+        return None, True
+    return _analyse_parsed(parsed)
+
+
+@lru_cache(maxsize=1024)
+def first_char_test(pattern, flags):
+    """Return ``(test(char), nullable)`` for a rule pattern."""
+    regex, nullable = cached_first_chars(pattern, flags, _analyse_first_chars)
+    if regex is None:
+        return (lambda char: True), True
+    if not regex:
+        return (lambda char: False), nullable
+    return compile_pattern(regex, flags & ~re.VERBOSE).match, nullable
+
+
+def dispatch_matcher(rules):
+    analysed = [
+        (rule, *first_char_test(rule[0].__self__.pattern, rule[0].__self__.flags))
+        for rule in rules
+    ]
+    # the empty key is the end of the text, only empty matches are possible there
+    table = {'': tuple(rule for rule, _, nullable in analysed if nullable)}
+
+    def candidates(char):
+        found = tuple(rule for rule, test, nullable in analysed if nullable or test(char))
+        table[char] = found
+        return found
+
+    def match(text, pos):
+        char = text[pos:pos + 1]
+        rules_at = table.get(char)
+        if rules_at is None:
+            rules_at = candidates(char)
+        for rule in rules_at:
+            m = rule[0](text, pos)
+            if m:
+                return m, rule
+        return None
+    return match
+
+
+ENGINES = {
+    'combined': combined_matcher,
+    'dispatch': dispatch_matcher,
+}
+
+
+def state_matchers(cls, engine):
+    """Return ``{state: match(text, pos)}`` for ``engine``, built once per class."""
+    tokendefs = cls._tokens
+    cached = cls.__dict__.get('_engine_matchers')
+    if cached is None or cached[0] is not tokendefs:
+        cached = (tokendefs, {})
+        cls._engine_matchers = cached
+    matchers = cached[1].get(engine)
+    if matchers is None:
+        factory = ENGINES[engine]
+        matchers = {state: factory(rules) for state, rules in tokendefs.items()}
+        cached[1][engine] = matchers
+    return matchers
+
+
+def lexer_matchers(lexer):
+    """Return the state matchers for ``lexer``, the stock engine gets ``dispatch``."""
+    engine = lexer.engine if lexer.engine in ENGINES else DEFAULT_ENGINE
+    return state_matchers(type(lexer), engine)
+
+
+def iter_tokens(lexer, text, matchers, stack=('root',), pos=0, checkpoints=None):
+    """Run the state machine over ``text`` starting at ``pos`` with ``stack``.
+
+    When ``checkpoints`` is a list, ``(pos, stack)`` is appended to it the first
+    time the loop stands at the start of a line between two matches, before the
+    tokens from that position are yielded. The string literal index of
+    ``text`` is held until the iterator is exhausted or closed.
+    """
+    statestack = list(stack)
+    match = matchers[statestack[-1]]
+    checkpoint = -1
+    hold(text)
+    try:
+        while 1:
+            if checkpoints is not None and pos > checkpoint and (pos == 0 or text[pos - 1] == '\n'):
+                checkpoint = pos
+                checkpoints.append((pos, tuple(statestack)))
+            found = match(text, pos)
+            if found:
+                m, (_, action, new_state) = found
+                if action is not None:
+                    if type(action) is _TokenType:
+                        yield pos, action, m.group()
+                    elif type(action) is TokenAction:
+                        yield pos, action.token(lexer, m), m.group()
+                    elif type(action) is SpanAction:
+                        for start, end, token in action.spans(lexer, m):
+                            yield start, token, text[start:end]
+                    else:
+                        yield from action(lexer, m)
+                pos = m.end()
+                if new_state is not None:
+                    apply_transition(statestack, new_state)
+                    match = matchers[statestack[-1]]
+            else:
+                # no rule matched: same recovery as RegexLexer
+                try:
+                    if text[pos] == '\n':
+                        statestack = ['root']
+                        match = matchers['root']
+                        yield pos, Whitespace, '\n'
+                        pos += 1
+                        continue
+                    yield pos, Error, text[pos]
+                    pos += 1
+                except IndexError:
+                    break
+    finally:
+        release(text)
+
+
+def iter_spans(lexer, text, matchers, stack=('root',), pos=0):
+    """Run the state machine like ``iter_tokens``, yielding ``(start, end,
+    tokentype)`` instead of the token values."""
+    statestack = list(stack)
+    match = matchers[statestack[-1]]
+    hold(text)
+    try:
+        while 1:
+            found = match(text, pos)
+            if found:
+                m, (_, action, new_state) = found
+                end = m.end()
+                if action is not None:
+                    if type(action) is _TokenType:
+                        yield pos, end, action
+                    elif type(action) is TokenAction:
+                        yield pos, end, action.token(lexer, m)
+                    elif type(action) is SpanAction:
+                        yield from action.spans(lexer, m)
+                    else:
+                        for start, token, value in action(lexer, m):
+                            yield start, start + len(value), token
+                pos = end
+                if new_state is not None:
+                    apply_transition(statestack, new_state)
+                    match = matchers[statestack[-1]]
+            elif pos < len(text):
+                if text.startswith('\n', pos):
+                    statestack = ['root']
+                    match = matchers['root']
+                    yield pos, pos + 1, Whitespace
+                else:
+                    yield pos, pos + 1, Error
+                pos += 1
+            else:
+                break
+    finally:
+        release(text)
+
+
+def within_budget(items, seconds, end, rest):
+    """Yield from ``items`` until producing them took more than ``seconds``.
+
+    The clock runs only while the items are produced, not while the caller
+    handles them. When the budget is spent, ``rest(pos)`` is yielded for the
+    position ``end(item)`` after the last item, unless it is ``None``, and
+    the stream stops there.
+    """
+    items = iter(items)
+    spent = 0.0
+    while 1:
+        started = time.perf_counter()
+        batch = list(islice(items, BUDGET_BATCH))
+        spent += time.perf_counter() - started
+        if not batch:
+            return
+        yield from batch
+        if spent > seconds:
+            last = rest(end(batch[-1]))
+            if last is not None:
+                yield last
+            return
+
+
+def _token_end(token):
+    return token[0] + len(token[2])
+
+
+class EngineMixin:
+    """Adds the ``engine``, ``token_cache``, ``profile`` and ``time_budget_ms``
+    options, ``get_tokens_normalized``, ``get_token_spans`` and
+    ``tokenize_compact`` to a ``RegexLexer`` subclass."""
+
+    def __init__(self, **options):
+        super().__init__(**options)
+        self.engine = get_choice_opt(
+            options, 'engine', [STOCK_ENGINE, *ENGINES], DEFAULT_ENGINE,
+        )
+        self.token_cache = get_bool_opt(options, 'token_cache', tokencache.enabled_by_default())
+        self.time_budget_ms = get_int_opt(options, 'time_budget_ms', 0)
+        self.on_budget_exceeded = options.get('on_budget_exceeded')
+        # texts cut short by the time budget
+        self.budget_exceeded = 0
+        self.profile = None
+        if options.get('profile'):
+            from .profile import RuleProfile
+
+            profile = options['profile']
+            if not isinstance(profile, RuleProfile):
+                profile = RuleProfile() if get_bool_opt(options, 'profile', False) else None
+            # embedded lexers get these options and add to the same profile
+            self.options['profile'] = self.profile = profile
+
+    @classmethod
+    def _process_regex(cls, regex, rflags, state):
+        if isinstance(regex, Future):
+            regex = regex.get()
+        # the dispatch engine analyses the rule from the same parse tree
+        return compile_pattern(regex, rflags, _analyse_parsed).match
+
+    def get_tokens_unprocessed(self, text, stack=('root',)):
+        """Yield ``(index, tokentype, value)`` for ``text``.
+
+        With the ``time_budget_ms`` option lexing stops once it took that
+        long and the rest of the text comes as one ``Text`` token.
+        """
+        lexer = self._lexer_for(text)
+        if self.profile is not None:
+            return self._tokens_within_budget(text, iter_tokens(lexer, text, self.profile.matchers(lexer), stack))
+        if self._caches(text, stack):
+            return tokencache.cached_tokens(
+                self, text, lambda text: self._tokens_within_budget(text, lexer._lex(text)),
+            )
+        return self._tokens_within_budget(text, lexer._lex(text, stack))
+
+    def get_tokens(self, text, unfiltered=False):
+        """Pygments' ``get_tokens``; with the ``token_cache`` option a cache
+        hit yields the stored ``(tokentype, value)`` pairs as they are."""
+        preprocess = getattr(self, '_preprocess_lexer_input', None)
+        if not self.token_cache or preprocess is None:
+            # older Pygments preprocess the text inside get_tokens
+            return super().get_tokens(text, unfiltered)
+        stream = self._token_pairs(preprocess(text))
+        if not unfiltered:
+            stream = apply_filters(stream, self.filters, self)
+        return stream
+
+    def get_tokens_normalized(self, text, unfiltered=False):
+        """``get_tokens`` for a ``str`` that needs no preprocessing.
+
+        Pygments' ``get_tokens`` removes a BOM, rewrites ``\\r\\n`` line ends
+        and applies ``stripnl``, ``stripall``, ``tabsize`` and ``ensurenl``,
+        copying the whole text on the way. Here ``text`` is lexed as it is:
+        the ``root`` rules read a BOM and ``\\r\\n`` themselves, leading blank
+        lines and a missing last newline are kept as they are.
+        """
+        stream = self._token_pairs(text)
+        if not unfiltered:
+            stream = apply_filters(stream, self.filters, self)
+        return stream
+
+    def get_token_spans(self, text, stack=('root',)):
+        """Yield ``(start, end, tokentype)`` for the tokens of ``text``
+        without slicing their values out of it.
+
+        The spans are those of ``get_tokens_unprocessed(text)``; the ``regex``
+        engine runs the ``dispatch`` driver for them.
+        """
+        lexer = self._lexer_for(text)
+        if self.profile is not None:
+            spans = iter_spans(lexer, text, self.profile.matchers(lexer), stack)
+        else:
+            spans = iter_spans(lexer, text, lexer_matchers(lexer), stack)
+        return self._within_budget(text, spans, _SPAN_END, lambda pos: (pos, len(text), Text))
+
+    def tokenize_compact(self, text):
+        """Lex ``text`` into a ``compact.CompactTokens`` buffer of token
+        offsets and type ids."""
+        return compact.tokenize(self, text)
+
+    def _lexer_for(self, text):
+        """Return the lexer whose tables lex ``text``."""
+        return self
+
+    def _caches(self, text, stack=('root',)):
+        """Whether the tokens of ``text`` go through the token stream cache."""
+        return (
+            self.token_cache and self.profile is None and stack == ('root',)
+            and len(text) >= tokencache.MIN_TEXT_SIZE
+        )
+
+    def _token_pairs(self, text):
+        if self._caches(text):
+            lexer = self._lexer_for(text)
+            return tokencache.cached_tokens(
+                self, text, lambda text: self._tokens_within_budget(text, lexer._lex(text)), pairs=True,
+            )
+        return map(_TYPE_AND_VALUE, self.get_tokens_unprocessed(text))
+
+    def _within_budget(self, text, items, end, rest):
+        """``items`` of ``text`` cut short by the ``time_budget_ms`` option.
+
+        A cut counts in ``budget_exceeded`` and calls the
+        ``on_budget_exceeded(lexer, pos)`` option with the position of the
+        first character that was not lexed.
+        """
+        if self.time_budget_ms <= 0:
+            return items
+
+        def cut(pos):
+            if pos >= len(text):
+                return None
+            self.budget_exceeded += 1
+            if self.on_budget_exceeded is not None:
+                self.on_budget_exceeded(self, pos)
+            return rest(pos)
+        return within_budget(items, self.time_budget_ms / 1000, end, cut)
+
+    def _tokens_within_budget(self, text, tokens):
+        return self._within_budget(text, tokens, _token_end, lambda pos: (pos, Text, text[pos:]))
+
+    def _lex(self, text, stack=('root',)):
+        if self.engine == STOCK_ENGINE:
+            return holding_index(text, super().get_tokens_unprocessed(text, stack))
+        return iter_tokens(self, text, state_matchers(type(self), self.engine), stack)
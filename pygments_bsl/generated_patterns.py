@@ -0,0 +1,26 @@
+# Auto-generated by tools/generate_data.py. Do not edit by hand.
+# Source data: TYPE_NAMES of generated_data.py
+
+__all__ = ['DOC_TYPE_EXTRA_NAMES', 'TYPE_NAME_PATTERN', 'DOC_TYPE_PATTERN']
+
+DOC_TYPE_EXTRA_NAMES = (
+    'Булево',
+    'Число',
+    'Строка',
+    'Дата',
+    'Массив',
+    'ТаблицаЗначений',
+    'Структура',
+    'Соответствие',
+    'ПланОбменаСсылка',
+    'ДанныеФормыСтруктура',
+    'КомпоновщикНастроекКомпоновкиДанных',
+    'Boolean',
+    'Number',
+    'String',
+    'Date',
+)
+
+TYPE_NAME_PATTERN = '(?:(?:com(?:safearray|объект)|ftp(?:соединение|файл)|http(?:запрос|ответ|с(?:ервис(?:запрос|ответ)|оединение))|mmsвложение|smsсообщение|uriзаписьndef|w(?:ebsocketклиент(?:соединение)?|s(?:возвращаемоезначение|интерфейс|коллекция(?:операций|параметров|сервисов|точекподключения)|оп(?:ерация|ределения)|п(?:араметр|рокси)|с(?:ервис|сылкименеджер)|точкаподключения))|xbase|а(?:вто(?:выбранноеполекомпоновкиданных|полегруппировкикомпоновкиданных|элементпорядкакомпоновкиданных)|грегат(?:регистранакопления|ырегистранакопления)|дминистр(?:атор|ирование(?:администратор|блокировка|диапазонпортов|значениесчетчикапотребленияресурсов|информационнаябаза|кластер|лицензия|менеджеркластера|ограничениепотребленияресурсов|профильбезопасности|рабочий(?:процесс|сервер)|с(?:е(?:анс|рв(?:ера|ис))|оединение|четчикпотребленияресурсов)|требованиеназначения|хранилищедвоичныхданных))|лгоритмподписитокенадоступа|н(?:ализданных(?:дереворешений|кластеризация|общаястатистика|поиск(?:ассоциаций|последовательностей))?|нотацияxs)|ссоциированнаягруппа|трибут(?:dom|html))|б(?:и(?:блиотека(?:макетовоформлениякомпоновкиданных|стилей)|знеспроцессыменеджер)|локировка(?:аутентификациипользователяинформационнойбазы|данных|сеансов)?|отсистемывзаимодействия|уфердвоичныхданных)|в(?:ариант(?:xdto|использовани(?:ибазыданныхкопии|ярасположенияработысречью)|настроеккомпоновкиданных|пользовательскогополявыборкомпоновкиданных|точкимаршрутабизнеспроцесса|храненияданныхдатаакселератора|ы(?:настроеккомпоновкиданных|пользовательскогополявыборкомпоновкиданных|точкимаршрутабизнеспроцесса|элементаграфическойсхемывыборварианта)|элементаграфическойсхемывыборварианта)|ключениеxs|ложен(?:ие(?:pdf|системывзаимодействия)|н(?:ая(?:схемакомпоновкиданных|таблицасхемызапроса)|ы(?:е(?:наборыданныхмакетакомпоновкиданных|схемыкомпоновкиданных)|й(?:запроссхемызапроса|наборданных(?:макетакомпоновкиданных|схемыкомпоновкиданных)|объектмакетакомпоновкиданных))))|нешн(?:и(?:е(?:источникиданныхменеджер|о(?:бработкименеджер|тчетыменеджер))|йо(?:бъект|тчет))|яяобработка)|ременн(?:аятаблицазапроса|ыетаблицызапроса)|с(?:еэлементыформы|троеннаяпокупка)|ы(?:б(?:ор(?:ка(?:данных|изрезультатазапроса)|настроек)|ранн(?:оеполекомпоновкиданных|ыеполякомпоновкиданных))|грузкаданныхсистемывзаимодействия|деленные(?:областитабличногодокумента|строкитабличногополя)|ражени(?:е(?:xpath|и(?:ндексасхемызапроса|тогасхемызапроса)|компоновкиданных|отборакомпоновкиданныхсхемызапроса|по(?:ляпараметраобластирасшифровкакомпоновкиданных|рядкасхемызапроса)|схемызапроса|упорядочиваниякомпоновкиданных)|я(?:и(?:ндексасхемызапроса|тоговсхемызапроса)|отборакомпоновкиданныхсхемызапроса|по(?:лейпараметраобластирасшифровкакомпоновкиданных|рядкасхемызапроса)|схемызапроса|упорядочиваниякомпоновкиданных))|числяем(?:оеполесхемыкомпоновкиданных|ыеполясхемыкомпоновкиданных)))|г(?:е(?:нератор(?:макетакомпоновкиданных(?:дляколлекциизначений)?|случайных(?:паролей|чисел))|о(?:графическ(?:аясхема|иекоординаты)|зона))|р(?:а(?:ница|фическаясхема)|упп(?:а(?:выбранныхполейкомпоновкиданных|доступныхтаблицсхемызапроса|команд|моделиxs|настройкисоставаинтерфейсаклиентскогоприложения|результатапоискапорегулярномувыражению|формы|элементовотборакомпоновкиданных)|ировк(?:а(?:диаграммы(?:компоновкиданных|макетакомпоновкиданных)|компоновкиданных|макетакомпоновкиданных|таблицы(?:компоновкиданных|макетакомпоновкиданных))|и(?:диаграммымакетакомпоновкиданных|макетакомпоновкиданных)))))|д(?:анные(?:адреса|групповойобработкикомпоновкиданных|з(?:апросаподелиться|начениядиаграммыганта)|информационнойбазыработысречью|к(?:алендаря(?:учетнойзаписи)?|витанциивстроеннойпокупки|онтакта(?:учетнойзаписи)?)|м(?:естоположения|ультимедиа)|переходапонавигационнойссылке|р(?:асшифровкикомпоновкиданных|егистрацииинформационнойбазысистемывзаимодействия)|событиякалендаря(?:учетнойзаписи)?|ф(?:ормы(?:дерево|коллекция(?:элементовдерева)?|структура(?:сколлекцией)?|элемент(?:дерева|коллекции))|разыраспознаванияречи))|воичныеданные|е(?:йствие(?:принесоответствиипаролятребованиямприаутентификации|сообщениясистемывзаимодействия|элемента(?:планировщика|результатаглобальногопоиска))?|корацияформы|ндрограмма|ревозначений)|и(?:а(?:грамма(?:ганта|компоновкиданных|макетакомпоновкиданных)?|лог(?:выбора(?:пользователейисторииданных|типадиаграммы|файла|цвета|шрифта)|отбораверсийисторииданных|р(?:асписания(?:регламентногозадания|элементапланировщика)|едактированиястандартногопериода))|пазон)|намическийсписок)|о(?:кумент(?:dom|html|pdf|ацияxs|ыменеджер)|п(?:олн(?:ение(?:периодамакетакомпоновкиданных|элементаформы)|ительны(?:е(?:данныезапускаприложениямобильногоустройства|индексы)|йиндекс))|устимаястранаполучениялицензий)|ст(?:авляемоеуведомление|уп(?:косновномусерверу|н(?:ая(?:вложеннаятаблицасхемызапроса|таблицасхемызапроса)|о(?:еполе(?:компоновкиданных|отборакомпоновкиданных|схемызапроса)|сть(?:получениялицензий|централицензированияполучениялицензий))|ы(?:е(?:объектынастройкикомпоновкиданных|п(?:араметрыкомпоновкиданных|оля(?:компоновкиданных|схемызапроса))|таблицысхемызапроса)|й(?:объектнастройкикомпоновкиданных|параметркомпоновкиданных)))))))|журнал(?:sms|звонков|ыдокументовменеджер)|з(?:а(?:дачименеджер|кладкаформатированногодокумента|п(?:ис(?:и(?:макетакомпоновкиданных|таблицымакетакомпоновкиданных)|ь(?:dom|fastinfoset|html|json|ndefвнешнеготипа|pdf|xml|zipфайла|данных|журнала(?:sms|звонков)|сообщенияобмена|текста|узловdom|файлаархива))|рос(?:выборасхемызапроса|наполучениелицензии|уничтожениятаблицысхемызапроса)?|ускприложениямобильногоустройства)|щищенноесоединение(?:nss|openssl|криптопро))|начени(?:е(?:xdto|диаграммы(?:ганта)?|п(?:араметра(?:компоновкиданных|макетакомпоновкиданных|настроеккомпоновкиданных)|оля(?:анализаданных|расшифровкикомпоновкиданных))|сериислоягеографическойсхемы)|яп(?:араметров(?:вывода(?:группировки(?:диаграммыкомпоновкиданных|компоновкиданных|таблицыкомпоновкиданных)|диаграммыкомпоновкиданных|компоновкиданных|таблицыкомпоновкиданных)|данныхкомпоновкиданных|макетакомпоновкиданных)|олейрасшифровкикомпоновкиданных)))|и(?:дентификатор(?:выгрузкиданныхсистемывзаимодействия|значениядиаграммыганта|инте(?:грациисистемывзаимодействия|рваладиаграммыганта)|компоновкиданных|моделираспознаванияречи|о(?:бсуждениясистемывзаимодействия|тложенногораспознаванияречи)|п(?:о(?:дписчикадоставляемыхуведомлений|льзователясистемывзаимодействия)|риложениясистемывзаимодействия)|расшифровкикомпоновкиданных|сообщениясистемывзаимодействия|шаблонасообщениясистемывзаимодействия)|ерархическ(?:аягруппировка(?:диаграммымакетакомпоновкиданных|макетакомпоновкиданных|таблицымакетакомпоновкиданных)|иезаписи(?:макетакомпоновкиданных|таблицымакетакомпоновкиданных))|з(?:бранноеработыпользователя|влечениетекста|мерени(?:еп(?:ланировщика|остроителя(?:запроса|отчета))|япостроителя(?:запроса|отчета)))|мпортxs|н(?:д(?:екс(?:xbase|коллекции|схемызапроса|ы(?:коллекции|схемызапроса))|икатор)|струкцияобработкиdom|те(?:грациясистемывзаимодействия|р(?:вал(?:диаграммыганта|фона(?:диаграммыганта|планировщика)|ыфонадиаграммыганта)|нет(?:п(?:очт(?:а|ов(?:ое(?:вложение|сообщение)|ы(?:е(?:адреса|вложения)|й(?:адрес|профиль))))|рокси)|соединение|текст(?:почтовогосообщения|ыпочтовогосообщения))))|формаци(?:онн(?:аялиниядиаграммы|ы(?:е(?:интервалыдиаграммы|линиидиаграммы)|йинтервалдиаграммы))|я(?:д(?:искретногополяанализаданных|ляприложенияxs)|модулякриптографии|непрерывногополяанализаданных|о(?:б(?:агрегат(?:ах|е)|и(?:нтернетсоединении|спользованиибазыданныхкопии)|ошибке)|записиверсииисторииданных|копиибазыданных|проблеме(?:отправкидоставляемогоуведомления|применениярасширенияконфигурации)|сетевомадаптере)|провайдерагеопозиционирования|хранилищадвоичныхданных|экранаклиента)))|с(?:польз(?:ование(?:атрибутаxs|событияжурналарегистрации|хранениявхранилищедвоичныхданных)|уем(?:аякопиябазыданных|ыекопиибазыданных))|то(?:рия(?:глобальногопоиска|поискатаблицы)|чник(?:д(?:анных(?:макетакомпоновкиданных|с(?:воднойтаблицыкомпоновкиданных|хемыкомпоновкиданных))|оступныхнастроеккомпоновкиданных)|и(?:данных(?:макетакомпоновкиданных|схемыкомпоновкиданных)|схемызапроса)|схемызапроса)))|тераторузловdom)|к(?:а(?:ноническ(?:аязаписьxml|ийdom)|ртинка(?:форматированногодокумента)?|талогданныхсервисадляпереноса)|в(?:алификаторы(?:д(?:аты|воичныхданных)|строки|числа)|итанциявстроеннойпокупки)|л(?:ас(?:сификацияобъектаанализаданных|теранализаданных)|иентскоеприложение|юч(?:xbase|изначение|строкидинамическогосписка))|нопк(?:а(?:команднойпанели|панеликнопоксообщениясистемывзаимодействия|формы)?|икоманднойпанели)|о(?:л(?:лекция(?:атрибутов(?:dom|html)|в(?:ариантовпользовательскогополявыборкомпоновкиданных|ложений(?:pdf|системывзаимодействия)|строенныхтаблиц|ы(?:бранныхполейкомпоновкиданных|деленныхдат))|д(?:вижений|ействий(?:сообщениясистемывзаимодействия|элемента(?:планировщика|результатаглобальногопоиска))|оступных(?:объектовнастройкикомпоновкиданных|п(?:араметровкомпоновкиданных|олейкомпоновкиданных)))|з(?:амещающихэлементовпланировщика|начений(?:xdto|параметровкомпоновкиданных|свойстваобъектаметаданных))|и(?:дентификаторовп(?:ользователейсистемывзаимодействия|риложенийсистемывзаимодействия)|змеренийпланировщика|менованныхкомпонентxs|н(?:дексовxbase|терваловфонапланировщика|формацииозаписиверсииисторииданных))|колонок(?:деревазначений|результатазапроса|таблицызначений)|метокинтервалафонапланировщика|нотацийdom|о(?:б(?:ластейтабличногодокумента|ъектовметаданных)|формл(?:енийдат|яемыхполейкомпоновкиданных))|п(?:акетовxdto|ол(?:ей(?:xbase|группировкикомпоновкиданных|сводной(?:диаграммы|таблицы))|ьзовательскихполейкомпоновкиданных))|рисунковтабличногодокумента|с(?:войствxdto|тр(?:аницpdf|окдеревазначений)|ущностейdom)|т(?:екущихпериодовотображенияпланировщика|иповзначенийxdto)|фасетовxdto|элементов(?:html|измеренияпланировщика|отборакомпоновкиданных|п(?:ланировщика|о(?:льзовательскихнастроеккомпоновкиданных|рядкакомпоновкиданных))|структуры(?:диаграммыкомпоновкиданных|настроеккомпоновкиданных|таблицыкомпоновкиданных)|у(?:правленияинтерфейсами|словногооформлениякомпоновкиданных)|форматированногодокумента))|он(?:к(?:а(?:анализаданных|в(?:ложеннаятаблицасхемызапроса|ременнойтаблицызапроса)|д(?:анныхдиаграммыганта|еревазначений)|моделипрогноза|описанияисточникаданных|результата(?:запроса|моделипрогноза)|с(?:писка|хемызапроса)|табли(?:цызначений|чногополя))|и(?:анализаданных|временнойтаблицызапроса|данныхдиаграммыганта|моделипрогноза|описанияисточникаданных|результатамоделипрогноза|с(?:писка|хемызапроса)|табличногополя))|титултабличногодокумента))|м(?:анд(?:а(?:командногоинтерфейса|формы)|наяпанель|ыформы)|ментарий(?:dom|html)|поновщик(?:макетакомпоновкиданных|настроеккомпоновкиданных))|н(?:ст(?:анты(?:менеджер|набор)|руктор(?:запроса|макетаоформлениякомпоновкиданных|настроеккомпоновкиданных|схемыкомпоновкиданных|форматнойстроки))|т(?:е(?:йнер(?:ключейкриптографии|подписейкриптографии)|кст(?:обсуждениясистемывзаимодействия|пространствименxml))|рольн(?:аяточкаитоговсхемызапроса|ыеточкиитоговсхемызапроса)|ур(?:полигональногообъектагеографическойсхемы|ыполигональногообъектагеографическойсхемы))|фигурация(?:документаdom|записиdom|построителяdom)))|ритерииотбораменеджер)|л(?:и(?:ни(?:итрендадиаграммы|я(?:трендадиаграммы)?)|цензия)|окальныйключ(?:к(?:алендаря|онтакта)|событиякалендаря))|м(?:а(?:кет(?:группировки(?:диаграммы(?:макетакомпоновкиданных|областикомпоновкиданных)|схемыкомпоновкиданных|таблицымакетакомпоновкиданных)|д(?:иаграммыобластикомпоновкиданных|окументаобластикомпоновкиданных)|заголовкаколлекциизначенийобластикомпоновкиданных|ко(?:ллекциизначенийобластикомпоновкиданных|мпоновкиданных)|о(?:бласти(?:компоновкиданных|макетакомпоновкиданных)|формлениякомпоновкиданных)|пол(?:ейитогасхемыкомпоновкиданных|ясхемыкомпоновкиданных)|ресурсадиаграммыобластикомпоновкиданных|тела(?:диаграммымакетакомпоновкиданных|таблицымакетакомпоновкиданных)|ы(?:группировоксхемыкомпоновкиданных|полей(?:итогасхемыкомпоновкиданных|схемыкомпоновкиданных)|тела(?:диаграммымакетакомпоновкиданных|таблицымакетакомпоновкиданных)))|с(?:каxs|сив))|е(?:диазаписьndef|неджер(?:websocketклиент(?:ов|соединений)|агентаклиентскогоприложения|б(?:езопасногохранилища|локировкиаутентификациипользователейинформационнойбазы)|в(?:нешн(?:егохранилищадвоичныхданных|иххранилищдвоичныхданных)|ременныхтаблиц|строенныхпокупок)|глобальногопоиска|до(?:полнительн(?:ойпроверкипользователя|ыхнастроекаутентификации)|ставляемыхуведомлений)|истории(?:данных|работыпользователя)|к(?:алендарей|о(?:нтактов|пи(?:ибазыданных|йбазыданных))|риптографии)|метокndef|о(?:б(?:менаданнымисосновнымсервером|работки(?:ошибок|строкиxml))|кнавнешнегосайта|т(?:ображениярекламы|правкидоставляемыхуведомлений)|формленияотчетов)|п(?:анелизадачос|ол(?:итикпаролейпользователей|нотекстовогопоиска|учениялицензий|ьзователейинформационнойбазы)|ро(?:веркивстроенныхпокупок|грессивноговебприложения))|р(?:а(?:ботысречью|сширенийконфигурации)|егламентныхзаданий)|с(?:истемы(?:аналитики|взаимодействия)|пискапроверкираскрытияпароля|редств(?:передачиданныхнаустройстве|устройства)|татистикииспользованияприложения)|табличн(?:огопространствабазыданных|ыхпространствбазыданных)|уведомленийклиента|ф(?:айловыхпотоков|оновыхзаданий)|хранилищадвоичныхданных|шаблоновнастроеквторогофакторааутентификации)|тк(?:а(?:ndef|временикриптографии|интервалафонапланировщика|элементашкалывремени)|иэлементашкалывремени))|ноготочечныйобъектгеографическойсхемы|о(?:дельпрогноза(?:дереворешений|кластеризация|поиск(?:ассоциаций|последовательностей))|ментвремени(?:суточнениемпериода)?))|н(?:а(?:бор(?:данных(?:запрос(?:макетакомпоновкиданных|схемыкомпоновкиданных)|объе(?:динение(?:макетакомпоновкиданных|схемыкомпоновкиданных)|кт(?:макетакомпоновкиданных|схемыкомпоновкиданных)))|схемxml|узлов|ыданных(?:макетакомпоновкиданных|схемыкомпоновкиданных))|дпись|стройк(?:а(?:в(?:торогофакторааутентификации|ходн(?:ойколонкимоделипрогноза|ыхколонокмоделипрогноза))|колоноканализаданных|настройкиоформления|о(?:бластиоформления|т(?:бора|ображениядиаграмм)|формления)|п(?:араметрованализаданных|ериода|орядка)|сервиса|условногооформления)|и(?:а(?:втоматическогосохраненияаутентификации|утентификациичерезэлектроннуюпочту)|блокировкиаутентификациипользователейинформационнойбазы|в(?:ложенногообъектакомпоновкиданных|нешнейкомпоненты|осстановленияпароля)|и(?:нтерфейсаклиентскогоприложения|стории(?:выбора|данных))|к(?:лиентскогоприложения|ом(?:андногоинтерфейса|поновкиданных))|начальнойстраницы|о(?:бработкиошибок(?:призапуске)?|кна|тображениядинамическогосписка)|п(?:ечати(?:табличногодокумента)?|остроителяотчета|роверкираскрытияпароля)|с(?:ер(?:висаинтеграции|иализацииjson)|оставаинтерфейсаклиентскогоприложения|правки|равнения)|таблицыдинамическогосписка|формы)))|е(?:известнаязаписьndef|обходимостьзавершениясоединения)|отацияdom)|о(?:б(?:ещание|ласть(?:заголовка(?:географическойсхемы|д(?:ендрограммы|иаграммы(?:ганта)?)|своднойдиаграммы)|легенды(?:географическойсхемы|диаграммы(?:ганта)?|своднойдиаграммы)|макетаоформлениякомпоновкиданных|оформления|по(?:дписидиаграммы|строения(?:географическойсхемы|д(?:ендрограммы|иаграммы(?:ганта)?)|своднойдиаграммы))|форматированногодокумента|ячеектабличногодокумента)|новлениеконфигурациибазыданных|олочка(?:activedocument|htmlдокумента)|раб(?:атываемаякартинка|от(?:к(?:а(?:картинок|расшифровкикомпоновкиданных)|именеджер)|чикиwebsocketклиентсоединения))|суждениесистемывзаимодействия|ходдереваdom|щиймодуль|ъ(?:е(?:динение(?:за(?:вершенности(?:простоготипаxs|с(?:оставноготипаxs|хемыxs))|прещенныхподстановокxs)|исключенийгруппподстановкиxs|недопустимыхподстановкиxs)|кт(?:xdto|анализаданных|метаданныхконфигурация|ыслоягеографическойсхемы))|явление(?:атрибутаxs|нотацииxs|элементаxs)))|граничени(?:еиспользования(?:доступногоп(?:араметракомпоновкиданных|олякомпоновкиданных)|полясхемыкомпоновкиданных)|яиспользованиядоступныхп(?:араметровкомпоновкиданных|олейкомпоновкиданных))|кн(?:аклиентскогоприложения|оклиентскогоприложения)|п(?:ератор(?:выбратьсхемызапроса|ысхемызапроса)|исани(?:е(?:в(?:нешнейсистемысистемывзаимодействия|ременнойтаблицысхемызапроса)|голосасинтезаречи|з(?:ащитыотопасныхдействий|наченияпараметраголосасинтезаречи)|и(?:змененийконфигурациивсообщенииобмена|с(?:пользованиясобытия(?:доступжурналарегистрации|отказвдоступежурналарегистрации)|точникаданных))|ко(?:манды(?:входящегозапросаподелиться|п(?:ланировщика|оля(?:ввода|планировщика))|системывзаимодействия)|нфигурации)|м(?:акета(?:областимакетакомпоновкиданных|схемыкомпоновкиданных)|оделираспознаванияречи)|настроек|о(?:б(?:новленияконфигурации|работкирасшифровкикомпоновкиданных)|повещения|тображаемогообъектаpdf)|п(?:а(?:литрыцветовдиаграммы|раметр(?:а(?:внешнейсистемысистемывзаимодействия|голосасинтезаречи|запроса)|овзапроса))|ереда(?:ваемогофайла|нногофайла)|о(?:дписиpdf|мещенногофайла))|с(?:истемылинейныхуравнений|тандартно(?:гореквизита|йтабличнойчасти))|типов|характеристик|элементаспискавыборанавигационнойссылки)|я(?:макетов(?:областеймакетакомпоновкиданных|схемыкомпоновкиданных)|с(?:истемлинейныхуравнений|тандартных(?:реквизитов|табличныхчастей))|характеристик))|овещениесистемывзаимодействия|ределени(?:е(?:группы(?:атрибутовxs|моделиxs)|ограниченияидентичностиxs|простоготипаxs|составноготипаxs|типадокументаdom)|яxpathxs))|сьдиаграммы|т(?:бор(?:компоновкиданных|обсужденийсистемывзаимодействия|пользователейсистемывзаимодействия|сообщенийсистемывзаимодействия)?|метканафотоснимке|ображениесостояния|чет(?:обошибке|ыменеджер))|формл(?:ени(?:е(?:группировкидиаграммыобластикомпоновкиданных|д(?:аты|иаграммыобластикомпоновкиданных)|значений|компоновкиданных|макетаоформлениякомпоновкиданных|п(?:ериода|оляобластикомпоновкиданных)|ресурсадиаграммыобластикомпоновкиданных|строки|ячейки(?:динамическогосписка|таблицыобластикомпоновкиданных)?)|я(?:строк|ячеекдинамическогосписка))|яем(?:оеполекомпоновкиданных|ыеполякомпоновкиданных)))|п(?:а(?:кет(?:xdto|запросовсхемызапроса|отображаемыхдокументов)|нель(?:кнопоксообщениясистемывзаимодействия)?|пкаполейнабораданныхсхемыкомпоновкиданных|ра(?:графформатированногодокумента|метр(?:анализаданных|выбора(?:компоновкиданных)?|доступнойтаблицысхемызапроса|компоновкиданных|области(?:выражениекомпоновкиданных|расшифровкакомпоновкиданных)|перетаскиваниявнутрипланировщика|схемыкомпоновкиданных|таблицысхемызапроса|ы(?:websocketклиентсоединения|а(?:нализаданных|удиозаписи)|в(?:нешнегоподключенияработысречью|ы(?:бора(?:запускаприложениямобильногоустройства|компоновкиданных)|полнениякоманды))|д(?:иалогапо(?:лученияфайлов|мещенияфайлов)|оступ(?:а(?:внешнегохранилищадвоичныхданных)?|нойтаблицысхемызапроса))|зап(?:иси(?:json|xml|историиданных)|олненияприпереоткрытииформы)|к(?:ачествасканированиядокументов|о(?:лонкикластерногоанализа|мпоновкиданныхтаблицысхемызапроса))|м(?:акетат(?:абличногодокумента|екстовогодокумента)|о(?:делираспознаванияречи|нопольногорежима))|об(?:ластикомпоновкиданных|менаданными)|п(?:еретаскивания|о(?:дключениявнешнегохранилищадвоичныхданных|лученияархивафайлов|токовогораспознаванияречи)|ривязкикк(?:лючуполучениялицензий|омпьютеруполучениялицензий))|ре(?:гистрацииинформационнойбазысистемывзаимодействия|дактированиякомпоновкиданных)|с(?:еанса|канированиядокументов|оединениявнешнегоисточникаданных|хемыкомпоновкиданных)|таблицысхемызапроса|формированиякоманд(?:п(?:ланировщика|оля(?:ввода|планировщика))|системывзаимодействия)|чтенияxml))))|ер(?:е(?:водстрокиформатированногодокумента|ключатель|определениеxs|числ(?:енияменеджер|имыесвойстваобъектовметаданных))|иодотображенияпланировщика)|лан(?:глобальногопоиска|ировщик|ы(?:видов(?:расчетаменеджер|характеристикменеджер)|обменаменеджер|счетовменеджер))|о(?:дписькриптографии|казываемаяобластьгеографическойсхемы|л(?:е(?:htmlдокумента|pdfдокумента|xbase|анализаданных|в(?:вода|ыбора(?:компоновкиданныхсхемызапроса)?)|г(?:еографическойсхемы|р(?:афическойсхемы|уппировкикомпоновкиданных))|и(?:ндекса|тогасхемыкомпоновкиданных)|к(?:а(?:лендаря|ртинки)|омпоновкиданных)|на(?:бораданных(?:макетакомпоновкиданных|схемыкомпоновкиданных)|стройки)|областикомпоновкиданных|построителя(?:запроса|отчета)|с(?:водной(?:диаграммы|таблицы)|писка)|т(?:абличногодокумента|екстовогодокумента)|формы|элемента(?:блокировкиданных|составакопиибазыданных))?|и(?:гональныйобъектгеографическойсхемы|линейныйобъектгеографическойсхемы|тикапаролейпользователей)|ос(?:а(?:измерительнойдиаграммы|регулирования)|ыизмерительнойдиаграммы)|ьзователь(?:информационнойбазы|с(?:истемывзаимодействия|к(?:ие(?:настройкикомпоновкиданных|полякомпоновкиданных)|оеполевы(?:боркомпоновкиданных|ражениекомпоновкиданных))))|я(?:выборакомпоновкиданныхсхемызапроса|группировкикомпоновкиданных|итогасхемыкомпоновкиданных|колонкисхемызапроса|на(?:бораданных(?:макетакомпоновкиданных|схемыкомпоновкиданных)|стройки)|построителя(?:запроса|отчета)|схемызапроса|элемента(?:блокировкиданных|составакопиибазыданных)))|рядок(?:компоновкиданных)?|с(?:ледовательност(?:именеджер|ьxdto)|троитель(?:dom|запроса|отчета(?:анализаданных)?|схемxml))|ток(?:впамяти|обменаданными)?|чт(?:а|ов(?:ое(?:вложение|сообщение)|ы(?:е(?:адреса|вложения)|йадрес))))|р(?:авилоассоциации|е(?:дставлениенавигационнойссылки|образование(?:xsl|кканоническомуxml))|и(?:крепляемыеданныезапускаприложениямобильногоустройства|ложение(?:системывзаимодействия)?)|о(?:странствоименxpath|цессор(?:выводарезультатакомпоновкиданныхв(?:коллекциюзначений|табличныйдокумент)|компоновкиданных))|ямоугольникгеографическойсхемы)|устаязаписьndef)|р(?:а(?:з(?:делитель|решен(?:иекамерыустройства|н(?:аявнешняякомпонента|оевнешнееприложение|ый(?:comкласс|в(?:иртуальныйкаталог|нешниймодуль)|интернетресурс)))|ыменовательпространствименdom)|мка(?:группы)?|с(?:писание(?:регламентногозадания|элементапланировщика)|четсистемлинейныхуравнений|ширен(?:ие(?:конфигурации)?|ноеимяxml)))|е(?:г(?:и(?:ональныенастройки(?:информационнойбазы|сеанса)|стры(?:бухгалтериименеджер|накопленияменеджер|расчетаменеджер|сведенийменеджер))|ламентноезадание)|жим(?:использованияхранилищадвоичныхданных|размещениякопийданныхвхранилищедвоичныхданных|чтениязаписихранилищадвоичныхданных)|зультат(?:xpath|а(?:нализаданных(?:дереворешений|кластеризация|общаястатистика|поиск(?:ассоциаций|последовательностей))|синхвызовавнешнейкомпоненты)|выборадействиярасшифровкикомпоновкиданных|глобальногопоиска|зап(?:роса|ускаприложениямобильногоустройства)|отложенногораспознаванияречи|поискапорегулярномувыражению|р(?:аспознаванияречи|егистрацииинформационнойбазысистемывзаимодействия)|чтенияданных)|квизитформы|шениеанализаданных)|исуноктабличногодокумента|ол(?:ипользователя|ьполя(?:набораданныхкомпоновкиданных|схемызапроса))|яд(?:кнопокпанеликнопоксообщениясистемывзаимодействия|ыкнопокпанеликнопоксообщениясистемывзаимодействия))|с(?:в(?:о(?:дная(?:диаграмма|таблица)|йство(?:xdto|объектаанализаданных))|яз(?:и(?:дендрограммы|наборовданных(?:макетакомпоновкиданных|схемыкомпоновкиданных)|параметроввыборакомпоновкиданных)|ь(?:д(?:ендрограммы|иаграммыганта)|наборовданных(?:макетакомпоновкиданных|схемыкомпоновкиданных)|п(?:араметравыбора(?:компоновкиданных)?|отипу(?:компоновкиданных)?))))|е(?:анс(?:информационнойбазы)?|гмент(?:полилинейногообъектагеографическойсхемы|ыполилинейногообъектагеографическойсхемы)|кцияcdatadom|р(?:висыинтеграциименеджер|и(?:ализаторxdto|и(?:диаграммы(?:ганта)?|слоягеографическойсхемы)|яд(?:анныхслоягеографическойсхемы|иаграммы(?:ганта)?))|тификат(?:к(?:лиента(?:linux|macos|windows|ос|файл)|риптографии)|ыудостоверяющихцентров(?:linux|macos|windows|ос|файл))))|жатиеданных|истемнаяинформация|ло(?:вофразыраспознаванияречи|игеографическойсхемы|йгеографическойсхемы)|о(?:вместноеиспользованиеприложенийсистемывзаимодействия|единени(?:е(?:и(?:нформационнойбазы|сточниказапросасхемызапроса)|ссерверомсистемыаналитики)?|яисточниказапросасхемызапроса)|о(?:бщение(?:ndef|внешне(?:госайта|мусайту)|пользователю|с(?:ервисаинтеграции|истемывзаимодействия))|тветствие)|ст(?:ав(?:ко(?:манднойпанелиформынамобильномустройстве|пиибазыданных)|общегореквизита|планаобмена|табличногопространствабазыданных|ф(?:ормначальнойстраницы|ункциональнойопции)|хранимыхданныххранилищадвоичныхданных)|ояниеwebsocketсоединения)|четаниеклавиш)|п(?:исок(?:xdto|выборанавигационнойссылки|значений|компонентxs|пол(?:ей|нотекстовогопоиска)|расширенныхименxml|строкdom|узлов(?:dom|html)|элементовdom)|особ(?:pop3аутентификации|smtpаутентификации|аутентификации(?:пользователяинформационнойбазы|черезэлектроннуюпочту)|восстановленияпароляпользователяинформационнойбазы)|равочникименеджер)|р(?:авнение(?:значений|файлов)|едства(?:nfc|буфераобмена|геопозиционирования|криптографии|мультимедиа|почты|телефонии))|сылкана(?:сущностьdom|файл)|т(?:андартн(?:аядатаначала|оехранилищенастроек(?:выборка(?:настроекпоумолчанию)?|менеджер)|ы(?:епользователисистемывзаимодействия|йпериод))|иль|р(?:аниц(?:а(?:pdf|панели|сканированиядокументов)|ыпанели)|ок(?:а(?:группировкидинамическогосписка|д(?:еревазначений|инамическогосписка)|таблицы(?:значений|областикомпоновкиданных))|идинамическогосписка)|уктура(?:настроеккомпоновкиданных)?))|ущностьdom|хема(?:xml|запроса|компоновкиданных|системыаналитики))|т(?:абли(?:ц(?:а(?:дляизменениясхемызапроса|значений|компоновкиданных|макетакомпоновкиданных|схемызапроса|формы)|ыдляизменениясхемызапроса)|чн(?:оеполе|ыйдокумент))|е(?:к(?:ст(?:dom|html|ов(?:аязаписьndef|ыйдокумент)|форматированногодокумента|ысообщени(?:йобошибках|яобошибке))|ущиеданныес(?:писка|труктурынастроеккомпоновкиданных))|ло(?:группировки(?:диаграммымакетакомпоновкиданных|таблицымакетакомпоновкиданных)|макетакомпоновкиданных)|стируем(?:ая(?:группа(?:командногоинтерфейса|формы)|декорацияформы|кнопка(?:командногоинтерфейса|формы)|таблицаформы|форма)|ое(?:дополнениеэлементаформы|окноклиентскогоприложения|п(?:олеформы|риложение))|ыйкомандныйинтерфейсокна))|ип(?:urlвнешнегохранилищадвоичныхданных|данныхxml|з(?:вонкасредствтелефонии|наченияxdto)|об(?:работкинастроеквторогофакторааутентификации|ъектаxdto)|подписикриптографии|хранилищадвоичныхданных)|о(?:кендоступа|ч(?:ечныйобъектгеографическойсхемы|к(?:адиаграммы(?:ганта)?|и(?:диаграммы(?:ганта)?|м(?:аршрута|ноготочечногообъектагеографическойсхемы))))))|у(?:далениеобъекта|зелдереварешений|никальныйидентификатор|словноеоформление(?:компоновкиданных)?|четнаязаписьк(?:алендарей|онтактов))|ф(?:а(?:брикаxdto|йл(?:овыйпоток)?|сет(?:xdto|длиныxs|количестваразрядовдробнойчастиxs|м(?:аксимально(?:го(?:включающегозначенияxs|исключающегозначенияxs)|йдлиныxs)|инимально(?:го(?:включающегозначенияxs|исключающегозначенияxs)|йдлиныxs))|об(?:разцаxs|щегоколичестваразрядовxs)|п(?:еречисленияxs|робельныхсимволовxs)))|и(?:ксированн(?:ая(?:коллекция|структура)|оесоответствие|ый(?:массив|списоккомпонентxs))|льтрузловdom)|ла(?:гиинтернетпочтовогосообщения|жок)|о(?:новоезадание|рма(?:клиентскогоприложения|т(?:ированн(?:аястрока|ыйдокумент)|строктабличногодокумента))?)|рагмент(?:xs|документаdom))|х(?:арактеристик(?:акомпоновкиданныхсхемызапроса|икомпоновкиданныхсхемызапроса)|ешированиеданных|ранилищ(?:анастроекменеджер|е(?:значения|сертификатовкриптографии)))|цвет|чтение(?:fastinfoset|html|json|pdf|xml|zipфайла|данных|сообщенияобмена|текста|узловdom|файлаархива)|ш(?:аблон(?:настройкивторогофакторааутентификации|последовательностианализаданных|сообщениясистемывзаимодействия)|кала(?:времени|диаграммы)|рифт)|элемент(?:dom|html|zipфайла|аплетhtml|б(?:иблиотекимакетовоформлениякомпоновкиданных|лок(?:html|ировкиданных)|уфераобмена)|в(?:водаhtml|ставкаhtml)|гр(?:афическойсхемы(?:в(?:ложенныйбизнеспроцесс|ыборварианта)|де(?:йствие|кора(?:тивнаялиния|ция))|завершение|обработка|разделение|с(?:лияние|оединительнаялиния|тарт)|условие)|уппировкимакетакомпоновкиданных)|д(?:анныхконтакта(?:мгновенныесообщения)?|ендрограммы|ополнительныхданныхзапускаприложениямобильногоустройства)|заголовок(?:html|таблицыhtml)|и(?:з(?:бранногоработыпользователя|меренияпланировщика)|нформацииовыполненииобновленияконфигурациибазыданных|сторииработыпользователя)|к(?:артинкаhtml|нопкаhtml|олонкатаблицыhtml)|л(?:егендыгеографическойсхемы|инияhtml)|метаhtml|на(?:борфреймовhtml|стройки(?:оформления|составаинтерфейсаклиентскогоприложения))|о(?:б(?:ласти(?:макетаоформлениякомпоновкиданных|оформления)|ъектhtml)|тбора(?:компоновкиданных)?)|п(?:акетаотображаемыхдокументов|ла(?:вающийфреймhtml|н(?:аглобальногопоиска|ировщика))|орядка(?:компоновкиданных)?|рикрепляемыхданныхзапускаприложениямобильногоустройства)|р(?:а(?:зметкаhtml|сшифровкикомпоновкиданных(?:группировка|поля))|езультата(?:глобальногопоиска|компоновкиданных))|с(?:вязьhtml|криптhtml|остава(?:копиибазыданных|общегореквизита|планаобмена|табличногопространствабазыданных|функциональнойопции|хранимыхданныххранилищадвоичныхданных)|писка(?:значений|полнотекстовогопоиска)|трокатаблицыhtml)|т(?:аблицаhtml|елоhtml)|у(?:правления(?:интерфейсом|колонкамианализаданных|настройкой(?:настройкиоформления|областиоформления|условногооформления)|отбором|п(?:араметрамианализаданных|орядком))|словногооформления(?:компоновкиданных)?)|ф(?:а(?:йлаархива|ктическогопериодадействия)|орма(?:html|тированноготекстаhtml)|реймhtml)|шкалывремени|ы(?:zipфайла|графическойсхемы|дендрограммы|легендыгеографическойсхемы|макетаобластикомпоновкиданных|пакетаотображаемыхдокументов|расшифровкикомпоновкиданных|ф(?:айлаархива|ормы)|шкалывремени)|я(?:корьhtml|чейкатаблицыhtml))|ячейк(?:а(?:макета(?:заголовкаколлекциизначенийобластикомпоновкиданных|коллекциизначенийобластикомпоновкиданных)|таблицыобластикомпоновкиданных)|и(?:макета(?:заголовкаколлекциизначенийобластикомпоновкиданных|коллекциизначенийобластикомпоновкиданных)|таблицыобластикомпоновкиданных))))'
+
+DOC_TYPE_PATTERN = '(?:(?:boolean|com(?:safearray|объект)|date|ftp(?:соединение|файл)|http(?:запрос|ответ|с(?:ервис(?:запрос|ответ)|оединение))|mmsвложение|number|s(?:msсообщение|tring)|uriзаписьndef|w(?:ebsocketклиент(?:соединение)?|s(?:возвращаемоезначение|интерфейс|коллекция(?:операций|параметров|сервисов|точекподключения)|оп(?:ерация|ределения)|п(?:араметр|рокси)|с(?:ервис|сылкименеджер)|точкаподключения))|xbase|а(?:вто(?:выбранноеполекомпоновкиданных|полегруппировкикомпоновкиданных|элементпорядкакомпоновкиданных)|грегат(?:регистранакопления|ырегистранакопления)|дминистр(?:атор|ирование(?:администратор|блокировка|диапазонпортов|значениесчетчикапотребленияресурсов|информационнаябаза|кластер|лицензия|менеджеркластера|ограничениепотребленияресурсов|профильбезопасности|рабочий(?:процесс|сервер)|с(?:е(?:анс|рв(?:ера|ис))|оединение|четчикпотребленияресурсов)|требованиеназначения|хранилищедвоичныхданных))|лгоритмподписитокенадоступа|н(?:ализданных(?:дереворешений|кластеризация|общаястатистика|поиск(?:ассоциаций|последовательностей))?|нотацияxs)|ссоциированнаягруппа|трибут(?:dom|html))|б(?:и(?:блиотека(?:макетовоформлениякомпоновкиданных|стилей)|знеспроцессыменеджер)|локировка(?:аутентификациипользователяинформационнойбазы|данных|сеансов)?|отсистемывзаимодействия|у(?:лево|фердвоичныхданных))|в(?:ариант(?:xdto|использовани(?:ибазыданныхкопии|ярасположенияработысречью)|настроеккомпоновкиданных|пользовательскогополявыборкомпоновкиданных|точкимаршрутабизнеспроцесса|храненияданныхдатаакселератора|ы(?:настроеккомпоновкиданных|пользовательскогополявыборкомпоновкиданных|точкимаршрутабизнеспроцесса|элементаграфическойсхемывыборварианта)|элементаграфическойсхемывыборварианта)|ключениеxs|ложен(?:ие(?:pdf|системывзаимодействия)|н(?:ая(?:схемакомпоновкиданных|таблицасхемызапроса)|ы(?:е(?:наборыданныхмакетакомпоновкиданных|схемыкомпоновкиданных)|й(?:запроссхемызапроса|наборданных(?:макетакомпоновкиданных|схемыкомпоновкиданных)|объектмакетакомпоновкиданных))))|нешн(?:и(?:е(?:источникиданныхменеджер|о(?:бработкименеджер|тчетыменеджер))|йо(?:бъект|тчет))|яяобработка)|ременн(?:аятаблицазапроса|ыетаблицызапроса)|с(?:еэлементыформы|троеннаяпокупка)|ы(?:б(?:ор(?:ка(?:данных|изрезультатазапроса)|настроек)|ранн(?:оеполекомпоновкиданных|ыеполякомпоновкиданных))|грузкаданныхсистемывзаимодействия|деленные(?:областитабличногодокумента|строкитабличногополя)|ражени(?:е(?:xpath|и(?:ндексасхемызапроса|тогасхемызапроса)|компоновкиданных|отборакомпоновкиданныхсхемызапроса|по(?:ляпараметраобластирасшифровкакомпоновкиданных|рядкасхемызапроса)|схемызапроса|упорядочиваниякомпоновкиданных)|я(?:и(?:ндексасхемызапроса|тоговсхемызапроса)|отборакомпоновкиданныхсхемызапроса|по(?:лейпараметраобластирасшифровкакомпоновкиданных|рядкасхемызапроса)|схемызапроса|упорядочиваниякомпоновкиданных))|числяем(?:оеполесхемыкомпоновкиданных|ыеполясхемыкомпоновкиданных)))|г(?:е(?:нератор(?:макетакомпоновкиданных(?:дляколлекциизначений)?|случайных(?:паролей|чисел))|о(?:графическ(?:аясхема|иекоординаты)|зона))|р(?:а(?:ница|фическаясхема)|упп(?:а(?:выбранныхполейкомпоновкиданных|доступныхтаблицсхемызапроса|команд|моделиxs|настройкисоставаинтерфейсаклиентскогоприложения|результатапоискапорегулярномувыражению|формы|элементовотборакомпоновкиданных)|ировк(?:а(?:диаграммы(?:компоновкиданных|макетакомпоновкиданных)|компоновкиданных|макетакомпоновкиданных|таблицы(?:компоновкиданных|макетакомпоновкиданных))|и(?:диаграммымакетакомпоновкиданных|макетакомпоновкиданных)))))|д(?:а(?:нные(?:адреса|групповойобработкикомпоновкиданных|з(?:апросаподелиться|начениядиаграммыганта)|информационнойбазыработысречью|к(?:алендаря(?:учетнойзаписи)?|витанциивстроеннойпокупки|онтакта(?:учетнойзаписи)?)|м(?:естоположения|ультимедиа)|переходапонавигационнойссылке|р(?:асшифровкикомпоновкиданных|егистрацииинформационнойбазысистемывзаимодействия)|событиякалендаря(?:учетнойзаписи)?|ф(?:ормы(?:дерево|коллекция(?:элементовдерева)?|структура(?:сколлекцией)?|элемент(?:дерева|коллекции))|разыраспознаванияречи))|та)|воичныеданные|е(?:йствие(?:принесоответствиипаролятребованиямприаутентификации|сообщениясистемывзаимодействия|элемента(?:планировщика|результатаглобальногопоиска))?|корацияформы|ндрограмма|ревозначений)|и(?:а(?:грамма(?:ганта|компоновкиданных|макетакомпоновкиданных)?|лог(?:выбора(?:пользователейисторииданных|типадиаграммы|файла|цвета|шрифта)|отбораверсийисторииданных|р(?:асписания(?:регламентногозадания|элементапланировщика)|едактированиястандартногопериода))|пазон)|намическийсписок)|о(?:кумент(?:dom|html|pdf|ацияxs|ыменеджер)|п(?:олн(?:ение(?:периодамакетакомпоновкиданных|элементаформы)|ительны(?:е(?:данныезапускаприложениямобильногоустройства|индексы)|йиндекс))|устимаястранаполучениялицензий)|ст(?:авляемоеуведомление|уп(?:косновномусерверу|н(?:ая(?:вложеннаятаблицасхемызапроса|таблицасхемызапроса)|о(?:еполе(?:компоновкиданных|отборакомпоновкиданных|схемызапроса)|сть(?:получениялицензий|централицензированияполучениялицензий))|ы(?:е(?:объектынастройкикомпоновкиданных|п(?:араметрыкомпоновкиданных|оля(?:компоновкиданных|схемызапроса))|таблицысхемызапроса)|й(?:объектнастройкикомпоновкиданных|параметркомпоновкиданных)))))))|журнал(?:sms|звонков|ыдокументовменеджер)|з(?:а(?:дачименеджер|кладкаформатированногодокумента|п(?:ис(?:и(?:макетакомпоновкиданных|таблицымакетакомпоновкиданных)|ь(?:dom|fastinfoset|html|json|ndefвнешнеготипа|pdf|xml|zipфайла|данных|журнала(?:sms|звонков)|сообщенияобмена|текста|узловdom|файлаархива))|рос(?:выборасхемызапроса|наполучениелицензии|уничтожениятаблицысхемызапроса)?|ускприложениямобильногоустройства)|щищенноесоединение(?:nss|openssl|криптопро))|начени(?:е(?:xdto|диаграммы(?:ганта)?|п(?:араметра(?:компоновкиданных|макетакомпоновкиданных|настроеккомпоновкиданных)|оля(?:анализаданных|расшифровкикомпоновкиданных))|сериислоягеографическойсхемы)|яп(?:араметров(?:вывода(?:группировки(?:диаграммыкомпоновкиданных|компоновкиданных|таблицыкомпоновкиданных)|диаграммыкомпоновкиданных|компоновкиданных|таблицыкомпоновкиданных)|данныхкомпоновкиданных|макетакомпоновкиданных)|олейрасшифровкикомпоновкиданных)))|и(?:дентификатор(?:выгрузкиданныхсистемывзаимодействия|значениядиаграммыганта|инте(?:грациисистемывзаимодействия|рваладиаграммыганта)|компоновкиданных|моделираспознаванияречи|о(?:бсуждениясистемывзаимодействия|тложенногораспознаванияречи)|п(?:о(?:дписчикадоставляемыхуведомлений|льзователясистемывзаимодействия)|риложениясистемывзаимодействия)|расшифровкикомпоновкиданных|сообщениясистемывзаимодействия|шаблонасообщениясистемывзаимодействия)|ерархическ(?:аягруппировка(?:диаграммымакетакомпоновкиданных|макетакомпоновкиданных|таблицымакетакомпоновкиданных)|иезаписи(?:макетакомпоновкиданных|таблицымакетакомпоновкиданных))|з(?:бранноеработыпользователя|влечениетекста|мерени(?:еп(?:ланировщика|остроителя(?:запроса|отчета))|япостроителя(?:запроса|отчета)))|мпортxs|н(?:д(?:екс(?:xbase|коллекции|схемызапроса|ы(?:коллекции|схемызапроса))|икатор)|струкцияобработкиdom|те(?:грациясистемывзаимодействия|р(?:вал(?:диаграммыганта|фона(?:диаграммыганта|планировщика)|ыфонадиаграммыганта)|нет(?:п(?:очт(?:а|ов(?:ое(?:вложение|сообщение)|ы(?:е(?:адреса|вложения)|й(?:адрес|профиль))))|рокси)|соединение|текст(?:почтовогосообщения|ыпочтовогосообщения))))|формаци(?:онн(?:аялиниядиаграммы|ы(?:е(?:интервалыдиаграммы|линиидиаграммы)|йинтервалдиаграммы))|я(?:д(?:искретногополяанализаданных|ляприложенияxs)|модулякриптографии|непрерывногополяанализаданных|о(?:б(?:агрегат(?:ах|е)|и(?:нтернетсоединении|спользованиибазыданныхкопии)|ошибке)|записиверсииисторииданных|копиибазыданных|проблеме(?:отправкидоставляемогоуведомления|применениярасширенияконфигурации)|сетевомадаптере)|провайдерагеопозиционирования|хранилищадвоичныхданных|экранаклиента)))|с(?:польз(?:ование(?:атрибутаxs|событияжурналарегистрации|хранениявхранилищедвоичныхданных)|уем(?:аякопиябазыданных|ыекопиибазыданных))|то(?:рия(?:глобальногопоиска|поискатаблицы)|чник(?:д(?:анных(?:макетакомпоновкиданных|с(?:воднойтаблицыкомпоновкиданных|хемыкомпоновкиданных))|оступныхнастроеккомпоновкиданных)|и(?:данных(?:макетакомпоновкиданных|схемыкомпоновкиданных)|схемызапроса)|схемызапроса)))|тераторузловdom)|к(?:а(?:ноническ(?:аязаписьxml|ийdom)|ртинка(?:форматированногодокумента)?|талогданныхсервисадляпереноса)|в(?:алификаторы(?:д(?:аты|воичныхданных)|строки|числа)|итанциявстроеннойпокупки)|л(?:ас(?:сификацияобъектаанализаданных|теранализаданных)|иентскоеприложение|юч(?:xbase|изначение|строкидинамическогосписка))|нопк(?:а(?:команднойпанели|панеликнопоксообщениясистемывзаимодействия|формы)?|икоманднойпанели)|о(?:л(?:лекция(?:атрибутов(?:dom|html)|в(?:ариантовпользовательскогополявыборкомпоновкиданных|ложений(?:pdf|системывзаимодействия)|строенныхтаблиц|ы(?:бранныхполейкомпоновкиданных|деленныхдат))|д(?:вижений|ействий(?:сообщениясистемывзаимодействия|элемента(?:планировщика|результатаглобальногопоиска))|оступных(?:объектовнастройкикомпоновкиданных|п(?:араметровкомпоновкиданных|олейкомпоновкиданных)))|з(?:амещающихэлементовпланировщика|начений(?:xdto|параметровкомпоновкиданных|свойстваобъектаметаданных))|и(?:дентификаторовп(?:ользователейсистемывзаимодействия|риложенийсистемывзаимодействия)|змеренийпланировщика|менованныхкомпонентxs|н(?:дексовxbase|терваловфонапланировщика|формацииозаписиверсииисторииданных))|колонок(?:деревазначений|результатазапроса|таблицызначений)|метокинтервалафонапланировщика|нотацийdom|о(?:б(?:ластейтабличногодокумента|ъектовметаданных)|формл(?:енийдат|яемыхполейкомпоновкиданных))|п(?:акетовxdto|ол(?:ей(?:xbase|группировкикомпоновкиданных|сводной(?:диаграммы|таблицы))|ьзовательскихполейкомпоновкиданных))|рисунковтабличногодокумента|с(?:войствxdto|тр(?:аницpdf|окдеревазначений)|ущностейdom)|т(?:екущихпериодовотображенияпланировщика|иповзначенийxdto)|фасетовxdto|элементов(?:html|измеренияпланировщика|отборакомпоновкиданных|п(?:ланировщика|о(?:льзовательскихнастроеккомпоновкиданных|рядкакомпоновкиданных))|структуры(?:диаграммыкомпоновкиданных|настроеккомпоновкиданных|таблицыкомпоновкиданных)|у(?:правленияинтерфейсами|словногооформлениякомпоновкиданных)|форматированногодокумента))|он(?:к(?:а(?:анализаданных|в(?:ложеннаятаблицасхемызапроса|ременнойтаблицызапроса)|д(?:анныхдиаграммыганта|еревазначений)|моделипрогноза|описанияисточникаданных|результата(?:запроса|моделипрогноза)|с(?:писка|хемызапроса)|табли(?:цызначений|чногополя))|и(?:анализаданных|временнойтаблицызапроса|данныхдиаграммыганта|моделипрогноза|описанияисточникаданных|результатамоделипрогноза|с(?:писка|хемызапроса)|табличногополя))|титултабличногодокумента))|м(?:анд(?:а(?:командногоинтерфейса|формы)|наяпанель|ыформы)|ментарий(?:dom|html)|поновщик(?:макетакомпоновкиданных|настроеккомпоновкиданных))|н(?:ст(?:анты(?:менеджер|набор)|руктор(?:запроса|макетаоформлениякомпоновкиданных|настроеккомпоновкиданных|схемыкомпоновкиданных|форматнойстроки))|т(?:е(?:йнер(?:ключейкриптографии|подписейкриптографии)|кст(?:обсуждениясистемывзаимодействия|пространствименxml))|рольн(?:аяточкаитоговсхемызапроса|ыеточкиитоговсхемызапроса)|ур(?:полигональногообъектагеографическойсхемы|ыполигональногообъектагеографическойсхемы))|фигурация(?:документаdom|записиdom|построителяdom)))|ритерииотбораменеджер)|л(?:и(?:ни(?:итрендадиаграммы|я(?:трендадиаграммы)?)|цензия)|окальныйключ(?:к(?:алендаря|онтакта)|событиякалендаря))|м(?:а(?:кет(?:группировки(?:диаграммы(?:макетакомпоновкиданных|областикомпоновкиданных)|схемыкомпоновкиданных|таблицымакетакомпоновкиданных)|д(?:иаграммыобластикомпоновкиданных|окументаобластикомпоновкиданных)|заголовкаколлекциизначенийобластикомпоновкиданных|ко(?:ллекциизначенийобластикомпоновкиданных|мпоновкиданных)|о(?:бласти(?:компоновкиданных|макетакомпоновкиданных)|формлениякомпоновкиданных)|пол(?:ейитогасхемыкомпоновкиданных|ясхемыкомпоновкиданных)|ресурсадиаграммыобластикомпоновкиданных|тела(?:диаграммымакетакомпоновкиданных|таблицымакетакомпоновкиданных)|ы(?:группировоксхемыкомпоновкиданных|полей(?:итогасхемыкомпоновкиданных|схемыкомпоновкиданных)|тела(?:диаграммымакетакомпоновкиданных|таблицымакетакомпоновкиданных)))|с(?:каxs|сив))|е(?:диазаписьndef|неджер(?:websocketклиент(?:ов|соединений)|агентаклиентскогоприложения|б(?:езопасногохранилища|локировкиаутентификациипользователейинформационнойбазы)|в(?:нешн(?:егохранилищадвоичныхданных|иххранилищдвоичныхданных)|ременныхтаблиц|строенныхпокупок)|глобальногопоиска|до(?:полнительн(?:ойпроверкипользователя|ыхнастроекаутентификации)|ставляемыхуведомлений)|истории(?:данных|работыпользователя)|к(?:алендарей|о(?:нтактов|пи(?:ибазыданных|йбазыданных))|риптографии)|метокndef|о(?:б(?:менаданнымисосновнымсервером|работки(?:ошибок|строкиxml))|кнавнешнегосайта|т(?:ображениярекламы|правкидоставляемыхуведомлений)|формленияотчетов)|п(?:анелизадачос|ол(?:итикпаролейпользователей|нотекстовогопоиска|учениялицензий|ьзователейинформационнойбазы)|ро(?:веркивстроенныхпокупок|грессивноговебприложения))|р(?:а(?:ботысречью|сширенийконфигурации)|егламентныхзаданий)|с(?:истемы(?:аналитики|взаимодействия)|пискапроверкираскрытияпароля|редств(?:передачиданныхнаустройстве|устройства)|татистикииспользованияприложения)|табличн(?:огопространствабазыданных|ыхпространствбазыданных)|уведомленийклиента|ф(?:айловыхпотоков|оновыхзаданий)|хранилищадвоичныхданных|шаблоновнастроеквторогофакторааутентификации)|тк(?:а(?:ndef|временикриптографии|интервалафонапланировщика|элементашкалывремени)|иэлементашкалывремени))|ноготочечныйобъектгеографическойсхемы|о(?:дельпрогноза(?:дереворешений|кластеризация|поиск(?:ассоциаций|последовательностей))|ментвремени(?:суточнениемпериода)?))|н(?:а(?:бор(?:данных(?:запрос(?:макетакомпоновкиданных|схемыкомпоновкиданных)|объе(?:динение(?:макетакомпоновкиданных|схемыкомпоновкиданных)|кт(?:макетакомпоновкиданных|схемыкомпоновкиданных)))|схемxml|узлов|ыданных(?:макетакомпоновкиданных|схемыкомпоновкиданных))|дпись|стройк(?:а(?:в(?:торогофакторааутентификации|ходн(?:ойколонкимоделипрогноза|ыхколонокмоделипрогноза))|колоноканализаданных|настройкиоформления|о(?:бластиоформления|т(?:бора|ображениядиаграмм)|формления)|п(?:араметрованализаданных|ериода|орядка)|сервиса|условногооформления)|и(?:а(?:втоматическогосохраненияаутентификации|утентификациичерезэлектроннуюпочту)|блокировкиаутентификациипользователейинформационнойбазы|в(?:ложенногообъектакомпоновкиданных|нешнейкомпоненты|осстановленияпароля)|и(?:нтерфейсаклиентскогоприложения|стории(?:выбора|данных))|к(?:лиентскогоприложения|ом(?:андногоинтерфейса|поновкиданных))|начальнойстраницы|о(?:бработкиошибок(?:призапуске)?|кна|тображениядинамическогосписка)|п(?:ечати(?:табличногодокумента)?|остроителяотчета|роверкираскрытияпароля)|с(?:ер(?:висаинтеграции|иализацииjson)|оставаинтерфейсаклиентскогоприложения|правки|равнения)|таблицыдинамическогосписка|формы)))|е(?:известнаязаписьndef|обходимостьзавершениясоединения)|отацияdom)|о(?:б(?:ещание|ласть(?:заголовка(?:географическойсхемы|д(?:ендрограммы|иаграммы(?:ганта)?)|своднойдиаграммы)|легенды(?:географическойсхемы|диаграммы(?:ганта)?|своднойдиаграммы)|макетаоформлениякомпоновкиданных|оформления|по(?:дписидиаграммы|строения(?:географическойсхемы|д(?:ендрограммы|иаграммы(?:ганта)?)|своднойдиаграммы))|форматированногодокумента|ячеектабличногодокумента)|новлениеконфигурациибазыданных|олочка(?:activedocument|htmlдокумента)|раб(?:атываемаякартинка|от(?:к(?:а(?:картинок|расшифровкикомпоновкиданных)|именеджер)|чикиwebsocketклиентсоединения))|суждениесистемывзаимодействия|ходдереваdom|щиймодуль|ъ(?:е(?:динение(?:за(?:вершенности(?:простоготипаxs|с(?:оставноготипаxs|хемыxs))|прещенныхподстановокxs)|исключенийгруппподстановкиxs|недопустимыхподстановкиxs)|кт(?:xdto|анализаданных|метаданныхконфигурация|ыслоягеографическойсхемы))|явление(?:атрибутаxs|нотацииxs|элементаxs)))|граничени(?:еиспользования(?:доступногоп(?:араметракомпоновкиданных|олякомпоновкиданных)|полясхемыкомпоновкиданных)|яиспользованиядоступныхп(?:араметровкомпоновкиданных|олейкомпоновкиданных))|кн(?:аклиентскогоприложения|оклиентскогоприложения)|п(?:ератор(?:выбратьсхемызапроса|ысхемызапроса)|исани(?:е(?:в(?:нешнейсистемысистемывзаимодействия|ременнойтаблицысхемызапроса)|голосасинтезаречи|з(?:ащитыотопасныхдействий|наченияпараметраголосасинтезаречи)|и(?:змененийконфигурациивсообщенииобмена|с(?:пользованиясобытия(?:доступжурналарегистрации|отказвдоступежурналарегистрации)|точникаданных))|ко(?:манды(?:входящегозапросаподелиться|п(?:ланировщика|оля(?:ввода|планировщика))|системывзаимодействия)|нфигурации)|м(?:акета(?:областимакетакомпоновкиданных|схемыкомпоновкиданных)|оделираспознаванияречи)|настроек|о(?:б(?:новленияконфигурации|работкирасшифровкикомпоновкиданных)|повещения|тображаемогообъектаpdf)|п(?:а(?:литрыцветовдиаграммы|раметр(?:а(?:внешнейсистемысистемывзаимодействия|голосасинтезаречи|запроса)|овзапроса))|ереда(?:ваемогофайла|нногофайла)|о(?:дписиpdf|мещенногофайла))|с(?:истемылинейныхуравнений|тандартно(?:гореквизита|йтабличнойчасти))|типов|характеристик|элементаспискавыборанавигационнойссылки)|я(?:макетов(?:областеймакетакомпоновкиданных|схемыкомпоновкиданных)|с(?:истемлинейныхуравнений|тандартных(?:реквизитов|табличныхчастей))|характеристик))|овещениесистемывзаимодействия|ределени(?:е(?:группы(?:атрибутовxs|моделиxs)|ограниченияидентичностиxs|простоготипаxs|составноготипаxs|типадокументаdom)|яxpathxs))|сьдиаграммы|т(?:бор(?:компоновкиданных|обсужденийсистемывзаимодействия|пользователейсистемывзаимодействия|сообщенийсистемывзаимодействия)?|метканафотоснимке|ображениесостояния|чет(?:обошибке|ыменеджер))|формл(?:ени(?:е(?:группировкидиаграммыобластикомпоновкиданных|д(?:аты|иаграммыобластикомпоновкиданных)|значений|компоновкиданных|макетаоформлениякомпоновкиданных|п(?:ериода|оляобластикомпоновкиданных)|ресурсадиаграммыобластикомпоновкиданных|строки|ячейки(?:динамическогосписка|таблицыобластикомпоновкиданных)?)|я(?:строк|ячеекдинамическогосписка))|яем(?:оеполекомпоновкиданных|ыеполякомпоновкиданных)))|п(?:а(?:кет(?:xdto|запросовсхемызапроса|отображаемыхдокументов)|нель(?:кнопоксообщениясистемывзаимодействия)?|пкаполейнабораданныхсхемыкомпоновкиданных|ра(?:графформатированногодокумента|метр(?:анализаданных|выбора(?:компоновкиданных)?|доступнойтаблицысхемызапроса|компоновкиданных|области(?:выражениекомпоновкиданных|расшифровкакомпоновкиданных)|перетаскиваниявнутрипланировщика|схемыкомпоновкиданных|таблицысхемызапроса|ы(?:websocketклиентсоединения|а(?:нализаданных|удиозаписи)|в(?:нешнегоподключенияработысречью|ы(?:бора(?:запускаприложениямобильногоустройства|компоновкиданных)|полнениякоманды))|д(?:иалогапо(?:лученияфайлов|мещенияфайлов)|оступ(?:а(?:внешнегохранилищадвоичныхданных)?|нойтаблицысхемызапроса))|зап(?:иси(?:json|xml|историиданных)|олненияприпереоткрытииформы)|к(?:ачествасканированиядокументов|о(?:лонкикластерногоанализа|мпоновкиданныхтаблицысхемызапроса))|м(?:акетат(?:абличногодокумента|екстовогодокумента)|о(?:делираспознаванияречи|нопольногорежима))|об(?:ластикомпоновкиданных|менаданными)|п(?:еретаскивания|о(?:дключениявнешнегохранилищадвоичныхданных|лученияархивафайлов|токовогораспознаванияречи)|ривязкикк(?:лючуполучениялицензий|омпьютеруполучениялицензий))|ре(?:гистрацииинформационнойбазысистемывзаимодействия|дактированиякомпоновкиданных)|с(?:еанса|канированиядокументов|оединениявнешнегоисточникаданных|хемыкомпоновкиданных)|таблицысхемызапроса|формированиякоманд(?:п(?:ланировщика|оля(?:ввода|планировщика))|системывзаимодействия)|чтенияxml))))|ер(?:е(?:водстрокиформатированногодокумента|ключатель|определениеxs|числ(?:енияменеджер|имыесвойстваобъектовметаданных))|иодотображенияпланировщика)|лан(?:глобальногопоиска|ировщик|обменассылка|ы(?:видов(?:расчетаменеджер|характеристикменеджер)|обменаменеджер|счетовменеджер))|о(?:дписькриптографии|казываемаяобластьгеографическойсхемы|л(?:е(?:htmlдокумента|pdfдокумента|xbase|анализаданных|в(?:вода|ыбора(?:компоновкиданныхсхемызапроса)?)|г(?:еографическойсхемы|р(?:афическойсхемы|уппировкикомпоновкиданных))|и(?:ндекса|тогасхемыкомпоновкиданных)|к(?:а(?:лендаря|ртинки)|омпоновкиданных)|на(?:бораданных(?:макетакомпоновкиданных|схемыкомпоновкиданных)|стройки)|областикомпоновкиданных|построителя(?:запроса|отчета)|с(?:водной(?:диаграммы|таблицы)|писка)|т(?:абличногодокумента|екстовогодокумента)|формы|элемента(?:блокировкиданных|составакопиибазыданных))?|и(?:гональныйобъектгеографическойсхемы|линейныйобъектгеографическойсхемы|тикапаролейпользователей)|ос(?:а(?:измерительнойдиаграммы|регулирования)|ыизмерительнойдиаграммы)|ьзователь(?:информационнойбазы|с(?:истемывзаимодействия|к(?:ие(?:настройкикомпоновкиданных|полякомпоновкиданных)|оеполевы(?:боркомпоновкиданных|ражениекомпоновкиданных))))|я(?:выборакомпоновкиданныхсхемызапроса|группировкикомпоновкиданных|итогасхемыкомпоновкиданных|колонкисхемызапроса|на(?:бораданных(?:макетакомпоновкиданных|схемыкомпоновкиданных)|стройки)|построителя(?:запроса|отчета)|схемызапроса|элемента(?:блокировкиданных|составакопиибазыданных)))|рядок(?:компоновкиданных)?|с(?:ледовательност(?:именеджер|ьxdto)|троитель(?:dom|запроса|отчета(?:анализаданных)?|схемxml))|ток(?:впамяти|обменаданными)?|чт(?:а|ов(?:ое(?:вложение|сообщение)|ы(?:е(?:адреса|вложения)|йадрес))))|р(?:авилоассоциации|е(?:дставлениенавигационнойссылки|образование(?:xsl|кканоническомуxml))|и(?:крепляемыеданныезапускаприложениямобильногоустройства|ложение(?:системывзаимодействия)?)|о(?:странствоименxpath|цессор(?:выводарезультатакомпоновкиданныхв(?:коллекциюзначений|табличныйдокумент)|компоновкиданных))|ямоугольникгеографическойсхемы)|устаязаписьndef)|р(?:а(?:з(?:делитель|решен(?:иекамерыустройства|н(?:аявнешняякомпонента|оевнешнееприложение|ый(?:comкласс|в(?:иртуальныйкаталог|нешниймодуль)|интернетресурс)))|ыменовательпространствименdom)|мка(?:группы)?|с(?:писание(?:регламентногозадания|элементапланировщика)|четсистемлинейныхуравнений|ширен(?:ие(?:конфигурации)?|ноеимяxml)))|е(?:г(?:и(?:ональныенастройки(?:информационнойбазы|сеанса)|стры(?:бухгалтериименеджер|накопленияменеджер|расчетаменеджер|сведенийменеджер))|ламентноезадание)|жим(?:использованияхранилищадвоичныхданных|размещениякопийданныхвхранилищедвоичныхданных|чтениязаписихранилищадвоичныхданных)|зультат(?:xpath|а(?:нализаданных(?:дереворешений|кластеризация|общаястатистика|поиск(?:ассоциаций|последовательностей))|синхвызовавнешнейкомпоненты)|выборадействиярасшифровкикомпоновкиданных|глобальногопоиска|зап(?:роса|ускаприложениямобильногоустройства)|отложенногораспознаванияречи|поискапорегулярномувыражению|р(?:аспознаванияречи|егистрацииинформационнойбазысистемывзаимодействия)|чтенияданных)|квизитформы|шениеанализаданных)|исуноктабличногодокумента|ол(?:ипользователя|ьполя(?:набораданныхкомпоновкиданных|схемызапроса))|яд(?:кнопокпанеликнопоксообщениясистемывзаимодействия|ыкнопокпанеликнопоксообщениясистемывзаимодействия))|с(?:в(?:о(?:дная(?:диаграмма|таблица)|йство(?:xdto|объектаанализаданных))|яз(?:и(?:дендрограммы|наборовданных(?:макетакомпоновкиданных|схемыкомпоновкиданных)|параметроввыборакомпоновкиданных)|ь(?:д(?:ендрограммы|иаграммыганта)|наборовданных(?:макетакомпоновкиданных|схемыкомпоновкиданных)|п(?:араметравыбора(?:компоновкиданных)?|отипу(?:компоновкиданных)?))))|е(?:анс(?:информационнойбазы)?|гмент(?:полилинейногообъектагеографическойсхемы|ыполилинейногообъектагеографическойсхемы)|кцияcdatadom|р(?:висыинтеграциименеджер|и(?:ализаторxdto|и(?:диаграммы(?:ганта)?|слоягеографическойсхемы)|яд(?:анныхслоягеографическойсхемы|иаграммы(?:ганта)?))|тификат(?:к(?:лиента(?:linux|macos|windows|ос|файл)|риптографии)|ыудостоверяющихцентров(?:linux|macos|windows|ос|файл))))|жатиеданных|истемнаяинформация|ло(?:вофразыраспознаванияречи|игеографическойсхемы|йгеографическойсхемы)|о(?:вместноеиспользованиеприложенийсистемывзаимодействия|единени(?:е(?:и(?:нформационнойбазы|сточниказапросасхемызапроса)|ссерверомсистемыаналитики)?|яисточниказапросасхемызапроса)|о(?:бщение(?:ndef|внешне(?:госайта|мусайту)|пользователю|с(?:ервисаинтеграции|истемывзаимодействия))|тветствие)|ст(?:ав(?:ко(?:манднойпанелиформынамобильномустройстве|пиибазыданных)|общегореквизита|планаобмена|табличногопространствабазыданных|ф(?:ормначальнойстраницы|ункциональнойопции)|хранимыхданныххранилищадвоичныхданных)|ояниеwebsocketсоединения)|четаниеклавиш)|п(?:исок(?:xdto|выборанавигационнойссылки|значений|компонентxs|пол(?:ей|нотекстовогопоиска)|расширенныхименxml|строкdom|узлов(?:dom|html)|элементовdom)|особ(?:pop3аутентификации|smtpаутентификации|аутентификации(?:пользователяинформационнойбазы|черезэлектроннуюпочту)|восстановленияпароляпользователяинформационнойбазы)|равочникименеджер)|р(?:авнение(?:значений|файлов)|едства(?:nfc|буфераобмена|геопозиционирования|криптографии|мультимедиа|почты|телефонии))|сылкана(?:сущностьdom|файл)|т(?:андартн(?:аядатаначала|оехранилищенастроек(?:выборка(?:настроекпоумолчанию)?|менеджер)|ы(?:епользователисистемывзаимодействия|йпериод))|иль|р(?:аниц(?:а(?:pdf|панели|сканированиядокументов)|ыпанели)|ок(?:а(?:группировкидинамическогосписка|д(?:еревазначений|инамическогосписка)|таблицы(?:значений|областикомпоновкиданных))?|идинамическогосписка)|уктура(?:настроеккомпоновкиданных)?))|ущностьdom|хема(?:xml|запроса|компоновкиданных|системыаналитики))|т(?:абли(?:ц(?:а(?:дляизменениясхемызапроса|значений|компоновкиданных|макетакомпоновкиданных|схемызапроса|формы)|ыдляизменениясхемызапроса)|чн(?:оеполе|ыйдокумент))|е(?:к(?:ст(?:dom|html|ов(?:аязаписьndef|ыйдокумент)|форматированногодокумента|ысообщени(?:йобошибках|яобошибке))|ущиеданныес(?:писка|труктурынастроеккомпоновкиданных))|ло(?:группировки(?:диаграммымакетакомпоновкиданных|таблицымакетакомпоновкиданных)|макетакомпоновкиданных)|стируем(?:ая(?:группа(?:командногоинтерфейса|формы)|декорацияформы|кнопка(?:командногоинтерфейса|формы)|таблицаформы|форма)|ое(?:дополнениеэлементаформы|окноклиентскогоприложения|п(?:олеформы|риложение))|ыйкомандныйинтерфейсокна))|ип(?:urlвнешнегохранилищадвоичныхданных|данныхxml|з(?:вонкасредствтелефонии|наченияxdto)|об(?:работкинастроеквторогофакторааутентификации|ъектаxdto)|подписикриптографии|хранилищадвоичныхданных)|о(?:кендоступа|ч(?:ечныйобъектгеографическойсхемы|к(?:адиаграммы(?:ганта)?|и(?:диаграммы(?:ганта)?|м(?:аршрута|ноготочечногообъектагеографическойсхемы))))))|у(?:далениеобъекта|зелдереварешений|никальныйидентификатор|словноеоформление(?:компоновкиданных)?|четнаязаписьк(?:алендарей|онтактов))|ф(?:а(?:брикаxdto|йл(?:овыйпоток)?|сет(?:xdto|длиныxs|количестваразрядовдробнойчастиxs|м(?:аксимально(?:го(?:включающегозначенияxs|исключающегозначенияxs)|йдлиныxs)|инимально(?:го(?:включающегозначенияxs|исключающегозначенияxs)|йдлиныxs))|об(?:разцаxs|щегоколичестваразрядовxs)|п(?:еречисленияxs|робельныхсимволовxs)))|и(?:ксированн(?:ая(?:коллекция|структура)|оесоответствие|ый(?:массив|списоккомпонентxs))|льтрузловdom)|ла(?:гиинтернетпочтовогосообщения|жок)|о(?:новоезадание|рма(?:клиентскогоприложения|т(?:ированн(?:аястрока|ыйдокумент)|строктабличногодокумента))?)|рагмент(?:xs|документаdom))|х(?:арактеристик(?:акомпоновкиданныхсхемызапроса|икомпоновкиданныхсхемызапроса)|ешированиеданных|ранилищ(?:анастроекменеджер|е(?:значения|сертификатовкриптографии)))|цвет|ч(?:исло|тение(?:fastinfoset|html|json|pdf|xml|zipфайла|данных|сообщенияобмена|текста|узловdom|файлаархива))|ш(?:аблон(?:настройкивторогофакторааутентификации|последовательностианализаданных|сообщениясистемывзаимодействия)|кала(?:времени|диаграммы)|рифт)|элемент(?:dom|html|zipфайла|аплетhtml|б(?:иблиотекимакетовоформлениякомпоновкиданных|лок(?:html|ировкиданных)|уфераобмена)|в(?:водаhtml|ставкаhtml)|гр(?:афическойсхемы(?:в(?:ложенныйбизнеспроцесс|ыборварианта)|де(?:йствие|кора(?:тивнаялиния|ция))|завершение|обработка|разделение|с(?:лияние|оединительнаялиния|тарт)|условие)|уппировкимакетакомпоновкиданных)|д(?:анныхконтакта(?:мгновенныесообщения)?|ендрограммы|ополнительныхданныхзапускаприложениямобильногоустройства)|заголовок(?:html|таблицыhtml)|и(?:з(?:бранногоработыпользователя|меренияпланировщика)|нформацииовыполненииобновленияконфигурациибазыданных|сторииработыпользователя)|к(?:артинкаhtml|нопкаhtml|олонкатаблицыhtml)|л(?:егендыгеографическойсхемы|инияhtml)|метаhtml|на(?:борфреймовhtml|стройки(?:оформления|составаинтерфейсаклиентскогоприложения))|о(?:б(?:ласти(?:макетаоформлениякомпоновкиданных|оформления)|ъектhtml)|тбора(?:компоновкиданных)?)|п(?:акетаотображаемыхдокументов|ла(?:вающийфреймhtml|н(?:аглобальногопоиска|ировщика))|орядка(?:компоновкиданных)?|рикрепляемыхданныхзапускаприложениямобильногоустройства)|р(?:а(?:зметкаhtml|сшифровкикомпоновкиданных(?:группировка|поля))|езультата(?:глобальногопоиска|компоновкиданных))|с(?:вязьhtml|криптhtml|остава(?:копиибазыданных|общегореквизита|планаобмена|табличногопространствабазыданных|функциональнойопции|хранимыхданныххранилищадвоичныхданных)|писка(?:значений|полнотекстовогопоиска)|трокатаблицыhtml)|т(?:аблицаhtml|елоhtml)|у(?:правления(?:интерфейсом|колонкамианализаданных|настройкой(?:настройкиоформления|областиоформления|условногооформления)|отбором|п(?:араметрамианализаданных|орядком))|словногооформления(?:компоновкиданных)?)|ф(?:а(?:йлаархива|ктическогопериодадействия)|орма(?:html|тированноготекстаhtml)|реймhtml)|шкалывремени|ы(?:zipфайла|графическойсхемы|дендрограммы|легендыгеографическойсхемы|макетаобластикомпоновкиданных|пакетаотображаемыхдокументов|расшифровкикомпоновкиданных|ф(?:айлаархива|ормы)|шкалывремени)|я(?:корьhtml|чейкатаблицыhtml))|ячейк(?:а(?:макета(?:заголовкаколлекциизначенийобластикомпоновкиданных|коллекциизначенийобластикомпоновкиданных)|таблицыобластикомпоновкиданных)|и(?:макета(?:заголовкаколлекциизначенийобластикомпоновкиданных|коллекциизначенийобластикомпоновкиданных)|таблицыобластикомпоновкиданных))))'
@@ -0,0 +1,208 @@
+"""Incremental re-lexing of a BSL document that is being edited.
+
+``IncrementalBslLexer`` keeps the tokens of one document together with the
+lexer state stack at every line start the lexer reached between two matches.
+An edit re-lexes the text from the last checkpoint that the edit cannot
+influence and stops as soon as the lexer reaches a line start after the edit
+with the same state stack as before; the tokens after that point are reused.
+
+The token stream is always the one ``BslLexer.get_tokens_unprocessed`` would
+return for the whole text, including multi-line states such as strings,
+embedded queries, localized strings and parameter lists::
+
+    document = IncrementalBslLexer(text)
+    start, stop = document.edit(offset, removed=3, inserted='Новый')
+    for pos, token, value in document.get_tokens_unprocessed(start, stop):
+        ...
+"""
+
+from bisect import bisect_right
+
+from .engine import iter_tokens, lexer_matchers
+from .lexer import BslLexer
+
+# Lookaheads of the BSL rules never cross more than this many non-blank lines
+# (``Имя`` / ``(`` / ``"Выполнить`` and ``|`` / ``en`` / ``=`` chains).
+LOOKAHEAD_LINES = 3
+
+
+def _line_start(text, index):
+    return text.rfind('\n', 0, index) + 1
+
+
+def _quote_horizon(text, quote):
+    """Return the position after the last character that the ``[^"]*`` and
+    ``(?:[^"]|"")*`` lookaheads of a string opened at ``quote`` can read."""
+    length = len(text)
+    pos = quote
+    while pos < length and text[pos] == '"':
+        pos += 1
+    while 1:
+        pos = text.find('"', pos)
+        if pos < 0:
+            return length
+        end = pos
+        while end < length and text[end] == '"':
+            end += 1
+        # doubled quotes are skipped by (?:[^"]|"")*, a lone one ends every scan
+        if (end - pos) % 2:
+            return end + 1
+        pos = end
+
+
+def restart_offset(text, offset):
+    """Return a line start before ``offset`` such that no token before it
+    depends on the text at ``offset`` or later."""
+    start = _line_start(text, offset)
+    lines = 0
+    pos = start
+    while pos > 0 and lines < LOOKAHEAD_LINES:
+        pos = _line_start(text, pos - 1)
+        if text[pos:text.find('\n', pos)].strip():
+            lines += 1
+    start = pos
+    while 1:
+        quote = text.rfind('"', 0, start)
+        if quote < 0 or _quote_horizon(text, quote) < offset:
+            return start
+        start = _line_start(text, quote)
+
+
+def lookahead_end(text, offset):
+    """Return an offset after ``offset`` such that no token before ``offset``
+    depends on the text at it or later."""
+    length = len(text)
+    end = offset
+    lines = 0
+    while end < length and lines <= LOOKAHEAD_LINES:
+        newline = text.find('\n', end)
+        line_end = length if newline < 0 else newline + 1
+        if text[end:line_end].strip():
+            lines += 1
+        end = line_end
+    quote = text.rfind('"', 0, offset)
+    if quote >= 0:
+        end = max(end, min(_quote_horizon(text, quote) + 1, length))
+    return end
+
+
+class IncrementalBslLexer:
+    """Tokens of one BSL document, updated in place by ``edit()``.
+
+    Takes the options of ``BslLexer``. Token positions are offsets into
+    ``text``; the stream equals ``BslLexer(**options).get_tokens_unprocessed(text)``
+    unless ``text`` is longer than the ``fast_mode_above`` option.
+    """
+
+    lexer_class = BslLexer
+
+    def __init__(self, text='', **options):
+        # the ``fast`` mode applies, ``fast_mode_above`` does not: edits would
+        # switch the tables of the whole document back and forth
+        self.lexer = self.lexer_class(**options)._lexer_for('')
+        self._matchers = lexer_matchers(self.lexer)
+        self.text = ''
+        # one segment per checkpoint: start offset, state stack at the start,
+        # tokens up to the next checkpoint with offsets relative to the start
+        self._starts = []
+        self._stacks = []
+        self._tokens = []
+        self.set_text(text)
+
+    def set_text(self, text):
+        """Replace the whole document and lex it from scratch."""
+        self.text = text
+        self._starts, self._stacks, self._tokens = self._lex(0, ('root',))[:3]
+
+    def _lex(self, pos, stack, converge=None):
+        """Lex ``self.text`` from the checkpoint ``(pos, stack)``.
+
+        ``converge(start, stack)`` is asked at every new checkpoint after the
+        first one; when it returns true lexing stops there. Returns the new
+        segments and the offset where lexing stopped (``None`` at the end).
+        """
+        text = self.text
+        checkpoints = []
+        starts, stacks, tokens = [], [], []
+        seen = 0
+        current = None
+        base = pos
+        for token in iter_tokens(self.lexer, text, self._matchers, stack, pos, checkpoints):
+            while seen < len(checkpoints):
+                base, stack = checkpoints[seen]
+                seen += 1
+                if converge is not None and starts and converge(base, stack):
+                    return starts, stacks, tokens, base
+                current = []
+                starts.append(base)
+                stacks.append(stack)
+                tokens.append(current)
+            current.append((token[0] - base, token[1], token[2]))
+        for base, stack in checkpoints[seen:]:
+            if converge is not None and starts and converge(base, stack):
+                return starts, stacks, tokens, base
+            starts.append(base)
+            stacks.append(stack)
+            tokens.append([])
+        return starts, stacks, tokens, None
+
+    def edit(self, offset, removed=0, inserted=''):
+        """Replace ``removed`` characters at ``offset`` with ``inserted``.
+
+        Returns ``(start, stop)``, the span of the new text whose tokens were
+        re-lexed; tokens outside of it are unchanged apart from their offsets.
+        """
+        old_text = self.text
+        end = offset + removed
+        if offset < 0 or removed < 0 or end > len(old_text):
+            raise ValueError(f'edit {offset}:{end} is outside of the text (length {len(old_text)})')
+        delta = len(inserted) - removed
+        restart = restart_offset(old_text, offset)
+        first = bisect_right(self._starts, restart) - 1
+        self.text = old_text[:offset] + inserted + old_text[end:]
+
+        old_starts, old_stacks = self._starts, self._stacks
+        index = first
+
+        def converge(start, stack):
+            nonlocal index
+            if start < offset + len(inserted):
+                return False
+            while index < len(old_starts) and old_starts[index] + delta < start:
+                index += 1
+            return (
+                index < len(old_starts)
+                and old_starts[index] + delta == start
+                and old_stacks[index] == stack
+            )
+
+        starts, stacks, tokens, stop = self._lex(old_starts[first], old_stacks[first], converge)
+        if stop is None:
+            index = len(old_starts)
+            stop = len(self.text)
+        self._starts = old_starts[:first] + starts + [start + delta for start in old_starts[index:]]
+        self._stacks = old_stacks[:first] + stacks + old_stacks[index:]
+        self._tokens = self._tokens[:first] + tokens + self._tokens[index:]
+        return starts[0], stop
+
+    def get_tokens_unprocessed(self, start=0, stop=None):
+        """Yield ``(offset, tokentype, value)`` for the tokens that start in
+        ``[start, stop)``; the whole document by default."""
+        if stop is None:
+            stop = len(self.text)
+        first = max(bisect_right(self._starts, start) - 1, 0)
+        for segment in range(first, len(self._starts)):
+            base = self._starts[segment]
+            if base >= stop:
+                return
+            for pos, token, value in self._tokens[segment]:
+                pos += base
+                if pos >= stop:
+                    return
+                if pos >= start:
+                    yield pos, token, value
+
+    @property
+    def line_states(self):
+        """``(offset, state stack)`` of every checkpoint, in text order."""
+        return list(zip(self._starts, self._stacks))
@@ -1,22 +1,26 @@
-from pygments.lexer import RegexLexer, words, bygroups, using, default, include
+from pygments.lexer import RegexLexer, words, default, include
 from pygments.token import Token
+from pygments.util import get_choice_opt, get_int_opt
 
 from functools import lru_cache
 import re
 import copy
 
+from .engine import EngineMixin, SpanAction, TokenAction, bygroups
+from .literals import CONSTRAINT, LOCALE, LOCALE_KEY_PATTERN, QUERY, LinePattern, StringStart
 from .generated_data import (
     ENUM_PROPERTY_NAMES,
     GLOBAL_METHOD_NAMES,
     GLOBAL_PROPERTY_NAMES,
     TYPE_NAMES,
 )
+from . import generated_patterns
 
 PREFIX_NO_DOT = r'(?<!\.)'
 SUFFIX_WORD = r'\b'
 SUFFIX_CALL = r'(?=(\s?[\(]))'
 IDENT = r'[A-Za-zА-Яа-яЁё_][\wа-яё0-9_]*'
-IDENT_RE = re.compile(r'^' + IDENT + r'$', re.IGNORECASE)
+IDENT_RE = re.compile(IDENT, re.IGNORECASE)
 IZ_OF_KEYWORD = r'(?:[Ии]з|Of)'  # Matches Russian "из" and English "Of"
 
 @lru_cache(maxsize=4096)
@@ -26,12 +30,57 @@ def _casefold(text):
 def _casefold_set(items):
     return {_casefold(item) for item in items}
 
+class _NameTable(dict):
+    """``{casefolded name: (token, call_token)}`` of a name rule.
+
+    ``tokens(name)`` remembers the pair by the name as written: a module
+    repeats a few thousand distinct names, each is casefolded and looked up
+    once rather than on every occurrence.
+    """
+
+    # names as written kept per table, a new batch starts when it is full
+    WRITTEN_NAMES = 65536
+
+    def __init__(self, items, default):
+        super().__init__(items)
+        self.default = default
+        self._written = {}
+
+    def tokens(self, name):
+        tokens = self._written.get(name)
+        if tokens is None:
+            if len(self._written) >= self.WRITTEN_NAMES:
+                self._written.clear()
+            tokens = self._written[name] = self.get(_casefold(name), self.default)
+        return tokens
+
+def _name_table(groups, default):
+    """Build the ``_NameTable`` of a name rule.
+
+    ``groups`` are ``(names, token, call_token)`` in the order the names are
+    checked, ``None`` leaves the name to the next group; names of no group
+    get ``default``.
+    """
+    table = {}
+    for names, token, call_token in groups:
+        for name in names:
+            found = table.get(name, (None, None))
+            table[name] = (
+                token if found[0] is None else found[0],
+                call_token if found[1] is None else found[1],
+            )
+    return _NameTable(
+        (
+            (name, (default[0] if token is None else token, default[1] if call_token is None else call_token))
+            for name, (token, call_token) in table.items()
+        ),
+        default,
+    )
+
+_CALL_RE = re.compile(r'\s*\(')
+
 def _is_call(text, end_pos):
-    pos = end_pos
-    length = len(text)
-    while pos < length and text[pos].isspace():
-        pos += 1
-    return pos < length and text[pos] == '('
+    return _CALL_RE.match(text, end_pos) is not None
 
 def _call_has_args(text, end_pos):
     pos = end_pos
@@ -45,324 +94,349 @@ def _call_has_args(text, end_pos):
         pos += 1
     return pos < length and text[pos] != ')'
 
-def _bsl_name_callback(lexer, match):
-    name = match.group(0)
-    name_cf = _casefold(name)
-    is_call = _is_call(match.string, match.end())
-
-    if name_cf in lexer._bsl_exception_names:
-        yield match.start(), Token.Name.Exception, name
-        return
-
-    if name_cf in lexer._bsl_keyword_as_function and is_call:
-        yield match.start(), Token.Name.Builtin, name
-        return
-
-    if name_cf in lexer._bsl_call_only_builtins:
-        yield match.start(), (Token.Name.Builtin if is_call else Token.Name.Variable), name
-        return
-
-    if name_cf in lexer._bsl_keyword_declaration:
-        yield match.start(), Token.Keyword.Declaration, name
-        return
-
-    if name_cf in lexer._bsl_keyword_constant:
-        yield match.start(), Token.Keyword.Constant, name
-        return
-
-    if name_cf in lexer._bsl_keyword:
-        yield match.start(), Token.Keyword, name
-        return
-
-    if name_cf in lexer._bsl_name_builtin:
-        yield match.start(), Token.Name.Builtin, name
-        return
-
-    if name_cf in lexer._bsl_name_class:
-        yield match.start(), Token.Name.Class, name
-        return
+_BSL_OTHER_NAME = (Token.Name.Variable, Token.Name.Function)
+_SDBL_OTHER_NAME = (Token.Name.Variable, Token.Name.Variable)
 
-    yield match.start(), (Token.Name.Function if is_call else Token.Name.Variable), name
+def _name_token(match, table):
+    token, call_token = table.tokens(match.group())
+    # only the names highlighted differently when called look for the bracket
+    if token is not call_token and _is_call(match.string, match.end()):
+        return call_token
+    return token
 
-def _sdbl_name_callback(lexer, match):
-    name = match.group(0)
-    name_cf = _casefold(name)
-    is_call = _is_call(match.string, match.end())
+def _bsl_name_token(lexer, match):
+    return _name_token(match, lexer._bsl_names)
 
-    if name_cf in lexer._sdbl_function_call and is_call:
-        yield match.start(), Token.Name.Builtin, name
-        return
+def _sdbl_name_token(lexer, match):
+    return _name_token(match, lexer._sdbl_names)
 
-    if name_cf in lexer._sdbl_keyword_constant:
-        yield match.start(), Token.Keyword.Constant, name
-        return
+def _constraint_name_token(lexer, match):
+    return _name_token(match, lexer._acl_names)
 
-    if name_cf in lexer._sdbl_keyword_declaration:
-        yield match.start(), Token.Keyword.Declaration, name
-        return
+_bsl_name_callback = TokenAction(_bsl_name_token)
+_sdbl_name_callback = TokenAction(_sdbl_name_token)
+_constraint_name_callback = TokenAction(_constraint_name_token)
 
-    if name_cf in lexer._sdbl_name_class:
-        yield match.start(), Token.Name.Class, name
-        return
+_INFO_REGISTER_RE = re.compile('РегистрСведений', re.IGNORECASE)
 
-    yield match.start(), Token.Name.Variable, name
-
-def _constraint_name_callback(lexer, match):
-    name = match.group(0)
-    name_cf = _casefold(name)
-    is_call = _is_call(match.string, match.end())
-
-    if name_cf in lexer._acl_function_call and is_call:
-        yield match.start(), Token.Name.Builtin, name
-        return
-
-    if name_cf in lexer._acl_keyword_constant:
-        yield match.start(), Token.Keyword.Constant, name
-        return
-
-    if name_cf in lexer._acl_keyword_declaration:
-        yield match.start(), Token.Keyword.Declaration, name
-        return
-
-    if name_cf in lexer._acl_name_class:
-        yield match.start(), Token.Name.Class, name
-        return
-
-    yield match.start(), Token.Name.Variable, name
-
-def _sdbl_metadata_callback(lexer, match):
-    text = match.group(0)
-    parts = text.split('.')
-    pos = match.start()
-    has_error = False
-
-    root = parts[0]
-    root_cf = _casefold(root)
-    is_call = _is_call(match.string, match.end())
-    has_args = _call_has_args(match.string, match.end())
+def _sdbl_metadata_spans(lexer, match):
+    text = match.string
+    start, end = match.span()
+    dot = text.find('.', start, end)
+    is_call = _is_call(text, end)
 
     root_token = Token.Name.Namespace
-    if root_cf == _casefold('РегистрСведений') and len(parts) >= 3 and is_call and has_args:
+    if (
+        is_call
+        and text.find('.', dot + 1, end) >= 0
+        and _INFO_REGISTER_RE.fullmatch(text, start, dot)
+        and _call_has_args(text, end)
+    ):
         root_token = Token.Name.Class
+    yield start, dot, root_token
 
-    yield pos, root_token, root
-    pos += len(root)
-
-    for idx, segment in enumerate(parts[1:], start=1):
-        yield pos, Token.Operator, '.'
+    has_error = False
+    pos = dot
+    while pos < end:
+        yield pos, pos + 1, Token.Operator
         pos += 1
-
-        if IDENT_RE.fullmatch(segment):
-            if idx == len(parts) - 1 and is_call:
+        segment_end = text.find('.', pos, end)
+        if segment_end < 0:
+            segment_end = end
+        if IDENT_RE.fullmatch(text, pos, segment_end):
+            if segment_end == end and is_call:
                 seg_token = Token.Name.Function
             elif has_error:
                 seg_token = Token.Name.Variable
             else:
                 seg_token = Token.Name.Class
-            yield pos, seg_token, segment
         else:
-            yield pos, Token.Generic.Error, segment
+            seg_token = Token.Generic.Error
             has_error = True
-        pos += len(segment)
-
-def _locale_assignment_callback(lexer, match):
-    yield match.start(), Token.Name.Attribute, match.group(1)
-    if match.group(2):
-        yield match.start(2), Token.String, match.group(2)
-    yield match.start(3), Token.Operator, match.group(3)
-
-def _locale_single_quote_callback(lexer, match):
-    yield match.start(), Token.String.Escape, "'"
-    if match.group(1):
-        content = match.group(1)
-        start = match.start(1)
-        pos = 0
-        for item in re.finditer(r'""|%\d|%%|%[A-Za-zА-Яа-яЁё_]', content):
-            if item.start() > pos:
-                yield start + pos, Token.String, content[pos:item.start()]
-            token = Token.String.Interpol
-            if item.group(0) in ('""', '%%'):
-                token = Token.String.Escape
-            elif re.match(r'%[A-Za-zА-Яа-яЁё_]', item.group(0)):
-                token = Token.Generic.Error
-            yield start + item.start(), token, item.group(0)
-            pos = item.end()
-        if pos < len(content):
-            yield start + pos, Token.String, content[pos:]
-    yield match.start() + len(match.group(0)) - 1, Token.String.Escape, "'"
-
-def _locale_error_pipe_line_callback(lexer, match):
-    pipe_match = re.match(r'\n([^\S\n]*)(\|)(.*)', match.group(0))
+        yield pos, segment_end, seg_token
+        pos = segment_end
+
+_sdbl_metadata_callback = SpanAction(_sdbl_metadata_spans)
+
+def _locale_assignment_spans(lexer, match):
+    yield match.start(1), match.end(1), Token.Name.Attribute
+    start, end = match.span(2)
+    if start < end:
+        yield start, end, Token.String
+    yield match.start(3), match.end(3), Token.Operator
+
+_locale_assignment_callback = SpanAction(_locale_assignment_spans)
+
+# escapes match no group; named alternatives at the top level would keep the
+# regex engine from skipping to the next quote or percent sign
+_LOCALE_QUOTE_PART_RE = re.compile(r'""|%(?:(?P<interpol>\d)|(?P<error>[A-Za-zА-Яа-яЁё_])|%)')
+_LOCALE_QUOTE_PART_TOKENS = {
+    None: Token.String.Escape,
+    'interpol': Token.String.Interpol,
+    'error': Token.Generic.Error,
+}
+
+def _locale_single_quote_spans(lexer, match):
+    start, end = match.span()
+    yield start, start + 1, Token.String.Escape
+    pos, content_end = match.span(1)
+    if pos < content_end:
+        for item in _LOCALE_QUOTE_PART_RE.finditer(match.string, pos, content_end):
+            item_start, item_end = item.span()
+            if item_start > pos:
+                yield pos, item_start, Token.String
+            yield item_start, item_end, _LOCALE_QUOTE_PART_TOKENS[item.lastgroup]
+            pos = item_end
+        if pos < content_end:
+            yield pos, content_end, Token.String
+    yield end - 1, end, Token.String.Escape
+
+_locale_single_quote_callback = SpanAction(_locale_single_quote_spans)
+
+_PIPE_LINE_RE = re.compile(r'\n([^\S\n]*)(\|)(.*)')
+
+def _pipe_line_spans(text, start, end):
+    """Spans of a ``\\n |...`` continuation line whose rest is an error."""
+    pipe_match = _PIPE_LINE_RE.match(text, start, end)
     if not pipe_match:
-        yield match.start(), Token.Generic.Error, match.group(0)
+        yield start, end, Token.Generic.Error
         return
-    yield match.start(), Token.Text, '\n'
-    if pipe_match.group(1):
-        yield match.start() + 1, Token.Text, pipe_match.group(1)
-    yield match.start() + 1 + len(pipe_match.group(1)), Token.String, pipe_match.group(2)
-    rest = pipe_match.group(3)
-    if rest:
-        yield match.start() + 1 + len(pipe_match.group(1)) + 1, Token.Generic.Error, rest
-
-def _locale_missing_open_quote_callback(lexer, match):
-    yield match.start(1), Token.Generic.Error, match.group(1)
-    yield match.start(2), Token.String, match.group(2)
-
-def _locale_missing_semicolon_callback(lexer, match):
-    yield match.start(1), Token.Name.Attribute, match.group(1)
-    if match.group(2):
-        yield match.start(2), Token.String, match.group(2)
-    yield match.start(3), Token.Operator, match.group(3)
-    if match.group(4):
-        yield match.start(4), Token.String, match.group(4)
-    yield match.start(4) + len(match.group(4)), Token.String.Escape, "'"
-    if match.group(5):
-        yield match.start(5), Token.String, match.group(5)
-    yield match.start(5) + len(match.group(5)), Token.String.Escape, "'"
-    error = f"{match.group(6)}{match.group(7)}"
-    if error:
-        yield match.start(6), Token.Generic.Error, error
-
-def _locale_extra_quote_callback(lexer, match):
-    yield match.start(1), Token.Name.Attribute, match.group(1)
-    if match.group(2):
-        yield match.start(2), Token.String, match.group(2)
-    yield match.start(3), Token.Operator, match.group(3)
-    if match.group(4):
-        yield match.start(4), Token.String, match.group(4)
-    yield match.start(4) + len(match.group(4)), Token.String.Escape, "'"
-    if match.group(5):
-        yield match.start(5), Token.String, match.group(5)
-    yield match.start(5) + len(match.group(5)), Token.String.Escape, "'"
-    error = f"{match.group(6)}{match.group(7)}"
-    if error:
-        yield match.start(6), Token.Generic.Error, error
-
-def _locale_missing_semicolon_pipe_callback(lexer, match):
-    yield match.start(1), Token.Name.Attribute, match.group(1)
-    if match.group(2):
-        yield match.start(2), Token.String, match.group(2)
-    yield match.start(3), Token.Operator, match.group(3)
-    if match.group(4):
-        yield match.start(4), Token.String, match.group(4)
-    yield match.start(4) + len(match.group(4)), Token.String.Escape, "'"
-    if match.group(5):
-        yield match.start(5), Token.String, match.group(5)
-    yield match.start(5) + len(match.group(5)), Token.String.Escape, "'"
-    error = match.group(6)
-    if error:
-        pipe_match = re.match(r'\n([^\S\n]*)(\|)(.*)', error)
-        if pipe_match:
-            yield match.start(6), Token.Text, '\n'
-            if pipe_match.group(1):
-                yield match.start(6) + 1, Token.Text, pipe_match.group(1)
-            yield match.start(6) + 1 + len(pipe_match.group(1)), Token.String, pipe_match.group(2)
-            rest = pipe_match.group(3)
-            if rest:
-                yield match.start(6) + 1 + len(pipe_match.group(1)) + 1, Token.Generic.Error, rest
-        else:
-            yield match.start(6), Token.Generic.Error, error
-
-def _doc_type_list_with_iz_callback(lexer, match):
-    yield match.start(1), Token.Comment.Single, match.group(1)
-    yield match.start(2), Token.Punctuation, match.group(2)
-
-    type_list = match.group(3)
-    type_list_start = match.start(3)
-    for item in re.finditer(
-        r'[A-Za-zА-Яа-яЁё_][\wа-яё0-9_]*(?:\.[A-Za-zА-Яа-яЁё_][\wа-яё0-9_]*)*'
-        r'|\b(?:[Ии]з|Of)\b|,\s*|\s+',
-        type_list,
-    ):
-        value = item.group(0)
-        if value.lower() in ('из', 'of'):
-            token = Token.Keyword
-        elif value.startswith(',') or value.isspace():
-            token = Token.Punctuation
-        else:
-            token = Token.Name.Class
-        yield type_list_start + item.start(), token, value
-
-    yield match.start(4), Token.Punctuation, match.group(4)
-    yield match.start(5), Token.Comment.Single, match.group(5)
-
-def _emit_doc_type_list(type_list, type_list_start):
-    for item in re.finditer(
-        r'[A-Za-zА-Яа-яЁё_][\wа-яё0-9_]*(?:\.[A-Za-zА-Яа-яЁё_][\wа-яё0-9_]*)*'
-        r'|,\s*|\s+',
-        type_list,
-    ):
-        value = item.group(0)
-        if value.startswith(',') or value.isspace():
+    yield start, start + 1, Token.Text
+    indent_start, indent_end = pipe_match.span(1)
+    if indent_start < indent_end:
+        yield indent_start, indent_end, Token.Text
+    yield pipe_match.start(2), pipe_match.end(2), Token.String
+    rest_start, rest_end = pipe_match.span(3)
+    if rest_start < rest_end:
+        yield rest_start, rest_end, Token.Generic.Error
+
+def _locale_error_pipe_line_spans(lexer, match):
+    return _pipe_line_spans(match.string, match.start(), match.end())
+
+_locale_error_pipe_line_callback = SpanAction(_locale_error_pipe_line_spans)
+
+def _locale_missing_open_quote_spans(lexer, match):
+    yield match.start(1), match.end(1), Token.Generic.Error
+    yield match.start(2), match.end(2), Token.String
+
+_locale_missing_open_quote_callback = SpanAction(_locale_missing_open_quote_spans)
+
+def _locale_value_spans(match):
+    """Spans of ``key = 'value'`` in groups 1-5 of the locale error rules."""
+    yield match.start(1), match.end(1), Token.Name.Attribute
+    start, end = match.span(2)
+    if start < end:
+        yield start, end, Token.String
+    yield match.start(3), match.end(3), Token.Operator
+    start, end = match.span(4)
+    if start < end:
+        yield start, end, Token.String
+    yield end, end + 1, Token.String.Escape
+    start, end = match.span(5)
+    if start < end:
+        yield start, end, Token.String
+    yield end, end + 1, Token.String.Escape
+
+def _locale_value_error_spans(lexer, match):
+    yield from _locale_value_spans(match)
+    # the separator or quote after the value and the rest of the line
+    start = match.start(6)
+    end = match.end(7)
+    if start < end:
+        yield start, end, Token.Generic.Error
+
+_locale_missing_semicolon_callback = SpanAction(_locale_value_error_spans)
+_locale_extra_quote_callback = SpanAction(_locale_value_error_spans)
+
+def _locale_missing_semicolon_pipe_spans(lexer, match):
+    yield from _locale_value_spans(match)
+    start, end = match.span(6)
+    if start < end:
+        yield from _pipe_line_spans(match.string, start, end)
+
+_locale_missing_semicolon_pipe_callback = SpanAction(_locale_missing_semicolon_pipe_spans)
+
+_DOC_TYPE_NAME = r'[A-Za-zА-Яа-яЁё_][\wа-яё0-9_]*(?:\.[A-Za-zА-Яа-яЁё_][\wа-яё0-9_]*)*'
+_DOC_TYPE_ITEM_RE = re.compile(rf'(?P<name>{_DOC_TYPE_NAME})|(?P<punctuation>,\s*|\s+)')
+_DOC_TYPE_ITEM_WITH_IZ_RE = re.compile(
+    rf'(?P<name>{_DOC_TYPE_NAME})|(?P<keyword>\b(?:[Ии]з|Of)\b)|(?P<punctuation>,\s*|\s+)'
+)
+_DOC_TYPE_NAME_WITH_IZ_RE = re.compile(rf'(?P<name>{_DOC_TYPE_NAME})|(?P<keyword>\b(?:[Ии]з|Of)\b)')
+_DOC_TYPE_NAMES_RE = re.compile(rf'{_DOC_TYPE_NAME}\s*')
+_IZ_OF_RE = re.compile(r'из|of', re.IGNORECASE)
+
+def _doc_type_list_spans(text, start, end, items=_DOC_TYPE_ITEM_RE):
+    for item in items.finditer(text, start, end):
+        item_start, item_end = item.span()
+        kind = item.lastgroup
+        if kind == 'punctuation':
             token = Token.Punctuation
-        elif value.lower() in ('из', 'of'):
+        elif kind == 'keyword' or _IZ_OF_RE.fullmatch(text, item_start, item_end):
             token = Token.Keyword
         else:
             token = Token.Name.Class
-        yield type_list_start + item.start(), token, value
-
-def _doc_type_list_or_desc_callback(lexer, match):
-    yield match.start(1), Token.Comment.Single, match.group(1)
-    yield match.start(2), Token.Name.Class, match.group(2)
-    yield match.start(3), Token.Punctuation, match.group(3)
-    rest = match.group(4)
+        yield item_start, item_end, token
+
+def _doc_type_list_with_iz_spans(lexer, match):
+    yield match.start(1), match.end(1), Token.Comment.Single
+    yield match.start(2), match.end(2), Token.Punctuation
+    yield from _doc_type_list_spans(match.string, match.start(3), match.end(3), _DOC_TYPE_ITEM_WITH_IZ_RE)
+    yield match.start(4), match.end(4), Token.Punctuation
+    yield match.start(5), match.end(5), Token.Comment.Single
+
+_doc_type_list_with_iz_callback = SpanAction(_doc_type_list_with_iz_spans)
+
+def _doc_type_list_or_desc_spans(lexer, match):
+    text = match.string
+    yield match.start(1), match.end(1), Token.Comment.Single
+    type_start, type_end = match.span(2)
+    yield type_start, type_end, Token.Name.Class
+    yield match.start(3), match.end(3), Token.Punctuation
+    rest_start, rest_end = match.span(4)
     if (
-        '.' not in match.group(2)
+        text.find('.', type_start, type_end) < 0
         and match.group(2) in lexer._bsl_name_class
-        and re.match(
-            r'^[A-Za-zА-Яа-яЁё_][\wа-яё0-9_]*(?:\.[A-Za-zА-Яа-яЁё_][\wа-яё0-9_]*)*\s*$',
-            rest,
-        )
+        and _DOC_TYPE_NAMES_RE.fullmatch(text, rest_start, rest_end)
     ):
-        yield from _emit_doc_type_list(rest, match.start(4))
+        yield from _doc_type_list_spans(text, rest_start, rest_end)
     else:
-        yield match.start(4), Token.Comment.Single, rest
+        yield rest_start, rest_end, Token.Comment.Single
 
-def _doc_param_name_type_list_eol_callback(lexer, match):
-    yield match.start(1), Token.Comment.Single, match.group(1)
-    left = match.group(2)
-    left_cf = left.casefold()
+_doc_type_list_or_desc_callback = SpanAction(_doc_type_list_or_desc_spans)
+
+def _doc_param_name_type_list_eol_spans(lexer, match):
+    yield match.start(1), match.end(1), Token.Comment.Single
+    left_cf = match.group(2).casefold()
     if left_cf in lexer._bsl_name_class or left_cf in lexer._bsl_call_only_builtins:
-        yield match.start(2), Token.Name.Class, left
-        yield match.start(3), Token.Punctuation, match.group(3)
-        yield match.start(4), Token.Comment.Single, match.group(4)
+        yield match.start(2), match.end(2), Token.Name.Class
+        yield match.start(3), match.end(3), Token.Punctuation
+        yield match.start(4), match.end(4), Token.Comment.Single
         return
-    right = match.group(4)
-    yield match.start(2), Token.Name.Variable, left
-    yield match.start(3), Token.Punctuation, match.group(3)
-    yield from _emit_doc_type_list(right, match.start(4))
-
-def _doc_type_list_after_name_callback(lexer, match):
-    yield match.start(1), Token.Comment.Single, match.group(1)
-    yield match.start(2), Token.Name.Variable, match.group(2)
-    yield match.start(3), Token.Punctuation, match.group(3)
-    yield from _emit_doc_type_list(match.group(4), match.start(4))
-    yield match.start(5), Token.Punctuation, match.group(5)
-    yield match.start(6), Token.Comment.Single, match.group(6)
-
-def _doc_type_list_bullet_callback(lexer, match):
-    yield match.start(1), Token.Comment.Single, match.group(1)
-    yield match.start(2), Token.Punctuation, match.group(2)
-    yield from _emit_doc_type_list(match.group(3), match.start(3))
-    yield match.start(4), Token.Punctuation, match.group(4)
-    yield match.start(5), Token.Comment.Single, match.group(5)
-
-def _doc_type_list_bullet_with_iz_colon_callback(lexer, match):
-    yield match.start(1), Token.Comment.Single, match.group(1)
-    yield match.start(2), Token.Punctuation, match.group(2)
-    yield match.start(3), Token.Name.Variable, match.group(3)
-    yield match.start(4), Token.Punctuation, match.group(4)
-    type_list = match.group(5)
-    type_list_start = match.start(5)
-    for item in re.finditer(
-        r'[A-Za-zА-Яа-яЁё_][\wа-яё0-9_]*(?:\.[A-Za-zА-Яа-яЁё_][\wа-яё0-9_]*)*'
-        r'|\b(?:[Ии]з|Of)\b',
-        type_list,
-    ):
-        value = item.group(0)
-        token = Token.Keyword if value.lower() in ('из', 'of') else Token.Name.Class
-        yield type_list_start + item.start(), token, value
-    yield match.start(6), Token.Punctuation, match.group(6)
+    yield match.start(2), match.end(2), Token.Name.Variable
+    yield match.start(3), match.end(3), Token.Punctuation
+    yield from _doc_type_list_spans(match.string, match.start(4), match.end(4))
+
+_doc_param_name_type_list_eol_callback = SpanAction(_doc_param_name_type_list_eol_spans)
+
+def _doc_type_list_after_name_spans(lexer, match):
+    yield match.start(1), match.end(1), Token.Comment.Single
+    yield match.start(2), match.end(2), Token.Name.Variable
+    yield match.start(3), match.end(3), Token.Punctuation
+    yield from _doc_type_list_spans(match.string, match.start(4), match.end(4))
+    yield match.start(5), match.end(5), Token.Punctuation
+    yield match.start(6), match.end(6), Token.Comment.Single
+
+_doc_type_list_after_name_callback = SpanAction(_doc_type_list_after_name_spans)
+
+def _doc_type_list_bullet_spans(lexer, match):
+    yield match.start(1), match.end(1), Token.Comment.Single
+    yield match.start(2), match.end(2), Token.Punctuation
+    yield from _doc_type_list_spans(match.string, match.start(3), match.end(3))
+    yield match.start(4), match.end(4), Token.Punctuation
+    yield match.start(5), match.end(5), Token.Comment.Single
+
+_doc_type_list_bullet_callback = SpanAction(_doc_type_list_bullet_spans)
+
+def _doc_type_list_bullet_with_iz_colon_spans(lexer, match):
+    yield match.start(1), match.end(1), Token.Comment.Single
+    yield match.start(2), match.end(2), Token.Punctuation
+    yield match.start(3), match.end(3), Token.Name.Variable
+    yield match.start(4), match.end(4), Token.Punctuation
+    yield from _doc_type_list_spans(match.string, match.start(5), match.end(5), _DOC_TYPE_NAME_WITH_IZ_RE)
+    yield match.start(6), match.end(6), Token.Punctuation
+
+_doc_type_list_bullet_with_iz_colon_callback = SpanAction(_doc_type_list_bullet_with_iz_colon_spans)
+
+# Parts of a query/constraint string literal: ``|//`` comments (after the
+# indentation of a line), ``//`` comments, ``""`` escapes and runs of code,
+# whitespace and line breaks for the embedded lexer.
+_EMBEDDED_PIPE_COMMENT = r'\|//(?:[^"\n]|"")*(?=\n|")'
+_EMBEDDED_CODE_PART = (
+    r'(?P<pipe>[^\S\n]*' + _EMBEDDED_PIPE_COMMENT + r')'
+    r'|(?P<comment>//[^\n]*)'
+    r'|(?P<escape>"")'
+    r'|(?P<code>(?:[^"/\n]|/(?!/)|\n(?![^\S\n]*' + _EMBEDDED_PIPE_COMMENT + r'))+)'
+    r'|(?P<newline>\n)'
+)
+EMBEDDED_CODE_PATTERN = r'(?:' + _EMBEDDED_CODE_PART + r')+'
+_EMBEDDED_CODE_PART_RE = re.compile(_EMBEDDED_CODE_PART)
+# a token of the embedded lexer that runs over a line break is cut like the
+# string lines: line break, indentation, the rest
+_EMBEDDED_LINE_PIECE_RE = re.compile(r'(?P<text>\n|(?<=\n)[^\S\n]+)|[^\n]+')
+
+def _embedded_lexer(lexer, lexer_cls):
+    """Return the ``lexer_cls`` instance for code embedded in ``lexer``'s
+    strings, created once per host lexer with its options."""
+    embedded = lexer.__dict__.setdefault('_embedded_lexers', {})
+    sub_lexer = embedded.get(lexer_cls)
+    if sub_lexer is None:
+        # the host already caches the whole document and keeps the time budget
+        sub_lexer = embedded[lexer_cls] = lexer_cls(**{**lexer.options, 'token_cache': False, 'time_budget_ms': 0})
+    return sub_lexer
+
+def _embedded_code(get_lexer_class):
+    """Callback for the body of a string literal with embedded code.
+
+    The code of all lines is lexed in one go, so the embedded lexer keeps its
+    state and lookaheads across the ``|`` continuation lines. It sees the
+    comments and ``""`` escapes of the host string as blanks; those keep
+    their string tokens and the code tokens are cut at them.
+    """
+    def callback(lexer, match):
+        text = match.string
+        start, end = match.span()
+        if text.find('//', start, end) < 0 and text.find('""', start, end) < 0:
+            parts = [(start, end, 'code')]
+            code = match.group()
+        else:
+            parts = []
+            blanked = []
+            for part in _EMBEDDED_CODE_PART_RE.finditer(text, start):
+                part_start, part_end = part.span()
+                if part_start >= end:
+                    break
+                kind = part.lastgroup
+                parts.append((part_start, part_end, kind))
+                blanked.append(text[part_start:part_end] if kind in ('code', 'newline') else ' ' * (part_end - part_start))
+            code = ''.join(blanked)
+
+        tokens = list(_embedded_lexer(lexer, get_lexer_class()).get_token_spans(code))
+        index = 0
+        for pos, part_end, kind in parts:
+            if kind == 'code':
+                fragment_start = pos - start
+                fragment_end = part_end - start
+                while index < len(tokens):
+                    token_pos, token_end, token_type = tokens[index]
+                    if token_end <= fragment_start:
+                        index += 1
+                        continue
+                    if token_pos >= fragment_end:
+                        break
+                    # a blank run next to the code is cut to the fragment
+                    piece_start = start + max(token_pos, fragment_start)
+                    piece_end = start + min(token_end, fragment_end)
+                    if piece_end - piece_start > 1 and text.find('\n', piece_start, piece_end) >= 0:
+                        for piece in _EMBEDDED_LINE_PIECE_RE.finditer(text, piece_start, piece_end):
+                            yield piece.start(), piece.end(), Token.Text if piece.lastgroup else token_type
+                    else:
+                        yield piece_start, piece_end, token_type
+                    if token_end > fragment_end:
+                        break
+                    index += 1
+            elif kind == 'pipe':
+                bar = text.find('|', pos, part_end)
+                if bar > pos:
+                    yield pos, bar, Token.Text
+                yield bar, bar + 1, Token.Literal.String
+                yield bar + 1, part_end, Token.Comment.Single
+            elif kind == 'comment':
+                yield pos, part_end, Token.Comment.Single
+            elif kind == 'escape':
+                yield pos, part_end, Token.Literal.String.Escape
+            else:
+                yield pos, part_end, Token.Text
+    return SpanAction(callback)
 
 CALL_ONLY_BUILTINS = {
     'Булево','Boolean','Число','Number','Строка','String','Дата','Date',
@@ -371,7 +445,7 @@ CONSTANT_NAMES = (
     'Неопределено','Undefined','Истина','True','Ложь','False','NULL'
 )
 
-class BslLexer(RegexLexer):
+class BslLexer(EngineMixin, RegexLexer):
     name = '1C (BSL) Lexer'
     aliases = ['bsl', 'os']
     filenames = ['*.bsl', '*.os']
@@ -430,25 +504,16 @@ class BslLexer(RegexLexer):
         'Новый','New',
     )
 
+    # a parameter default that is a name, not a literal
+    PARAM_DEFAULT_ERROR = r'(\b[A-Za-zА-Яа-яёЁ_][\wа-яё0-9_]*\b)(\s*)(=)(\s*)(?!Неопределено\b|Undefined\b|Null\b|Истина\b|True\b|Ложь\b|False\b)([A-Za-zА-Яа-яёЁ_][\wа-яё0-9_]*)'
+    # the doc comment rules that the fast mode keeps
+    TODO_COMMENT = r'(\/\/\s*)(TODO:)(.*)'
+    MRG_COMMENT = r'(\/\/\s*)(\{\{|\}\})(MRG)(\[[^\]]*\])(.*)'
+    DOC_PLAIN_COMMENT = r'\/\/.*?(?=\n|$)'
     EXECUTE_STRING_CALL = r'(?<!\.)\b(Выполнить|Execute)\b(?=\s*\(\s*"Выполнить)'
-    QUERY_STRING_START = r'"(?=[^"]*\b(ВЫБРАТЬ|SELECT)\b)(?![^"]*(?:\r?\n)\#(?:Удаление|КонецУдаления|Delete|EndDelete))'
-    CONSTRAINT_STRING_START = (
-        r'"(?=[^"]*\b(?:'
-        r'РазрешитьЧтениеИзменение|AllowReadUpdate|'
-        r'РазрешитьЧтение|AllowRead|'
-        r'РазрешитьИзменениеЕслиРазрешеноЧтение|AllowUpdateIfReadingAllowed|'
-        r'ПрисоединитьДополнительныеТаблицы|AttachAdditionalTables|'
-        r'ЗначениеРазрешено|ValueAllowed|'
-        r'ЧтениеОбъектаРазрешено|ObjectReadingAllowed|'
-        r'ИзменениеОбъектаРазрешено|ObjectUpdateAllowed|'
-        r'ЧтениеСпискаРазрешено|ListReadingAllowed|'
-        r'ИзменениеСпискаРазрешено|ListUpdateAllowed|'
-        r'ПравоДоступа|AccessRight|'
-        r'РольДоступна|RoleAvailable'
-        r')\b)'
-        r'(?![^"]*(?:\r?\n)\#(?:Удаление|КонецУдаления|Delete|EndDelete))'
-    )
-    LOCALE_KEY_PATTERN = r'[a-z]{2,3}'
+    QUERY_STRING_START = StringStart(QUERY)
+    CONSTRAINT_STRING_START = StringStart(CONSTRAINT)
+    LOCALE_STRING_START = StringStart(LOCALE)
     _ODD_LOCALE_QUOTES_LOOKAHEAD = (
         r'(?=(?:[^\n\']*\'[^\n\']*\')*[^\n\']*\'[^\n\']*(?=\n|(?<!")"(?!")))'
     )
@@ -481,13 +546,10 @@ class BslLexer(RegexLexer):
         r'\'([^\n\']*)\'(\n[^\S\n]*\|[^\n"]*)'
     )
 
-    TYPE_NAME_PATTERN = r'(?:' + '|'.join(re.escape(n) for n in TYPE_NAMES) + r')'
-    DOC_TYPE_NAMES = tuple(dict.fromkeys(TYPE_NAMES + tuple(CALL_ONLY_BUILTINS) + (
-        'Булево','Число','Строка','Дата','Массив','ТаблицаЗначений','Структура','Соответствие',
-        'ПланОбменаСсылка','ДанныеФормыСтруктура','КомпоновщикНастроекКомпоновкиДанных',
-        'Boolean','Number','String','Date',
-    )))
-    DOC_TYPE_PATTERN = r'(?:' + '|'.join(re.escape(n) for n in DOC_TYPE_NAMES) + r')'
+    # prefix tries over the names, built by tools/generate_data.py
+    TYPE_NAME_PATTERN = generated_patterns.TYPE_NAME_PATTERN
+    DOC_TYPE_NAMES = tuple(dict.fromkeys(TYPE_NAMES + generated_patterns.DOC_TYPE_EXTRA_NAMES))
+    DOC_TYPE_PATTERN = generated_patterns.DOC_TYPE_PATTERN
     DOC_TYPE_LIST_PATTERN = (
         r'[A-Za-zА-Яа-яЁё_][\wа-яё0-9_]*'
         r'(?:\.[A-Za-zА-Яа-яЁё_][\wа-яё0-9_]*)*'
@@ -617,8 +679,40 @@ class BslLexer(RegexLexer):
     _bsl_call_only_builtins = _casefold_set(CALL_ONLY_BUILTINS)
     _bsl_name_builtin = _casefold_set(_NAME_BUILTIN_WORDS)
     _bsl_name_class = _casefold_set(_NAME_CLASS_WORDS)
+    _bsl_names = _name_table([
+        (_bsl_exception_names, Token.Name.Exception, Token.Name.Exception),
+        (_bsl_keyword_as_function, None, Token.Name.Builtin),
+        (_bsl_call_only_builtins, Token.Name.Variable, Token.Name.Builtin),
+        (_bsl_keyword_declaration, Token.Keyword.Declaration, Token.Keyword.Declaration),
+        (_bsl_keyword_constant, Token.Keyword.Constant, Token.Keyword.Constant),
+        (_bsl_keyword, Token.Keyword, Token.Keyword),
+        (_bsl_name_builtin, Token.Name.Builtin, Token.Name.Builtin),
+        (_bsl_name_class, Token.Name.Class, Token.Name.Class),
+    ], _BSL_OTHER_NAME)
     _bsl_keyword_constant_pattern = words(CONSTANT_NAMES, prefix=PREFIX_NO_DOT, suffix=SUFFIX_WORD)
 
+    @classmethod
+    def _process_regex(cls, regex, rflags, state):
+        if isinstance(regex, (StringStart, LinePattern)):
+            return regex.compile(rflags).match
+        return super()._process_regex(regex, rflags, state)
+
+    def __init__(self, **options):
+        super().__init__(**options)
+        self.mode = get_choice_opt(options, 'mode', ['full', 'fast'], 'full')
+        self.fast_mode_above = get_int_opt(options, 'fast_mode_above', 0)
+
+    def _lexer_for(self, text):
+        """Return the lexer for ``text``: ``self``, or a ``BslFastLexer`` with
+        the same options in the ``fast`` mode and for texts longer than
+        ``fast_mode_above`` characters."""
+        if self.mode == 'full' and not 0 < self.fast_mode_above < len(text):
+            return self
+        fast = self.__dict__.get('_fast_lexer')
+        if fast is None:
+            fast = self._fast_lexer = BslFastLexer(**self.options)
+        return fast
+
     tokens = {
         'preproc_root': [
             (r'\#(Использовать|Use)\b', Token.Comment.Preproc, 'preproc_use'),
@@ -628,7 +722,7 @@ class BslLexer(RegexLexer):
             (r'\#(Иначе|Else|КонецЕсли|EndIf|Область|Region|КонецОбласти|EndRegion|Вставка|Insert|КонецВставки|EndInsert|Удаление|Delete|КонецУдаления|EndDelete)\b.*', Token.Comment.Preproc),
         ],
         'string_locale_start': [
-            (r'"(?=(?:[^"]|"")*\b' + LOCALE_KEY_PATTERN + r'\b\s*=)', Token.String, 'string_locale_first_line'),
+            (LOCALE_STRING_START, Token.String, 'string_locale_first_line'),
         ],
         'doc_comment': [
             (r'(\/\/\s*)(СМ\.|SEE)(\s+)([A-Za-zА-Яа-яЁё_][\wа-яё0-9_]*(?:\.[A-Za-zА-Яа-яЁё_][\wа-яё0-9_]*)*)(\s*)(\()(.*?)(\))',
@@ -709,11 +803,11 @@ class BslLexer(RegexLexer):
              bygroups(Token.Comment.Single, Token.Punctuation, Token.Name.Class)),
             (r'(\/\/\s*)([A-Za-zА-Яа-яЁё_][\wа-яё0-9_]*)(\s+(?:-|–)\s+)(.*)',
              bygroups(Token.Comment.Single, Token.Name.Class, Token.Punctuation, Token.Comment.Single)),
-            (r'(\/\/\s*)(TODO:)(.*)',
+            (TODO_COMMENT,
              bygroups(Token.Comment.Single, Token.Keyword, Token.Comment.Single)),
-            (r'(\/\/\s*)(\{\{|\}\})(MRG)(\[[^\]]*\])(.*)',
+            (MRG_COMMENT,
              bygroups(Token.Comment.Single, Token.Punctuation, Token.Keyword, Token.Punctuation, Token.Comment.Single)),
-            (r'\/\/.*?(?=\n|$)', Token.Comment.Single),
+            (DOC_PLAIN_COMMENT, Token.Comment.Single),
         ],
         'root': [
             (r'\ufeff', Token.Text),
@@ -796,20 +890,17 @@ class BslLexer(RegexLexer):
              _locale_missing_semicolon_pipe_callback, 'string_locale_error_pipe_pop'),
             (_LOCALE_MISSING_SEMICOLON_FIRST_PATTERN, _locale_missing_semicolon_callback, 'string_locale_error_missing_semicolon'),
             (_LOCALE_EXTRA_QUOTE_FIRST_PATTERN, _locale_extra_quote_callback, 'string_locale_error_pipe_strict'),
-            (r'(?![^\n]*;)[^\n"]+(?=\n[^\S\n]*\|\s*' + LOCALE_KEY_PATTERN + r'\b\s*=)',
+            (LinePattern(r'[^\n"]+(?=\n[^\S\n]*\|\s*' + LOCALE_KEY_PATTERN + r'\b\s*=)', semicolon=False),
              Token.Generic.Error, 'string_locale_error_pipe_pop'),
             (r'(?<=\n)[^\n"]+(?=\n[^\S\n]*\|\s*' + LOCALE_KEY_PATTERN + r'\b\s*=)',
              Token.Generic.Error, 'string_locale_error_pipe_pop'),
-            (r'(?=[^\n]*\b' + LOCALE_KEY_PATTERN + r'\b\s*=)' +
-             _ODD_LOCALE_QUOTES_LOOKAHEAD +
-             r'(?![^\n;]*\n[^\S\n]*\|)([^\n"]+)(")',
+            # the rest of the line is checked once per line, not at every token
+            (LinePattern(r'(?![^\n;]*\n[^\S\n]*\|)([^\n"]+)(")', key=True, odd_quotes=True),
              _locale_missing_open_quote_callback, '#pop'),
-            (r'(?=[^\n]*\b' + LOCALE_KEY_PATTERN + r'\b\s*=)' +
-             _ODD_LOCALE_QUOTES_LOOKAHEAD +
-             r'(?![^\n\']*\'[^\n\']*\')' +
-             r'(?![^\n;]*\n[^\S\n]*\|)[^\n"]+(?=\n|")',
-             Token.Generic.Error, 'string_locale_error'),
-            (r'(?![^\n]*;)(?!' + _ODD_LOCALE_QUOTES_LOOKAHEAD + r')[^\n"]+(?=\n)',
+            (LinePattern(
+                r'(?![^\n\']*\'[^\n\']*\')(?![^\n;]*\n[^\S\n]*\|)[^\n"]+(?=\n|")', key=True, odd_quotes=True,
+            ), Token.Generic.Error, 'string_locale_error'),
+            (LinePattern(r'[^\n"]+(?=\n)', semicolon=False, odd_quotes=False),
              Token.Generic.Error, 'string_locale_error'),
             (r'\r\n?|\n', Token.Text, ('#pop', 'string_locale')),
             (r'(?<=\n)[^\S\n]+', Token.Text),
@@ -938,30 +1029,18 @@ class BslLexer(RegexLexer):
             (r'\r\n?|\n', Token.Text, '#pop'),
             (r'[^\S\n]+', Token.Text),
             (QUERY_STRING_START, Token.Literal.String, ('#pop', 'query_string')),
-            (r'"(?=(?:[^"]|"")*\b' + LOCALE_KEY_PATTERN + r'\b\s*=)', Token.String, ('#pop', 'string_locale_first_line')),
+            (LOCALE_STRING_START, Token.String, ('#pop', 'string_locale_first_line')),
             (r'"', Token.String, ('#pop', 'string_after_assign')),
             default('#pop'),
         ],
         'query_string': [
-            (r'[^\S\n]+', Token.Text),
-            (r'(\|)(//(?:[^"\n]|\"\")*(?=\n|"))',
-             bygroups(Token.Literal.String, Token.Comment.Single)),
-            (r'//[^\n]*', Token.Comment.Single),
-            (r'""', Token.Literal.String.Escape),
+            # Delay the class lookup to avoid forward reference issues
+            (EMBEDDED_CODE_PATTERN, _embedded_code(lambda: SdblQueryLexer)),
             (r'"', Token.Literal.String, '#pop'),
-            # Delay instantiation to avoid forward reference issues and keep formatter options
-            (r'\n', Token.Text),
-            (r'(?:[^"/\n]|/(?!/))+', using(lambda **kwargs: SdblQueryLexer(**kwargs))),
         ],
         'constraint_string': [
-            (r'[^\S\n]+', Token.Text),
-            (r'(\|)(//(?:[^"\n]|\"\")*(?=\n|"))',
-             bygroups(Token.Literal.String, Token.Comment.Single)),
-            (r'//[^\n]*', Token.Comment.Single),
-            (r'""', Token.Literal.String.Escape),
+            (EMBEDDED_CODE_PATTERN, _embedded_code(lambda: ConstraintLogicLexer)),
             (r'"', Token.Literal.String, '#pop'),
-            (r'\n', Token.Text),
-            (r'(?:[^"/\n]|/(?!/))+', using(lambda **kwargs: ConstraintLogicLexer(**kwargs))),
         ],
         'decorator_params': [
             (r'\)', Token.Punctuation, '#pop'),
@@ -970,7 +1049,7 @@ class BslLexer(RegexLexer):
             (r',', Token.Operator),
             (r'=', Token.Operator),
             (r'"[^"]*"', Token.Literal.String),
-            (r'(\b[A-Za-zА-Яа-яёЁ_][\wа-яё0-9_]*\b)(\s*)(=)(\s*)(?!Неопределено\b|Undefined\b|Null\b|Истина\b|True\b|Ложь\b|False\b)([A-Za-zА-Яа-яёЁ_][\wа-яё0-9_]*)',
+            (PARAM_DEFAULT_ERROR,
              bygroups(Token.Name.Variable, Token.Text, Token.Operator, Token.Text, Token.Generic.Error)),
             (r'([A-Za-zА-Яа-яёЁ_][\wа-яё0-9_]*)', Token.Name.Variable),
             (r'\b\d+\.?\d*\b', Token.Literal.Number),
@@ -988,7 +1067,7 @@ class BslLexer(RegexLexer):
             (r'\&[^\s,(]+', Token.Name.Decorator),
             (r'\bЗнач\b|\bVal\b', Token.Keyword),
             (_bsl_keyword_constant_pattern, Token.Keyword.Constant),
-            (r'(\b[A-Za-zА-Яа-яёЁ_][\wа-яё0-9_]*\b)(\s*)(=)(\s*)(?!Неопределено\b|Undefined\b|Null\b|Истина\b|True\b|Ложь\b|False\b)([A-Za-zА-Яа-яёЁ_][\wа-яё0-9_]*)',
+            (PARAM_DEFAULT_ERROR,
              bygroups(Token.Name.Variable, Token.Text, Token.Operator, Token.Text, Token.Generic.Error)),
             (r'([A-Za-zА-Яа-яёЁ_][\wа-яё0-9_]*)', Token.Name.Variable),
             (r'=', Token.Operator),
@@ -1001,9 +1080,73 @@ class BslLexer(RegexLexer):
     }
 
 
+# states of BslLexer that BslFastLexer goes without, with the rules entering them
+_FAST_DROPPED_STATES = frozenset({
+    'string_locale_start', 'string_locale_first_line', 'string_locale',
+    'string_locale_error', 'string_locale_error_missing_semicolon',
+    'string_locale_error_pipe_pop', 'string_locale_error_pipe_strict',
+    'string_locale_single_quote', 'query_string', 'constraint_string',
+    'decorator_params',
+})
+
+
+def _enters_dropped_state(rule):
+    if isinstance(rule, include):
+        targets = (rule,)
+    elif isinstance(rule, tuple) and len(rule) > 2:
+        targets = (rule[2],) if isinstance(rule[2], str) else rule[2]
+    else:
+        targets = ()
+    return any(target in _FAST_DROPPED_STATES for target in targets)
+
+
+def _fast_tokens(tokens):
+    """Return the token definitions of ``BslFastLexer`` made from ``tokens``."""
+    fast = {}
+    for state, rules in tokens.items():
+        if state in _FAST_DROPPED_STATES:
+            continue
+        fast[state] = [
+            rule for rule in rules
+            if not _enters_dropped_state(rule)
+            and not (isinstance(rule, tuple) and rule[0] == BslLexer.PARAM_DEFAULT_ERROR)
+        ]
+    # doc comments keep their TODO and MRG markers, the rest is plain comment
+    kept = (BslLexer.TODO_COMMENT, BslLexer.MRG_COMMENT, BslLexer.DOC_PLAIN_COMMENT)
+    fast['doc_comment'] = [rule for rule in fast['doc_comment'] if rule[0] in kept]
+    return fast
+
+
+class BslFastLexer(BslLexer):
+    """``BslLexer`` without the refinements that cost the most on very large
+    modules: the doc comment markup, the validation of ``НСтр`` strings, the
+    SDBL code of query strings and the parameter default checks.
+
+    Keywords, names, strings, comments, numbers and the preprocessor are
+    lexed as in ``BslLexer``; query, access restriction and localized
+    strings come out as plain strings, doc comments as plain comments.
+    ``BslLexer`` lexes with it in the ``fast`` mode.
+    """
+    name = '1C (BSL) Fast Lexer'
+    aliases = []
+    filenames = []
+
+    tokens = _fast_tokens(BslLexer.tokens)
+
+    @classmethod
+    def get_tokendefs(cls):
+        # RegexLexer would add the dropped states back from BslLexer.tokens
+        return cls.tokens
+
+    def __init__(self, **options):
+        super().__init__(**options)
+        self.mode = 'fast'
+
+    def _lexer_for(self, text):
+        return self
 
 
-class SdblLexer(RegexLexer):
+class SdblLexer(EngineMixin, RegexLexer):
     name = '1C (SDBL) Lexer'
     aliases = ['sdbl']
     filenames = ['*.sdbl']
@@ -1174,6 +1317,12 @@ class SdblLexer(RegexLexer):
     _sdbl_keyword_constant = _casefold_set(_KEYWORD_CONSTANT_WORDS)
     _sdbl_function_call = _casefold_set(_FUNCTION_CALL_SINGLE)
     _sdbl_name_class = _casefold_set(_NAME_CLASS_WORDS)
+    _sdbl_names = _name_table([
+        (_sdbl_function_call, None, Token.Name.Builtin),
+        (_sdbl_keyword_constant, Token.Keyword.Constant, Token.Keyword.Constant),
+        (_sdbl_keyword_declaration, Token.Keyword.Declaration, Token.Keyword.Declaration),
+        (_sdbl_name_class, Token.Name.Class, Token.Name.Class),
+    ], _SDBL_OTHER_NAME)
 
     tokens = {
         'root': [
@@ -1247,9 +1396,11 @@ class SdblQueryLexer(SdblLexer):
         if len(rule) >= 2 and rule[0] == r'\|' and rule[1] == Token.Generic.Error:
             _root_rules[idx] = (r'\|', Token.Literal.String)
             break
+    # the whole query is lexed at once, a cast may go on after a line break
+    tokens['cast_params'].insert(0, (r'\|', Token.Literal.String))
 
 
-class ConstraintLogicLexer(RegexLexer):
+class ConstraintLogicLexer(EngineMixin, RegexLexer):
     name = '1C (Access Rights Logic) Lexer'
     aliases = []
     filenames = []
@@ -1328,6 +1479,12 @@ class ConstraintLogicLexer(RegexLexer):
     _acl_keyword_constant = _casefold_set(_KEYWORD_CONSTANT_WORDS)
     _acl_function_call = _casefold_set(_FUNCTION_CALL_SINGLE)
     _acl_name_class = _casefold_set(SdblLexer._NAME_CLASS_WORDS)
+    _acl_names = _name_table([
+        (_acl_function_call, None, Token.Name.Builtin),
+        (_acl_keyword_constant, Token.Keyword.Constant, Token.Keyword.Constant),
+        (_acl_keyword_declaration, Token.Keyword.Declaration, Token.Keyword.Declaration),
+        (_acl_name_class, Token.Name.Class, Token.Name.Class),
+    ], _SDBL_OTHER_NAME)
 
     tokens = {
         'root': [
@@ -0,0 +1,224 @@
+"""Highlighting a range of lines of a long BSL module.
+
+A source browser shows a few hundred lines of a module at a time. A
+``LineIndex`` keeps the lexer state stack at a line start every
+``INDEX_EVERY`` lines, found in one pass over the text; ``highlight_lines``
+lexes from the last checkpoint before the first requested line, so showing
+the end of a module costs as much as showing its start::
+
+    html = highlight_lines(text, 25000, 25199, HtmlFormatter())
+
+Indexes are stored in ``<cache dir>/lines`` under the key of the token stream
+cache (text hash, lexer class, options, package version), so the pass over
+the text is made once per module version. When the directory grows over
+``PYGMENTS_BSL_LINE_INDEX_SIZE`` megabytes (default 16) the least recently
+used indexes are removed; ``PYGMENTS_BSL_NO_CACHE`` turns the store off.
+"""
+
+import marshal
+import os
+from array import array
+from bisect import bisect_right
+
+from pygments import format
+
+from .engine import iter_tokens, lexer_matchers
+from .lexer import BslLexer
+from .precompiled import cache_dir, enabled
+from .tokencache import cache_key, evict_files
+
+# lines between checkpoints: lexing a range starts at most this far before it
+INDEX_EVERY = 200
+FORMAT = 1
+DEFAULT_SIZE_MB = 16
+
+_TYPECODE = 'I' if array('I').itemsize >= 4 else 'L'
+
+
+def directory():
+    return cache_dir() / 'lines'
+
+
+def size_limit():
+    try:
+        return int(float(os.environ.get('PYGMENTS_BSL_LINE_INDEX_SIZE') or DEFAULT_SIZE_MB) * 1024 * 1024)
+    except ValueError:
+        return DEFAULT_SIZE_MB * 1024 * 1024
+
+
+def _line_offset(text, pos, count):
+    """Return the start of the line ``count`` lines after the one at ``pos``."""
+    for _ in range(count):
+        newline = text.find('\n', pos)
+        if newline < 0:
+            return len(text)
+        pos = newline + 1
+    return pos
+
+
+class LineIndex:
+    """Checkpoints ``(line, offset, stack)`` of one text, lines count from 1.
+
+    A checkpoint is the first line start at or after every ``every``-th line
+    where the lexer stands between two matches; ``offset`` indexes the text.
+    """
+
+    def __init__(self, every, lines, offsets, stacks):
+        self.every = every
+        self.lines = lines
+        self.offsets = offsets
+        self.stacks = stacks
+
+    def __len__(self):
+        return len(self.lines)
+
+    @classmethod
+    def build(cls, lexer, text, every=INDEX_EVERY):
+        """Lex ``text`` once with ``lexer`` and collect its checkpoints."""
+        lines = array(_TYPECODE)
+        offsets = array(_TYPECODE)
+        stacks = []
+        checkpoints = []
+        state = [1, 0, 1]  # line, its offset, next line to keep
+
+        def collect():
+            line, counted, wanted = state
+            for pos, stack in checkpoints:
+                line += text.count('\n', counted, pos)
+                counted = pos
+                if line >= wanted:
+                    lines.append(line)
+                    offsets.append(pos)
+                    stacks.append(stack)
+                    wanted = line - (line - 1) % every + every
+            state[:] = line, counted, wanted
+            checkpoints.clear()
+
+        for _ in iter_tokens(lexer, text, lexer_matchers(lexer), ('root',), 0, checkpoints):
+            if checkpoints:
+                collect()
+        collect()
+        return cls(every, lines, offsets, stacks)
+
+    def checkpoint(self, line):
+        """Return the last checkpoint ``(line, offset, stack)`` at or before ``line``."""
+        index = bisect_right(self.lines, line) - 1
+        return self.lines[index], self.offsets[index], self.stacks[index]
+
+    def dumps(self):
+        table = {}
+        indexes = array(_TYPECODE, (table.setdefault(stack, len(table)) for stack in self.stacks))
+        return marshal.dumps((
+            FORMAT, self.every, self.lines.tobytes(), self.offsets.tobytes(), tuple(table), indexes.tobytes(),
+        ))
+
+    @classmethod
+    def loads(cls, data):
+        version, every, lines_data, offsets_data, table, indexes_data = marshal.loads(data)
+        if version != FORMAT:
+            raise ValueError(f'line index format {version!r}')
+        lines = array(_TYPECODE)
+        lines.frombytes(lines_data)
+        offsets = array(_TYPECODE)
+        offsets.frombytes(offsets_data)
+        indexes = array(_TYPECODE)
+        indexes.frombytes(indexes_data)
+        if not len(lines) == len(offsets) == len(indexes) or not lines or max(indexes) >= len(table):
+            raise ValueError('line index entry is damaged')
+        return cls(every, lines, offsets, [table[index] for index in indexes])
+
+
+def load(key):
+    path = directory() / f'{key}.lines'
+    try:
+        index = LineIndex.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # truncated or foreign entry: drop it and build it again
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return index
+
+
+def store(key, index):
+    folder = directory()
+    path = folder / f'{key}.lines'
+    tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    try:
+        folder.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(index.dumps())
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        return
+    evict()
+
+
+def evict(limit=None):
+    """Remove the least recently used indexes until they fit ``limit`` bytes."""
+    evict_files(directory(), '.lines', size_limit() if limit is None else limit)
+
+
+def clear():
+    evict(0)
+
+
+def line_index(text, every=INDEX_EVERY, **options):
+    """Return the ``LineIndex`` of ``text`` for ``BslLexer(**options)``: the
+    stored one, or a new one that is stored for the next call."""
+    lexer = BslLexer(**options)
+    if not enabled():
+        return LineIndex.build(lexer._lexer_for(text), text, every)
+    key = f'{cache_key(lexer, text)}-{every}'
+    index = load(key)
+    if index is None:
+        index = LineIndex.build(lexer._lexer_for(text), text, every)
+        store(key, index)
+    return index
+
+
+def iter_line_tokens(text, start, end, index=None, **options):
+    """Yield ``(offset, tokentype, value)`` for lines ``start`` to ``end`` of
+    ``text``, both included and counted from 1.
+
+    Tokens are those of ``BslLexer(**options).get_tokens_unprocessed(text)``
+    cut to the lines. ``index`` is the ``LineIndex`` of the text, looked up
+    with ``line_index`` when not given.
+    """
+    if start < 1:
+        raise ValueError(f'line {start} is before the first line')
+    if index is None:
+        index = line_index(text, **options)
+    lexer = BslLexer(**options)._lexer_for(text)
+    line, pos, stack = index.checkpoint(start)
+    first = _line_offset(text, pos, start - line)
+    last = _line_offset(text, first, end - start + 1)
+    if first >= last:
+        return
+    for offset, token, value in iter_tokens(lexer, text, lexer_matchers(lexer), stack, pos):
+        if offset >= last:
+            return
+        if offset + len(value) <= first:
+            continue
+        if offset < first or offset + len(value) > last:
+            value = value[max(first - offset, 0):last - offset]
+            offset = max(offset, first)
+        yield offset, token, value
+
+
+def highlight_lines(text, start, end, formatter, outfile=None, index=None, **options):
+    """Format lines ``start`` to ``end`` of ``text`` (counted from 1, both
+    included) with ``formatter``, like ``pygments.highlight`` formats a text."""
+    tokens = ((token, value) for _, token, value in iter_line_tokens(text, start, end, index, **options))
+    return format(tokens, formatter, outfile)
@@ -0,0 +1,254 @@
+"""Classification of the string literals of a BSL text.
+
+Whether a ``"`` opens an embedded query, an access restriction text, a
+localized string (``НСтр("ru = '...'")``) or a plain string only depends on
+the text after it. Instead of one lookahead per rule, which rescans the
+literal for the constraint, the query and the locale rule in turn, the
+``StringStart`` rules look the quote up in the ``StringIndex`` of the text:
+every literal is classified once, with one bounded search per property, the
+first time a rule asks for it. The engines ``hold`` the index of a text for
+as long as their token iterator runs, nothing is kept after it.
+
+The error rules of a localized string line ask about the rest of the line
+at every token of it: is there a ``;``, a ``key =``, an odd number of ``'``
+before its end. ``LinePattern`` rules take the answers from the
+``LineFacts`` of the line, one scan per line instead of one per token.
+"""
+
+import re
+import threading
+from bisect import bisect_left
+
+QUERY = 1
+CONSTRAINT = 2
+LOCALE = 4
+PLAIN = 0
+
+QUERY_WORDS = ('ВЫБРАТЬ', 'SELECT')
+CONSTRAINT_WORDS = (
+    'РазрешитьЧтениеИзменение', 'AllowReadUpdate',
+    'РазрешитьЧтение', 'AllowRead',
+    'РазрешитьИзменениеЕслиРазрешеноЧтение', 'AllowUpdateIfReadingAllowed',
+    'ПрисоединитьДополнительныеТаблицы', 'AttachAdditionalTables',
+    'ЗначениеРазрешено', 'ValueAllowed',
+    'ЧтениеОбъектаРазрешено', 'ObjectReadingAllowed',
+    'ИзменениеОбъектаРазрешено', 'ObjectUpdateAllowed',
+    'ЧтениеСпискаРазрешено', 'ListReadingAllowed',
+    'ИзменениеСпискаРазрешено', 'ListUpdateAllowed',
+    'ПравоДоступа', 'AccessRight',
+    'РольДоступна', 'RoleAvailable',
+)
+LOCALE_KEY_PATTERN = r'[a-z]{2,3}'
+
+_FLAGS = re.MULTILINE | re.IGNORECASE
+# the query and constraint words are searched up to the next quote
+_WORDS = re.compile(
+    r'\b(?:(?P<query>' + '|'.join(QUERY_WORDS) + r')|(?P<constraint>' + '|'.join(CONSTRAINT_WORDS) + r'))\b',
+    _FLAGS,
+)
+_LOWER_WORDS = tuple(word.lower() for word in QUERY_WORDS + CONSTRAINT_WORDS)
+# characters that IGNORECASE matches to a letter of the words although their
+# lower() differs: a literal with one of them goes straight to the regex
+_CASE_FOLDS = re.compile('[İıſ\u1c80-\u1c86]')
+_DELETED = re.compile(r'(?:\r?\n)\#(?:Удаление|КонецУдаления|Delete|EndDelete)', _FLAGS)
+# the locale keys up to the end of the literal, over "" escapes
+_LOCALE_KEY = re.compile(r'\b' + LOCALE_KEY_PATTERN + r'\b\s*=', _FLAGS)
+_QUOTE = re.compile('"')
+_KEY_WORD = re.compile(r'\b' + LOCALE_KEY_PATTERN + r'\b', _FLAGS)
+_KEY_ASSIGNMENT = re.compile(r'\s*=')
+_SINGLE_QUOTE = re.compile("'")
+# where an odd run of single quotes may end: a line end or a lone "
+_LONE_QUOTE = re.compile(r'(?<!")"(?!")')
+
+# id(text) -> [text, index, runs] for the texts being lexed right now
+_held = {}
+_held_lock = threading.Lock()
+
+
+def classify(text, quote):
+    """Return the ``QUERY | CONSTRAINT | LOCALE`` bits of the literal opened
+    by the ``"`` at ``quote``."""
+    length = len(text)
+    start = quote + 1
+    end = text.find('"', start)
+    if end < 0:
+        end = length
+    kind = PLAIN
+    lowered = text[start:end].lower()
+    if any(word in lowered for word in _LOWER_WORDS) or _CASE_FOLDS.search(text, start, end):
+        for word in _WORDS.finditer(text, start, end):
+            kind |= QUERY if word.lastgroup == 'query' else CONSTRAINT
+            if kind == QUERY | CONSTRAINT:
+                break
+        if kind and _DELETED.search(text, start, end):
+            kind = PLAIN
+    while end < length - 1 and text[end + 1] == '"':
+        end = text.find('"', end + 2)
+        if end < 0:
+            end = length
+    if text.find('=', start, end) >= 0 and _LOCALE_KEY.search(text, start, end):
+        kind |= LOCALE
+    return kind
+
+
+class LineFacts:
+    """What the rest of one line holds, for any position of the line.
+
+    The line runs from ``start`` up to ``end``, its line break or the end of
+    the text.
+    """
+
+    def __init__(self, text, start):
+        end = text.find('\n', start)
+        if end < 0:
+            end = len(text)
+        self.start = start
+        self.end = end
+        self.last_semicolon = text.rfind(';', start, end)
+        # the last word a "key =" lookahead can stop at, "=" may follow on the next line
+        self.last_key = -1
+        for word in _KEY_WORD.finditer(text, start, end):
+            if _KEY_ASSIGNMENT.match(text, word.end()):
+                self.last_key = word.start()
+        self._quotes = [quote.start() for quote in _SINGLE_QUOTE.finditer(text, start, end)]
+        # the last stop after an even and after an odd number of quotes of the line
+        self._last_stop = [-1, -1]
+        stops = [stop.start() for stop in _LONE_QUOTE.finditer(text, start, end)]
+        if end < len(text):
+            stops.append(end)
+        for stop in stops:
+            self._last_stop[bisect_left(self._quotes, stop) % 2] = stop
+
+    def semicolon_after(self, pos):
+        """Whether a ``;`` follows ``pos`` on the line."""
+        return self.last_semicolon >= pos
+
+    def key_after(self, pos):
+        """Whether a ``key =`` starts at ``pos`` or after it on the line."""
+        return self.last_key >= pos
+
+    def odd_quotes_after(self, pos):
+        """An odd number of ``'`` between ``pos`` and a line end or a lone ``"``."""
+        return self._last_stop[1 - bisect_left(self._quotes, pos) % 2] >= pos
+
+
+class StringIndex:
+    """Kinds of the string literals of one text, by the offset of their
+    opening quote, and the ``LineFacts`` of its lines."""
+
+    def __init__(self, text):
+        self.text = text
+        self._kinds = {}
+        self._line = None
+
+    def kind(self, quote):
+        kind = self._kinds.get(quote)
+        if kind is None:
+            kind = self._kinds[quote] = classify(self.text, quote)
+        return kind
+
+    def line(self, pos):
+        """Return the ``LineFacts`` of the line holding ``pos``."""
+        line = self._line
+        if line is None or not line.start <= pos <= line.end:
+            line = self._line = LineFacts(self.text, self.text.rfind('\n', 0, pos) + 1)
+        return line
+
+
+def string_index(text):
+    """Return the ``StringIndex`` of ``text``, shared by the runs that hold it."""
+    entry = _held.get(id(text))
+    if entry is not None and entry[0] is text:
+        return entry[1]
+    return StringIndex(text)
+
+
+def hold(text):
+    """Keep the ``StringIndex`` of ``text`` until the matching ``release``."""
+    with _held_lock:
+        entry = _held.get(id(text))
+        if entry is None:
+            _held[id(text)] = [text, StringIndex(text), 1]
+        else:
+            entry[2] += 1
+
+
+def release(text):
+    with _held_lock:
+        entry = _held[id(text)]
+        entry[2] -= 1
+        if not entry[2]:
+            del _held[id(text)]
+
+
+def holding_index(text, items):
+    """Yield from ``items`` with the ``StringIndex`` of ``text`` held; it is
+    dropped once they are exhausted or the generator is closed."""
+    hold(text)
+    try:
+        yield from items
+    finally:
+        release(text)
+
+
+class StringStart:
+    """Rule pattern for a ``"`` that opens a literal of ``kind``.
+
+    ``match(text, pos)`` stands in for a compiled pattern's ``match``; the
+    engines read ``pattern`` and ``flags`` like they do on ``re.Pattern``.
+    """
+
+    pattern = '"'
+
+    def __init__(self, kind, flags=0):
+        self.kind = kind
+        self.flags = flags
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.kind!r})'
+
+    def compile(self, flags):
+        # the flags as re reports them, the combined engine compares them
+        return type(self)(self.kind, re.compile(self.pattern, flags).flags)
+
+    def match(self, text, pos=0):
+        if text.startswith('"', pos) and string_index(text).kind(pos) & self.kind:
+            return _QUOTE.match(text, pos)
+        return None
+
+
+class LinePattern:
+    """Rule pattern matched only where the rest of the line passes checks.
+
+    ``semicolon``, ``key`` and ``odd_quotes`` ask ``LineFacts`` whether a
+    ``;``, a ``key =`` or an odd number of ``'`` follows ``pos`` on its line;
+    ``None`` skips a check. The rule is ``pattern`` behind the lookaheads
+    it replaces.
+    """
+
+    def __init__(self, pattern, semicolon=None, key=None, odd_quotes=None, flags=0):
+        self.pattern = pattern
+        self.semicolon = semicolon
+        self.key = key
+        self.odd_quotes = odd_quotes
+        self._regex = re.compile(pattern, flags)
+        self.flags = self._regex.flags
+
+    def __repr__(self):
+        return (
+            f'{type(self).__name__}({self.pattern!r}, semicolon={self.semicolon!r},'
+            f' key={self.key!r}, odd_quotes={self.odd_quotes!r})'
+        )
+
+    def compile(self, flags):
+        return type(self)(self.pattern, self.semicolon, self.key, self.odd_quotes, flags)
+
+    def match(self, text, pos=0):
+        line = string_index(text).line(pos)
+        if self.semicolon is not None and line.semicolon_after(pos) is not self.semicolon:
+            return None
+        if self.key is not None and line.key_after(pos) is not self.key:
+            return None
+        if self.odd_quotes is not None and line.odd_quotes_after(pos) is not self.odd_quotes:
+            return None
+        return self._regex.match(text, pos)
@@ -0,0 +1,158 @@
+"""Lex one large BSL module on several cores.
+
+At the top level of a module every ``КонецПроцедуры``/``КонецФункции`` line
+leaves the lexer in the ``root`` state, so the text after it can be lexed
+on its own. ``parallel_get_tokens`` splits the text at such lines, lexes the
+chunks in a process pool and joins the token streams again.
+
+Every chunk is lexed with the text it may look ahead into and reports the
+state stack it ended with. When a chunk does not end in ``root`` at the next
+split point (the pre-scan is only a guess), the parent lexes on from the
+last good line itself until the states meet again, so the result is always
+the same as lexing the whole text in one go.
+"""
+
+import copy
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from pygments.token import string_to_tokentype
+
+from .engine import iter_tokens, lexer_matchers
+from .incremental import lookahead_end
+from .lexer import BslLexer
+
+# smaller chunks cost more in process round trips than they save
+MIN_CHUNK_SIZE = 64 * 1024
+
+_PROCEDURE_END = re.compile(
+    r'^[^\S\n]*(?:КонецПроцедуры|КонецФункции|EndProcedure|EndFunction)\b[^\n"]*\n',
+    re.MULTILINE | re.IGNORECASE,
+)
+
+
+def split_points(text, chunks):
+    """Return up to ``chunks - 1`` line starts after top-level procedure ends,
+    spread evenly over ``text``."""
+    size = max(len(text) // max(chunks, 1), MIN_CHUNK_SIZE)
+    points = []
+    target = size
+    for match in _PROCEDURE_END.finditer(text):
+        pos = match.end()
+        if pos >= target and len(text) - pos >= MIN_CHUNK_SIZE // 2:
+            points.append(pos)
+            target = pos + size
+    return points
+
+
+def _lex_chunk(lexer_cls, options, text, start, stop):
+    """Lex ``text[start:]`` from ``root`` up to the checkpoint at ``stop``.
+
+    Returns the token type names, the tokens as ``(pos, type index, value)``
+    and the checkpoint ``(pos, stack)`` the tokens end at: ``stop`` when the
+    loop reached it between two matches, the last line start before it
+    otherwise.
+    """
+    lexer = lexer_cls(**options)
+    types = {}
+    tokens = []
+    checkpoints = []
+    resume = (len(tokens), start, ('root',))
+    seen = 0
+    for pos, token, value in iter_tokens(lexer, text, lexer_matchers(lexer), ('root',), start, checkpoints):
+        while seen < len(checkpoints):
+            checkpoint, stack = checkpoints[seen]
+            seen += 1
+            if checkpoint >= stop:
+                break
+            resume = (len(tokens), checkpoint, stack)
+        if checkpoint == stop:
+            return list(types), tokens, (stop, stack)
+        if pos >= stop:
+            break
+        tokens.append((pos, types.setdefault(str(token), len(types)), value))
+    else:
+        # only the last chunk runs out of text before a token at stop
+        return list(types), tokens, (stop, checkpoints[-1][1])
+    count, checkpoint, stack = resume
+    del tokens[count:]
+    return list(types), tokens, (checkpoint, stack)
+
+
+def parallel_get_tokens_unprocessed(text, workers=None, lexer=None, executor=None):
+    """Yield ``(index, tokentype, value)`` like ``lexer.get_tokens_unprocessed(text)``.
+
+    ``lexer`` defaults to ``BslLexer()``. Pass a running ``executor`` to
+    reuse its worker processes, otherwise a pool of ``workers`` processes
+    (default: the CPU count) is started for this call.
+    """
+    # the fast mode lexes the whole text with the tables of BslFastLexer
+    lexer = (lexer or BslLexer())._lexer_for(text)
+    workers = workers or os.cpu_count() or 1
+    points = split_points(text, workers * 2) if workers > 1 else []
+    if not points:
+        yield from lexer.get_tokens_unprocessed(text)
+        return
+
+    bounds = [0, *points, len(text)]
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(min(workers, len(bounds) - 1))
+    try:
+        futures = []
+        for start, stop in zip(bounds, bounds[1:]):
+            # one character of context keeps the (?<=\n) lookbehinds working
+            begin = max(start - 1, 0)
+            end = lookahead_end(text, stop)
+            futures.append(executor.submit(
+                _lex_chunk, type(lexer), lexer.options,
+                text[begin:end], start - begin, stop - begin,
+            ))
+
+        matchers = lexer_matchers(lexer)
+        chunk = 0
+        while chunk < len(futures):
+            begin = max(bounds[chunk] - 1, 0)
+            names, tokens, (checkpoint, stack) = futures[chunk].result()
+            types = [string_to_tokentype(name) for name in names]
+            for pos, token, value in tokens:
+                yield pos + begin, types[token], value
+            chunk += 1
+            checkpoint += begin
+            if chunk == len(futures) or checkpoint == bounds[chunk] and stack == ('root',):
+                continue
+            # the chunk did not end where the next one starts: go on alone
+            # until a later split point is reached in root again
+            checkpoints = []
+            seen = 0
+            for pos, token, value in iter_tokens(lexer, text, matchers, stack, checkpoint, checkpoints):
+                while seen < len(checkpoints):
+                    checkpoint, stack = checkpoints[seen]
+                    seen += 1
+                    while chunk < len(futures) and bounds[chunk] < checkpoint:
+                        futures[chunk].cancel()
+                        chunk += 1
+                    if checkpoint == bounds[chunk] and stack == ('root',):
+                        break
+                else:
+                    yield pos, token, value
+                    continue
+                break
+            else:
+                chunk = len(futures)
+    finally:
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+
+
+def parallel_get_tokens(text, workers=None, lexer=None, executor=None):
+    """Return the ``(tokentype, value)`` stream of ``lexer.get_tokens(text)``,
+    lexed with ``parallel_get_tokens_unprocessed``."""
+    lexer = lexer or BslLexer()
+    # get_tokens() keeps doing the input preprocessing and the filters
+    front = copy.copy(lexer)
+    front.get_tokens_unprocessed = lambda text: parallel_get_tokens_unprocessed(
+        text, workers, lexer, executor,
+    )
+    return front.get_tokens(text)
@@ -0,0 +1,236 @@
+"""Persistent cache of compiled lexer tables.
+
+Processing the token definitions of ``BslLexer`` compiles a few hundred
+patterns, some of them embed the ``TYPE_NAMES`` alternations. Most of that
+time is spent in the pure Python regex parser and compiler, so the cache
+keeps the compiled SRE programs (and the first character analysis of the
+``dispatch`` engine) on disk and hands them straight to ``_sre.compile`` in
+the next process.
+
+Entries are keyed by the pattern text and flags, the cache file itself by the
+package version, the Python version and the SRE bytecode magic. Anything
+unexpected falls back to a regular compile.
+
+The cache file is only written by ``warmup()`` (and ``save()``), never as a
+side effect of lexing: importing the lexer in any process must not leave
+files behind. ``PYGMENTS_BSL_CACHE_DIR`` overrides the cache directory, a
+non-empty ``PYGMENTS_BSL_NO_CACHE`` disables the cache.
+"""
+
+import marshal
+import os
+import re
+import sys
+from array import array
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+import _sre
+
+try:
+    from re import _compiler as sre_compile, _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_compile
+    import sre_parse
+
+_CODE_TYPECODE = 'I' if array('I').itemsize == _sre.CODESIZE else 'L'
+
+_programs = None
+_first_chars = None
+_dirty = False
+# first character analyses made from the parse trees of compile_pattern
+_analysed = {}
+
+
+@lru_cache(maxsize=None)
+def package_version():
+    try:
+        return version('pygments-bsl')
+    except PackageNotFoundError:
+        return 'dev'
+
+
+def enabled():
+    return not os.environ.get('PYGMENTS_BSL_NO_CACHE') and sys.implementation.name == 'cpython'
+
+
+def cache_dir():
+    configured = os.environ.get('PYGMENTS_BSL_CACHE_DIR')
+    if configured:
+        return Path(configured)
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local'
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'pygments-bsl'
+
+
+def cache_path():
+    python = sys.implementation.cache_tag
+    return cache_dir() / f'tables-{package_version()}-{python}-{_sre.MAGIC}.marshal'
+
+
+def _load():
+    global _programs, _first_chars
+    if _programs is not None:
+        return
+    _programs, _first_chars = {}, {}
+    if not enabled():
+        return
+    try:
+        data = marshal.loads(cache_path().read_bytes())
+        _programs.update(data['programs'])
+        _first_chars.update(data['first_chars'])
+    except Exception:
+        # missing, truncated or foreign cache file: start from scratch
+        _programs.clear()
+        _first_chars.clear()
+
+
+def _mark_dirty():
+    global _dirty
+    _dirty = True
+
+
+def save():
+    """Write new entries to the cache file, return its path or ``None``."""
+    global _dirty
+    if not _dirty or not enabled():
+        return None
+    path = cache_path()
+    tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(marshal.dumps({'programs': _programs, 'first_chars': _first_chars}))
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        return None
+    _dirty = False
+    return path
+
+
+def unload():
+    """Save pending entries and drop the in-memory copy of the cache."""
+    global _programs, _first_chars, _dirty
+    save()
+    _programs = _first_chars = None
+    _dirty = False
+    _analysed.clear()
+
+
+def reset():
+    """Drop the in-memory copy of the cache without saving new entries."""
+    global _programs, _first_chars, _dirty
+    _programs = _first_chars = None
+    _dirty = False
+    _analysed.clear()
+
+
+def clear():
+    """Forget the in-memory entries and remove the cache file."""
+    global _programs, _first_chars, _dirty
+    _programs = _first_chars = None
+    _dirty = False
+    _analysed.clear()
+    try:
+        cache_path().unlink()
+    except OSError:
+        pass
+
+
+def _compile_program(pattern, flags):
+    parsed = sre_parse.parse(pattern, flags)
+    code = sre_compile._code(parsed, flags)
+    groupindex = dict(parsed.state.groupdict)
+    indexgroup = [None] * parsed.state.groups
+    for name, index in groupindex.items():
+        indexgroup[index] = name
+    return (
+        flags | parsed.state.flags,
+        array(_CODE_TYPECODE, code).tobytes(),
+        parsed.state.groups - 1,
+        groupindex,
+        tuple(indexgroup),
+    ), parsed
+
+
+def compile_pattern(pattern, flags, analyse=None):
+    """``re.compile(pattern, flags)`` backed by the on-disk program cache.
+
+    When the pattern has to be parsed, ``analyse(parsed)`` is run on its
+    parse tree and ``cached_first_chars`` returns the result instead of
+    parsing the pattern a second time.
+    """
+    if not enabled() and analyse is None:
+        return re.compile(pattern, flags)
+    flags = int(flags)
+    key = (pattern, flags)
+    if enabled():
+        _load()
+        program = _programs.get(key)
+        if program is not None:
+            final_flags, code, groups, groupindex, indexgroup = program
+            try:
+                return _sre.compile(
+                    pattern, final_flags, array(_CODE_TYPECODE, code).tolist(),
+                    groups, groupindex, indexgroup,
+                )
+            except Exception:
+                del _programs[key]
+    try:
+        program, parsed = _compile_program(pattern, flags)
+        final_flags, code, groups, groupindex, indexgroup = program
+        compiled = _sre.compile(
+            pattern, final_flags, array(_CODE_TYPECODE, code).tolist(),
+            groups, groupindex, indexgroup,
+        )
+    except Exception:
+        # let re report errors the usual way
+        return re.compile(pattern, flags)
+    if analyse is not None:
+        # the engines look the analysis up by the flags of the compiled pattern
+        _analysed[(pattern, compiled.flags)] = analyse(parsed)
+    if enabled():
+        _programs[key] = program
+        _mark_dirty()
+    return compiled
+
+
+def cached_first_chars(pattern, flags, analyse):
+    """Return ``analyse(pattern, flags)``, remembered across processes."""
+    flags = int(flags)
+    key = (pattern, flags)
+    result = _analysed.get(key)
+    if not enabled():
+        return analyse(pattern, flags) if result is None else result
+    _load()
+    cached = _first_chars.get(key)
+    if cached is not None:
+        return cached
+    if result is None:
+        result = analyse(pattern, flags)
+    _first_chars[key] = result
+    _mark_dirty()
+    return result
+
+
+def warmup(lexers=None):
+    """Compile the tables of ``lexers`` (default: all lexers) and persist them.
+
+    Call it once after installation, in a docs build before forking workers,
+    or at the start of a long-running service. Returns the cache file path,
+    or ``None`` when nothing had to be written.
+    """
+    from .engine import STOCK_ENGINE, state_matchers
+    from .lexer import BslLexer, ConstraintLogicLexer, SdblLexer, SdblQueryLexer
+
+    for lexer_cls in lexers or (BslLexer, SdblLexer, SdblQueryLexer, ConstraintLogicLexer):
+        lexer = lexer_cls()
+        if lexer.engine != STOCK_ENGINE:
+            state_matchers(lexer_cls, lexer.engine)
+    return save()
@@ -0,0 +1,253 @@
+"""Per-rule profile of the BSL/SDBL lexers.
+
+::
+
+    python -m pygments_bsl.profile Module.bsl
+    python -m pygments_bsl.profile Module.bsl --top 40 --engine regex
+
+With the ``profile`` lexer option every attempt of every rule is counted
+and timed by lexer class, state and rule index (the index in the processed
+``cls._tokens[state]``), and so is the callback of the rule. The results are
+collected by the ``RuleProfile`` in ``lexer.profile``; the embedded query
+and restriction lexers get the same options and add to the same profile.
+
+Callbacks are timed up to their last token, the time of a callback that
+runs an embedded lexer includes the rules of that lexer. The combined engine
+cannot tell its rules apart, profiled it tries them one by one like the
+stock engine does.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from time import perf_counter
+
+from pygments.token import _TokenType
+
+from .engine import SpanAction, TokenAction, dispatch_matcher, sequential_matcher
+from .lexer import BslLexer, SdblLexer
+
+DEFAULT_TOP = 25
+PATTERN_WIDTH = 60
+
+
+class RuleStats:
+    """Counters of one rule of one state."""
+
+    __slots__ = ('pattern', 'callback', 'attempts', 'hits', 'match_time', 'callback_time')
+
+    def __init__(self, pattern, callback):
+        self.pattern = pattern
+        self.callback = callback
+        self.attempts = 0
+        self.hits = 0
+        self.match_time = 0.0
+        self.callback_time = 0.0
+
+    @property
+    def total_time(self):
+        return self.match_time + self.callback_time
+
+
+def callback_name(action):
+    """Return a readable name of a rule action, ``None`` for plain tokens."""
+    if action is None or type(action) is _TokenType:
+        return None
+    if type(action) is TokenAction:
+        action = action.token
+    elif type(action) is SpanAction:
+        action = action.spans
+    name = getattr(action, '__name__', None) or type(action).__name__
+    if name == 'callback':
+        # the closures of bygroups() and using()
+        name = getattr(action, '__qualname__', name).split('.')[0]
+    return name
+
+
+class _ProfiledMatch:
+
+    def __init__(self, match, stats):
+        # the dispatch engine reads the pattern of the rule
+        self.__self__ = match.__self__
+        self._match = match
+        self._stats = stats
+
+    def __call__(self, text, pos):
+        stats = self._stats
+        started = perf_counter()
+        m = self._match(text, pos)
+        stats.match_time += perf_counter() - started
+        stats.attempts += 1
+        if m:
+            stats.hits += 1
+        return m
+
+
+def _profiled_action(action, stats):
+    if action is None or type(action) is _TokenType:
+        return action
+    if type(action) is TokenAction:
+        token = action.token
+
+        def timed_token(lexer, match):
+            started = perf_counter()
+            try:
+                return token(lexer, match)
+            finally:
+                stats.callback_time += perf_counter() - started
+        return TokenAction(timed_token)
+    if type(action) is SpanAction:
+        spans = action.spans
+
+        def timed_spans(lexer, match):
+            started = perf_counter()
+            result = list(spans(lexer, match))
+            stats.callback_time += perf_counter() - started
+            return result
+        return SpanAction(timed_spans)
+
+    def timed_callback(lexer, match):
+        started = perf_counter()
+        tokens = list(action(lexer, match))
+        stats.callback_time += perf_counter() - started
+        return tokens
+    return timed_callback
+
+
+class RuleProfile:
+    """Attempts, hits and time by ``(lexer name, state, rule index)``."""
+
+    def __init__(self):
+        self.rules = {}
+        self._matchers = {}
+
+    def matchers(self, lexer):
+        """Return the state matchers of ``lexer`` with every rule instrumented."""
+        cls = type(lexer)
+        tokendefs = cls._tokens
+        key = (cls, lexer.engine == 'dispatch')
+        cached = self._matchers.get(key)
+        if cached is not None and cached[0] is tokendefs:
+            return cached[1]
+        factory = dispatch_matcher if key[1] else sequential_matcher
+        matchers = {}
+        for state, rules in tokendefs.items():
+            profiled = []
+            for index, (rexmatch, action, new_state) in enumerate(rules):
+                stats = self.rules.get((cls.__name__, state, index))
+                if stats is None:
+                    stats = self.rules[cls.__name__, state, index] = RuleStats(
+                        rexmatch.__self__.pattern, callback_name(action),
+                    )
+                profiled.append((_ProfiledMatch(rexmatch, stats), _profiled_action(action, stats), new_state))
+            matchers[state] = factory(profiled)
+        self._matchers[key] = (tokendefs, matchers)
+        return matchers
+
+    def hottest(self, limit=None):
+        """Return ``((lexer name, state, index), stats)`` by descending time."""
+        ranked = sorted(self.rules.items(), key=lambda item: item[1].total_time, reverse=True)
+        return ranked[:limit] if limit is not None else ranked
+
+    def states(self):
+        """Return ``{(lexer name, state): (attempts, hits, seconds)}``."""
+        totals = {}
+        for (lexer_name, state, _), stats in self.rules.items():
+            attempts, hits, seconds = totals.get((lexer_name, state), (0, 0, 0.0))
+            totals[lexer_name, state] = (attempts + stats.attempts, hits + stats.hits, seconds + stats.total_time)
+        return totals
+
+    def callbacks(self):
+        """Return ``{callback name: (calls, seconds)}``."""
+        totals = {}
+        for stats in self.rules.values():
+            if stats.callback is not None:
+                calls, seconds = totals.get(stats.callback, (0, 0.0))
+                totals[stats.callback] = (calls + stats.hits, seconds + stats.callback_time)
+        return totals
+
+
+def _short(pattern, width=PATTERN_WIDTH):
+    pattern = ' '.join(str(pattern).split())
+    return pattern if len(pattern) <= width else pattern[:width - 3] + '...'
+
+
+def format_profile(profile, top=DEFAULT_TOP):
+    header = (
+        f'{"lexer/state":<40} {"rule":>4} {"attempts":>10} {"hits":>9}'
+        f' {"match ms":>9} {"callback ms":>11}  pattern'
+    )
+    lines = [header, '-' * len(header)]
+    for (lexer_name, state, index), stats in profile.hottest(top):
+        lines.append(
+            f'{lexer_name + "/" + state:<40} {index:>4} {stats.attempts:>10} {stats.hits:>9}'
+            f' {stats.match_time * 1000:>9.1f} {stats.callback_time * 1000:>11.1f}  {_short(stats.pattern)}'
+        )
+
+    header = f'{"lexer/state":<40} {"attempts":>10} {"hits":>9} {"ms":>9}'
+    lines.extend(['', header, '-' * len(header)])
+    states = sorted(
+        (item for item in profile.states().items() if item[1][0]), key=lambda item: item[1][2], reverse=True,
+    )
+    for (lexer_name, state), (attempts, hits, seconds) in states[:top]:
+        lines.append(f'{lexer_name + "/" + state:<40} {attempts:>10} {hits:>9} {seconds * 1000:>9.1f}')
+
+    header = f'{"callback":<45} {"calls":>10} {"ms":>9}'
+    lines.extend(['', header, '-' * len(header)])
+    callbacks = sorted(
+        (item for item in profile.callbacks().items() if item[1][0]), key=lambda item: item[1][1], reverse=True,
+    )
+    for name, (calls, seconds) in callbacks[:top]:
+        lines.append(f'{name:<45} {calls:>10} {seconds * 1000:>9.1f}')
+    return '\n'.join(lines)
+
+
+def profile_text(lexer_cls, text, engine=None):
+    """Lex ``text`` once with a profiled ``lexer_cls`` and return the profile."""
+    options = {'profile': True}
+    if engine is not None:
+        options['engine'] = engine
+    lexer = lexer_cls(**options)
+    for _ in lexer.get_tokens_unprocessed(text):
+        pass
+    return lexer.profile
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m pygments_bsl.profile',
+        description='Show the lexer rules a BSL/SDBL file spends its time in.',
+    )
+    parser.add_argument('file', help='source file to lex')
+    parser.add_argument('--lexer', choices=('bsl', 'sdbl'),
+                        help='lexer to use (default: by the file extension)')
+    parser.add_argument('--engine', choices=('regex', 'combined', 'dispatch'),
+                        help='lexer engine (default: the lexer default)')
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP,
+                        help='rows per table (default: %(default)s)')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    path = Path(args.file)
+    try:
+        text = path.read_text(encoding='utf-8-sig')
+    except (OSError, UnicodeDecodeError) as exc:
+        print(exc, file=sys.stderr)
+        return 2
+    if args.lexer:
+        lexer_cls = SdblLexer if args.lexer == 'sdbl' else BslLexer
+    else:
+        lexer_cls = SdblLexer if path.suffix.lower() == '.sdbl' else BslLexer
+
+    started = perf_counter()
+    profile = profile_text(lexer_cls, text, args.engine)
+    elapsed = perf_counter() - started
+    print(format_profile(profile, args.top))
+    print(f'\n{lexer_cls.__name__} lexed {path} in {elapsed * 1000:.1f} ms with profiling')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
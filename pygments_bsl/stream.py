@@ -0,0 +1,163 @@
+"""Lexing BSL text that arrives in chunks.
+
+``BslStreamLexer`` takes the text piece by piece with ``feed()`` and returns
+the tokens that can no longer change: those before a line start where the
+lexer is back in its ``root`` state and that no rule lookahead reaches past
+the received text from. Tokens of an unfinished string, query or parameter
+list are held back until the text that ends it arrives; ``close()`` returns
+the rest::
+
+    stream = BslStreamLexer()
+    for chunk in chunks:
+        for pos, token, value in stream.feed(chunk):
+            ...
+    for pos, token, value in stream.close():
+        ...
+
+Together the tokens are those of ``BslLexer(**options).get_tokens_unprocessed``
+for the whole text, with offsets into it. Only the held back text is kept.
+
+``lex_file`` and ``iter_file`` lex a file this way: it is memory-mapped and
+decoded window by window, so the memory used follows the window size and
+not the size of the file::
+
+    lex_file('Module.bsl', sink=writer.write_tokens)
+"""
+
+import codecs
+import mmap
+import os
+
+from .engine import iter_tokens, lexer_matchers
+from .incremental import restart_offset
+from .lexer import BslLexer
+
+# bytes decoded and lexed at a time by lex_file
+WINDOW_SIZE = 1 << 20
+
+
+class BslStreamLexer:
+    """Tokens of a BSL text fed in chunks; takes the options of ``BslLexer``.
+
+    The ``fast`` mode applies, ``fast_mode_above`` does not: the size of the
+    text is not known up front.
+    """
+
+    lexer_class = BslLexer
+
+    def __init__(self, **options):
+        self.lexer = self.lexer_class(**options)._lexer_for('')
+        self._matchers = lexer_matchers(self.lexer)
+        # the text from the last emitted token on, after one character of
+        # context for the (?<=\n) lookbehinds; _offset is its stream offset
+        self._buffer = ''
+        self._offset = 0
+        self._pos = 0
+        self.closed = False
+
+    @property
+    def pending(self):
+        """The received text whose tokens were not returned yet."""
+        return self._buffer[self._pos:]
+
+    def feed(self, chunk):
+        """Add ``chunk`` to the text and return the ``(offset, tokentype,
+        value)`` tokens that became final."""
+        if self.closed:
+            raise ValueError('feed() after close()')
+        self._buffer += chunk
+        # the tokens before this line start do not read the text to come
+        stop = restart_offset(self._buffer, len(self._buffer))
+        if stop <= self._pos:
+            return []
+        return self._lex(stop)
+
+    def close(self):
+        """End the text and return the tokens that were held back."""
+        if self.closed:
+            return []
+        self.closed = True
+        return self._lex(None)
+
+    def _lex(self, stop):
+        """Lex the buffer from ``_pos`` in ``root``; return the tokens up to
+        the last ``root`` line start at or before ``stop`` and drop their
+        text, or all tokens when ``stop`` is ``None``."""
+        buffer = self._buffer
+        offset = self._offset
+        tokens = []
+        checkpoints = []
+        seen = 0
+        cut = None
+        for pos, token, value in iter_tokens(self.lexer, buffer, self._matchers, ('root',), self._pos, checkpoints):
+            if stop is not None:
+                while seen < len(checkpoints):
+                    checkpoint, stack = checkpoints[seen]
+                    seen += 1
+                    if checkpoint > stop:
+                        break
+                    if checkpoint > self._pos and stack == ('root',):
+                        cut = (len(tokens), checkpoint)
+                else:
+                    tokens.append((pos + offset, token, value))
+                    continue
+                break
+            tokens.append((pos + offset, token, value))
+        if stop is None:
+            self._buffer = ''
+            self._offset += len(buffer)
+            self._pos = 0
+            return tokens
+        for checkpoint, stack in checkpoints[seen:]:
+            if checkpoint <= stop and checkpoint > self._pos and stack == ('root',):
+                cut = (len(tokens), checkpoint)
+        if cut is None:
+            return []
+        count, checkpoint = cut
+        self._buffer = buffer[checkpoint - 1:]
+        self._offset = offset + checkpoint - 1
+        self._pos = 1
+        return tokens[:count]
+
+
+def _file_batches(path, encoding, window_size, options):
+    stream = BslStreamLexer(**options)
+    decoder = codecs.getincrementaldecoder(encoding)()
+    with open(path, 'rb') as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if size:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                start = 0
+                while start < size:
+                    end = min(start + window_size, size)
+                    newline = mapped.rfind(b'\n', start, end) if end < size else -1
+                    # whole lines give the stream lexer line starts to stop at
+                    if newline >= 0:
+                        end = newline + 1
+                    yield stream.feed(decoder.decode(mapped[start:end]))
+                    start = end
+    yield stream.feed(decoder.decode(b'', True))
+    yield stream.close()
+
+
+def lex_file(path, sink, encoding='utf-8-sig', window_size=WINDOW_SIZE, **options):
+    """Lex the BSL file at ``path`` and pass its tokens to ``sink``.
+
+    The file is memory-mapped and decoded ``window_size`` bytes at a time;
+    ``sink`` is called with each list of ``(offset, tokentype, value)``
+    tokens as soon as they are final. Offsets index the decoded text, the
+    tokens are those of ``BslLexer(**options).get_tokens_unprocessed(text)``.
+    Returns the number of tokens.
+    """
+    count = 0
+    for tokens in _file_batches(path, encoding, window_size, options):
+        if tokens:
+            sink(tokens)
+            count += len(tokens)
+    return count
+
+
+def iter_file(path, encoding='utf-8-sig', window_size=WINDOW_SIZE, **options):
+    """Yield the tokens ``lex_file`` passes to its sink, one by one."""
+    for tokens in _file_batches(path, encoding, window_size, options):
+        yield from tokens
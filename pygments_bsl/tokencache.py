@@ -0,0 +1,216 @@
+"""On-disk cache of lexed token streams.
+
+Docs builds highlight the same modules over and over. With the
+``token_cache`` lexer option (or a non-empty ``PYGMENTS_BSL_TOKEN_CACHE``
+environment variable) the token stream of every text of at least
+``MIN_TEXT_SIZE`` characters is stored under a key made of the text hash,
+the lexer class, its options and the package version, and read back
+instead of lexing the same text again.
+
+Entries store the token offsets and indexes into a table of the distinct
+``(tokentype, value)`` pairs as flat arrays in a ``marshal`` file. They
+live in ``<cache dir>/tokens``; when the directory grows over
+``PYGMENTS_BSL_TOKEN_CACHE_SIZE`` megabytes (default 256) the least
+recently used entries are removed.
+
+``get_tokens`` drops the offsets, so on a hit it yields the pairs of the
+table as they are and builds no tuple per token: a hit on ``big.bsl`` is
+over 20 times faster than lexing it with the default ``dispatch`` engine.
+``get_tokens_unprocessed`` builds the ``(index, tokentype, value)`` tuples
+from the columns, which takes most of its hit.
+"""
+
+import hashlib
+import json
+import marshal
+import operator
+import os
+import zlib
+from array import array
+
+from pygments.token import string_to_tokentype
+
+from .precompiled import cache_dir, package_version
+
+DEFAULT_SIZE_MB = 256
+# a hit pays off from about 128 characters and is ~20x faster at 4 KB; the
+# threshold keeps embedded queries and short snippets out of the directory
+MIN_TEXT_SIZE = 4096
+CACHE_OPTIONS = ('token_cache', 'time_budget_ms', 'on_budget_exceeded')
+FORMAT = 2
+
+_INDEX_TYPECODE = 'I' if array('I').itemsize >= 4 else 'L'
+_TYPE_AND_VALUE = operator.itemgetter(1, 2)
+
+
+def enabled_by_default():
+    return bool(os.environ.get('PYGMENTS_BSL_TOKEN_CACHE'))
+
+
+def directory():
+    return cache_dir() / 'tokens'
+
+
+def size_limit():
+    try:
+        return int(float(os.environ.get('PYGMENTS_BSL_TOKEN_CACHE_SIZE') or DEFAULT_SIZE_MB) * 1024 * 1024)
+    except ValueError:
+        return DEFAULT_SIZE_MB * 1024 * 1024
+
+
+def cache_key(lexer, text):
+    options = {name: value for name, value in lexer.options.items() if name not in CACHE_OPTIONS}
+    cls = type(lexer)
+    header = json.dumps(
+        [FORMAT, package_version(), f'{cls.__module__}.{cls.__qualname__}', options],
+        sort_keys=True, default=repr,
+    )
+    digest = hashlib.sha256(header.encode('utf-8'))
+    digest.update(b'\0')
+    # several times faster to encode than UTF-8 for Cyrillic text
+    digest.update(text.encode('utf-16-le', 'surrogatepass'))
+    return digest.hexdigest()
+
+
+def dumps(tokens):
+    """Serialize ``tokens`` as columns: offsets, indexes into a table of the
+    distinct ``(tokentype, value)`` pairs, the pairs and the type names, with
+    a checksum of the columns."""
+    types = {}
+    pairs = {}
+    positions = array(_INDEX_TYPECODE)
+    indexes = array(_INDEX_TYPECODE)
+    for pos, token, value in tokens:
+        positions.append(pos)
+        indexes.append(pairs.setdefault((token, value), len(pairs)))
+    table = tuple((types.setdefault(token, len(types)), value) for token, value in pairs)
+    names = tuple(str(token) for token in types)
+    positions_data = positions.tobytes()
+    indexes_data = indexes.tobytes()
+    checksum = zlib.crc32(indexes_data, zlib.crc32(positions_data))
+    return marshal.dumps((FORMAT, names, table, positions_data, indexes_data, checksum))
+
+
+def load_columns(data):
+    """Return ``(positions, pairs, indexes)`` of the tokens serialized by
+    ``dumps``, token ``i`` is ``positions[i]`` and ``pairs[indexes[i]]``."""
+    entry = marshal.loads(data)
+    if entry[0] != FORMAT:
+        raise ValueError(f'token cache format {entry[0]!r}')
+    _, names, table, positions_data, indexes_data, checksum = entry
+    # cheaper than checking every index against the table
+    if zlib.crc32(indexes_data, zlib.crc32(positions_data)) != checksum:
+        raise ValueError('token cache entry is damaged')
+    types = [string_to_tokentype(name) for name in names]
+    pairs = [(types[token], value) for token, value in table]
+    positions = array(_INDEX_TYPECODE)
+    positions.frombytes(positions_data)
+    indexes = array(_INDEX_TYPECODE)
+    indexes.frombytes(indexes_data)
+    if len(positions) != len(indexes):
+        raise ValueError('token cache entry is damaged')
+    return positions, pairs, indexes
+
+
+def loads(data):
+    """Return an iterator over the tokens serialized by ``dumps``.
+
+    The tuples are built lazily by ``zip``/``map``, a streaming consumer never
+    holds more than one of them.
+    """
+    positions, pairs, indexes = load_columns(data)
+    return map(operator.add, zip(positions), map(pairs.__getitem__, indexes))
+
+
+def load(key):
+    """Return the ``load_columns`` of entry ``key``, ``None`` on a miss."""
+    path = directory() / f'{key}.tokens'
+    try:
+        data = path.read_bytes()
+        columns = load_columns(data)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # truncated or foreign entry: drop it and lex again
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return columns
+
+
+def store(key, tokens):
+    folder = directory()
+    path = folder / f'{key}.tokens'
+    tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    try:
+        folder.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(dumps(tokens))
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        return
+    evict()
+
+
+def evict(limit=None):
+    """Remove the least recently used entries until the cache fits ``limit`` bytes."""
+    evict_files(directory(), '.tokens', size_limit() if limit is None else limit)
+
+
+def evict_files(folder, suffix, limit):
+    """Remove the least recently used ``suffix`` files of ``folder`` until
+    they fit ``limit`` bytes."""
+    entries = []
+    total = 0
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.name.endswith(suffix):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.path, stat.st_size))
+                    total += stat.st_size
+    except OSError:
+        return
+    entries.sort()
+    for _, path, size in entries:
+        if total <= limit:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+
+
+def clear():
+    evict(0)
+
+
+def cached_tokens(lexer, text, lex, pairs=False):
+    """Return the tokens of ``text``: from the cache, or ``list(lex(text))``.
+
+    With ``pairs`` only the ``(tokentype, value)`` pairs are returned, a hit
+    yields the pairs of the entry table without building new tuples.
+    """
+    key = cache_key(lexer, text)
+    columns = load(key)
+    if columns is None:
+        cut = lexer.budget_exceeded
+        tokens = list(lex(text))
+        # a stream cut short by the time budget is not the one to keep
+        if lexer.budget_exceeded == cut:
+            store(key, tokens)
+        return map(_TYPE_AND_VALUE, tokens) if pairs else iter(tokens)
+    positions, table, indexes = columns
+    if pairs:
+        return map(table.__getitem__, indexes)
+    return map(operator.add, zip(positions), map(table.__getitem__, indexes))
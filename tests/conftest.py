@@ -0,0 +1,18 @@
+import os
+import shutil
+import tempfile
+
+_cache_dir = None
+
+
+def pytest_configure(config):
+    # keep the compiled tables, token and line index caches of the run out of
+    # the user's cache directory, and the user's entries out of the run
+    global _cache_dir
+    _cache_dir = tempfile.mkdtemp(prefix='pygments-bsl-tests-')
+    os.environ['PYGMENTS_BSL_CACHE_DIR'] = _cache_dir
+
+
+def pytest_unconfigure(config):
+    os.environ.pop('PYGMENTS_BSL_CACHE_DIR', None)
+    shutil.rmtree(_cache_dir, ignore_errors=True)
@@ -0,0 +1,113 @@
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import TestCase, mock
+
+from pygments_bsl import batch
+from pygments_bsl.lexer import BslLexer, SdblLexer
+
+CURRENT_DIR = os.path.abspath(os.path.dirname(__file__))
+EXAMPLES_DIR = os.path.join(CURRENT_DIR, 'examplefiles')
+
+
+class BatchTestCase(TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.source = self.root / 'src'
+        (self.source / 'CommonModules' / 'Общий').mkdir(parents=True)
+        shutil.copy(os.path.join(EXAMPLES_DIR, 'bsl', 'samples.bsl'), self.source / 'CommonModules' / 'Общий' / 'Module.bsl')
+        shutil.copy(os.path.join(EXAMPLES_DIR, 'sdbl', 'samples.sdbl'), self.source / 'Query.sdbl')
+        (self.source / 'readme.txt').write_text('not a module', encoding='utf-8')
+
+    def run_main(self, *argv):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            code = batch.main([str(self.source), '--jobs', '1', *argv])
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def test_writes_output_next_to_sources_and_skips_unchanged_files(self):
+        code, stdout, _ = self.run_main()
+
+        self.assertEqual(code, 0)
+        self.assertIn('2 files: 2 written, 0 unchanged, 0 failed', stdout)
+        html = (self.source / 'CommonModules' / 'Общий' / 'Module.bsl.html').read_text(encoding='utf-8')
+        self.assertIn('Процедура', html)
+        self.assertTrue((self.source / 'Query.sdbl.html').exists())
+        self.assertFalse((self.source / 'readme.txt.html').exists())
+        self.assertFalse((self.source / batch.MANIFEST_NAME).exists())
+        self.assertTrue(batch.manifest_path(self.source).exists())
+
+        code, stdout, _ = self.run_main()
+        self.assertIn('2 files: 0 written, 2 unchanged, 0 failed', stdout)
+
+        (self.source / 'Query.sdbl').write_text('ВЫБРАТЬ 1', encoding='utf-8')
+        code, stdout, _ = self.run_main()
+        self.assertIn('2 files: 1 written, 1 unchanged, 0 failed', stdout)
+
+        code, stdout, _ = self.run_main('--force')
+        self.assertIn('2 files: 2 written, 0 unchanged, 0 failed', stdout)
+
+    def test_formatter_options_change_the_hash(self):
+        self.run_main()
+
+        code, stdout, _ = self.run_main('-O', 'linenos=table,nowrap')
+
+        self.assertIn('2 written', stdout)
+        self.assertEqual(batch.parse_options(['linenos=table,nowrap,', ' style = monokai ']), {
+            'linenos': 'table', 'nowrap': True, 'style': 'monokai',
+        })
+
+    def test_output_tree_and_other_formatters(self):
+        output = self.root / 'out'
+
+        code, _, _ = self.run_main('-o', str(output), '-f', 'terminal', '-O', 'encoding=utf-8,')
+
+        self.assertEqual(code, 0)
+        self.assertTrue((output / 'CommonModules' / 'Общий' / 'Module.bsl.terminal').exists())
+        manifest = json.loads((output / batch.MANIFEST_NAME).read_text(encoding='utf-8'))
+        self.assertEqual(sorted(manifest), ['CommonModules/Общий/Module.bsl', 'Query.sdbl'])
+
+    def test_manifests_of_source_trees_are_kept_apart(self):
+        other = self.root / 'other'
+        other.mkdir()
+
+        self.assertNotEqual(batch.manifest_path(self.source), batch.manifest_path(other))
+        self.assertEqual(batch.manifest_path(self.source), batch.manifest_path(self.root / 'src' / '.'))
+        self.assertEqual(batch.manifest_path(self.source, other), other / batch.MANIFEST_NAME)
+
+    def test_failures_are_reported(self):
+        (self.source / 'Broken.bsl').write_bytes(b'\xff\xfe\x00broken')
+
+        code, stdout, _ = self.run_main()
+
+        self.assertEqual(code, 1)
+        self.assertIn('1 failed', stdout)
+        self.assertIn('FAILED Broken.bsl: UnicodeDecodeError', stdout)
+
+    def test_bad_arguments(self):
+        self.assertEqual(self.run_main('-f', 'no-such-formatter')[0], 2)
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            self.assertEqual(batch.main([str(self.root / 'missing')]), 2)
+        self.assertIn('Not a directory', stderr.getvalue())
+
+    def test_process_pool(self):
+        with mock.patch.object(batch, 'warmup', wraps=batch.warmup) as warmup:
+            code, stdout, _ = self.run_main('--jobs', '2')
+
+        self.assertEqual(code, 0)
+        self.assertIn('2 written', stdout)
+        # all lexers, the embedded query lexers included
+        warmup.assert_called_once_with()
+
+    def test_lexer_for_file_names(self):
+        self.assertIs(batch.lexer_for(Path('Module.BSL')), BslLexer)
+        self.assertIs(batch.lexer_for(Path('main.os')), BslLexer)
+        self.assertIs(batch.lexer_for(Path('q.sdbl')), SdblLexer)
+        self.assertIsNone(batch.lexer_for(Path('Form.xml')))
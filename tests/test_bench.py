@@ -0,0 +1,164 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from pygments_bsl import bench, precompiled
+from pygments_bsl.lexer import BslLexer, SdblLexer
+
+CURRENT_DIR = os.path.abspath(os.path.dirname(__file__))
+EXAMPLES_DIR = os.path.join(CURRENT_DIR, 'examplefiles')
+
+
+class BenchTestCase(TestCase):
+
+    def run_main(self, *argv):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            code = bench.main(['--examples', EXAMPLES_DIR, '--repeat', '1', *argv])
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def test_run_case_reports_throughput_and_latency(self):
+        result = bench.run_case(SdblLexer, 'ВЫБРАТЬ 1 КАК Поле', repeat=1)
+
+        self.assertEqual(result['bytes'], len('ВЫБРАТЬ 1 КАК Поле'.encode('utf-8')))
+        self.assertEqual(result['tokens'], len(list(SdblLexer().get_tokens('ВЫБРАТЬ 1 КАК Поле'))))
+        for key in ('cold_ms', 'warm_ms', 'tokens_per_sec', 'mb_per_sec', 'peak_mb'):
+            with self.subTest(key=key):
+                self.assertGreater(result[key], 0)
+
+    def test_reset_compiled_tables_forces_recompile(self):
+        BslLexer()
+        self.assertIn('_tokens', BslLexer.__dict__)
+
+        bench.reset_compiled_tables()
+
+        self.assertNotIn('_tokens', BslLexer.__dict__)
+        BslLexer()
+        self.assertIn('_tokens', BslLexer.__dict__)
+
+    def test_reset_compiled_tables_does_not_write_the_tables_cache(self):
+        with mock.patch.object(precompiled, 'save', side_effect=AssertionError):
+            bench.reset_compiled_tables()
+            BslLexer()
+            bench.reset_compiled_tables()
+
+    def test_select_cases_filters_by_name(self):
+        self.assertEqual(bench.select_cases(None), list(bench.CASES))
+        self.assertEqual(
+            bench.select_cases(['SdblLexer:']),
+            [(SdblLexer, 'sdbl/samples.sdbl')],
+        )
+
+    def test_compare_flags_only_regressions_beyond_threshold(self):
+        results = {
+            'a': {'tokens_per_sec': 10.0, 'speedup': 2.85},
+            'b': {'tokens_per_sec': 1e6, 'speedup': 2.4},
+            'c': {'tokens_per_sec': 10.0, 'speedup': 0.5},
+            'd': {'tokens_per_sec': 10.0},
+        }
+        baseline = {'a': {'speedup': 3.0}, 'b': {'speedup': 3.0}, 'd': {'speedup': 3.0}}
+
+        self.assertEqual(bench.compare(results, baseline, 10), [('b', 3.0, 2.4)])
+        self.assertEqual(bench.compare(results, baseline, 25), [])
+
+    def test_speedup_is_measured_against_the_regex_engine(self):
+        self.assertGreater(bench.measure_speedup(SdblLexer, 'ВЫБРАТЬ 1', repeat=2), 0)
+        clock = iter([0.0, 1.0, 0.0, 3.0, 0.0, 2.0, 0.0, 4.0])
+        with mock.patch.object(bench, '_warm_time', return_value=1.0):
+            with mock.patch.object(bench.time, 'perf_counter', lambda: next(clock)):
+                self.assertEqual(bench.measure_speedup(SdblLexer, 'ВЫБРАТЬ 1', repeat=2), 3.0)
+
+        with mock.patch.object(bench, 'measure_speedup', return_value=2.5) as measure:
+            results = bench.run([(SdblLexer, 'sdbl/samples.sdbl')], EXAMPLES_DIR, repeat=1)
+        self.assertEqual(results['SdblLexer:sdbl/samples.sdbl']['speedup'], 2.5)
+        self.assertEqual(measure.call_args.args[0], SdblLexer)
+
+    def test_main_saves_baseline_and_fails_on_regression(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            baseline = os.path.join(tmp, 'baseline.json')
+
+            code, stdout, _ = self.run_main('--case', 'samples.os', '--baseline', baseline, '--save-baseline')
+            self.assertEqual(code, 0)
+            self.assertIn('BslLexer:bsl/samples.os', stdout)
+            with open(baseline, encoding='utf-8') as fh:
+                saved = json.load(fh)
+            self.assertEqual(list(saved['cases']), ['BslLexer:bsl/samples.os'])
+            self.assertEqual(saved['reference_engine'], 'regex')
+            self.assertGreater(saved['cases']['BslLexer:bsl/samples.os']['speedup'], 0)
+
+            saved['cases']['BslLexer:bsl/samples.os']['speedup'] = 1e12
+            with open(baseline, 'w', encoding='utf-8') as fh:
+                json.dump(saved, fh)
+
+            code, _, stderr = self.run_main('--case', 'samples.os', '--baseline', baseline)
+            self.assertEqual(code, 1)
+            self.assertIn('REGRESSION BslLexer:bsl/samples.os', stderr)
+
+            code, _, stderr = self.run_main('--case', 'samples.os', '--baseline', baseline,
+                                            '--max-regression', '100')
+            self.assertEqual(code, 0)
+            self.assertEqual(stderr, '')
+
+    def test_main_without_baseline_file_only_reports(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            code, stdout, _ = self.run_main(
+                '--case', 'SdblLexer:', '--baseline', os.path.join(tmp, 'missing.json'), '--json',
+            )
+
+        self.assertEqual(code, 0)
+        self.assertIn('SdblLexer:sdbl/samples.sdbl', json.loads(stdout))
+
+    def test_main_adds_normalized_rows(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            code, stdout, _ = self.run_main(
+                '--case', 'SdblLexer:', '--normalized', '--baseline', os.path.join(tmp, 'missing.json'), '--json',
+            )
+        results = json.loads(stdout)
+
+        self.assertEqual(code, 0)
+        self.assertEqual(
+            results['SdblLexer:sdbl/samples.sdbl normalized']['bytes'],
+            results['SdblLexer:sdbl/samples.sdbl']['bytes'],
+        )
+
+    def test_main_rejects_unknown_case(self):
+        code, _, stderr = self.run_main('--case', 'no-such-case')
+
+        self.assertEqual(code, 2)
+        self.assertIn('No benchmark cases selected', stderr)
+
+    def test_main_runs_generated_scaling_and_snippet_cases(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            code, stdout, _ = self.run_main(
+                '--scaling', 'sdbl', '--sizes', '2KB,8KB', '--snippets', '20',
+                '--baseline', os.path.join(tmp, 'missing.json'), '--json',
+            )
+
+        self.assertEqual(code, 0)
+        results = json.loads(stdout)
+        self.assertEqual(
+            list(results),
+            ['SdblLexer:sdbl:2KB', 'SdblLexer:sdbl:8KB', 'BslLexer:mixed:20 snippets'],
+        )
+        self.assertGreaterEqual(results['SdblLexer:sdbl:8KB']['bytes'], 8 * 1024)
+        self.assertGreater(results['BslLexer:mixed:20 snippets']['tokens'], 20)
+
+    def test_main_runs_lex_file_case(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            code, stdout, _ = self.run_main(
+                '--lex-file', '16KB', '--window', '4KB',
+                '--baseline', os.path.join(tmp, 'missing.json'), '--json',
+            )
+
+        self.assertEqual(code, 0)
+        results = json.loads(stdout)
+        self.assertEqual(list(results), ['BslLexer:mixed:16KB lex_file'])
+        self.assertGreaterEqual(results['BslLexer:mixed:16KB lex_file']['bytes'], 16 * 1024)
+        self.assertGreater(results['BslLexer:mixed:16KB lex_file']['tokens'], 0)
+
+    def test_main_rejects_invalid_scaling_size(self):
+        with self.assertRaises(SystemExit):
+            self.run_main('--scaling', 'mixed', '--sizes', 'huge')
@@ -0,0 +1,84 @@
+import os
+from array import array
+from unittest import TestCase
+
+from pygments.token import Comment, Token
+
+from pygments_bsl import compact
+from pygments_bsl.lexer import BslLexer, ConstraintLogicLexer, SdblLexer, SdblQueryLexer
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), 'examplefiles')
+
+
+def read(*path):
+    with open(os.path.join(EXAMPLES, *path), encoding='utf-8-sig') as file:
+        return file.read()
+
+
+class TokenCountLexer:
+    """Emits one token of its own type per character."""
+
+    def __init__(self, count):
+        self.types = [getattr(Token.Compact, f'T{number}') for number in range(count)]
+
+    def get_tokens_unprocessed(self, text):
+        for pos, char in enumerate(text):
+            yield pos, self.types[pos % len(self.types)], char
+
+    def get_token_spans(self, text):
+        for pos in range(len(text)):
+            yield pos, pos + 1, self.types[pos % len(self.types)]
+
+
+class CompactTokensTestCase(TestCase):
+
+    def test_same_tokens_as_the_lexer(self):
+        cases = (
+            (BslLexer, read('bsl', 'samples.bsl')),
+            (BslLexer, read('bsl', 'samples.os')),
+            (SdblLexer, read('sdbl', 'samples.sdbl')),
+            (SdblQueryLexer, 'ВЫБРАТЬ\n|\tТ.Поле КАК Поле // комментарий\n|ИЗ Справочник.Т КАК Т'),
+            (ConstraintLogicLexer, 'РазрешитьЧтение\nГДЕ ЗначениеРазрешено(Т.Организация)\n;'),
+        )
+        for lexer_cls, text in cases:
+            lexer = lexer_cls()
+            expected = list(lexer.get_tokens_unprocessed(text))
+            tokens = lexer.tokenize_compact(text)
+            with self.subTest(lexer=lexer_cls.__name__):
+                self.assertEqual(list(tokens), expected)
+                self.assertEqual(list(tokens.get_tokens()), [(token, value) for _, token, value in expected])
+                self.assertEqual(len(tokens), len(expected))
+                self.assertIs(tokens.text, text)
+
+    def test_columns(self):
+        text = 'А = 1; // Текст\n'
+        tokens = BslLexer().tokenize_compact(text)
+
+        self.assertEqual(tokens.starts.typecode, compact._OFFSET_TYPECODE)
+        self.assertEqual(tokens.ends.typecode, compact._OFFSET_TYPECODE)
+        self.assertEqual(tokens.types.typecode, 'B')
+        self.assertEqual(len(set(tokens.table)), len(tokens.table))
+        self.assertEqual(set(tokens.types), set(range(len(tokens.table))))
+        self.assertEqual(
+            tokens.nbytes, len(tokens) * (2 * tokens.starts.itemsize + tokens.types.itemsize),
+        )
+        comment = next(index for index in range(len(tokens)) if tokens.tokentype(index) in Comment)
+        self.assertEqual(tokens.value(comment), '// Текст')
+        self.assertEqual(tokens[comment], (7, tokens.tokentype(comment), '// Текст'))
+        self.assertEqual(tokens[-1][2], '\n')
+
+    def test_type_ids_widen_past_a_byte(self):
+        lexer = TokenCountLexer(300)
+        text = 'x' * 600
+        tokens = compact.tokenize(lexer, text)
+
+        self.assertEqual(tokens.types.typecode, 'H')
+        self.assertEqual(list(tokens), list(lexer.get_tokens_unprocessed(text)))
+
+    def test_empty_text(self):
+        tokens = compact.tokenize(TokenCountLexer(1), '')
+
+        self.assertEqual(len(tokens), 0)
+        self.assertEqual(tokens.table, ())
+        self.assertEqual(tokens.types, array('B'))
+        self.assertEqual(list(tokens.get_tokens()), [])
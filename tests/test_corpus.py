@@ -0,0 +1,99 @@
+import contextlib
+import io
+import os
+import tempfile
+from unittest import TestCase
+
+from pygments.token import Error, Generic
+
+from pygments_bsl import corpus
+from pygments_bsl.lexer import BslLexer, SdblLexer
+
+
+def errors(lexer, text):
+    return [value for token, value in lexer.get_tokens(text) if token in Error or token in Generic.Error]
+
+
+class CorpusTestCase(TestCase):
+
+    def test_parse_size(self):
+        self.assertEqual(corpus.parse_size('10MB'), 10 * 1024 * 1024)
+        self.assertEqual(corpus.parse_size('512kb'), 512 * 1024)
+        self.assertEqual(corpus.parse_size('1.5K'), 1536)
+        self.assertEqual(corpus.parse_size(100), 100)
+        with self.assertRaises(ValueError):
+            corpus.parse_size('ten')
+
+    def test_modules_are_deterministic_and_reach_the_size(self):
+        for profile in corpus.PROFILES:
+            with self.subTest(profile=profile):
+                text = corpus.generate(20000, profile)
+                self.assertEqual(text, corpus.generate(20000, profile))
+                self.assertNotEqual(text, corpus.generate(20000, profile, seed=2))
+                self.assertGreaterEqual(len(text.encode('utf-8')), 20000)
+                self.assertLess(len(text.encode('utf-8')), 30000)
+
+    def test_modules_lex_without_errors(self):
+        for profile in corpus.PROFILES:
+            lexer = SdblLexer() if profile == 'sdbl' else BslLexer()
+            with self.subTest(profile=profile):
+                self.assertEqual(errors(lexer, corpus.generate(30000, profile)), [])
+
+    def test_profiles_differ_in_content(self):
+        query = corpus.generate(30000, 'query-heavy')
+        comments = corpus.generate(30000, 'comment-heavy')
+
+        self.assertGreater(query.count('ВЫБРАТЬ'), 3 * comments.count('ВЫБРАТЬ'))
+        self.assertGreater(comments.count('//'), query.count('//'))
+        for construct in ('#Область', '&На', 'Процедура', '// Параметры:', 'НСтр("ru = '):
+            with self.subTest(construct=construct):
+                self.assertIn(construct, corpus.generate(30000, 'mixed'))
+
+    def test_snippets(self):
+        snippets = corpus.generate_snippets(50, 'query-heavy')
+
+        self.assertEqual(len(snippets), 50)
+        self.assertEqual(snippets, corpus.generate_snippets(50, 'query-heavy'))
+        self.assertEqual(errors(BslLexer(), ''.join(snippets)), [])
+        self.assertIn('ВЫБРАТЬ', corpus.generate_snippets(1, 'sdbl')[0])
+
+    def test_unknown_profile_is_rejected(self):
+        with self.assertRaises(ValueError):
+            corpus.generate(100, 'nope')
+        with self.assertRaises(ValueError):
+            corpus.generate_snippets(1, 'nope')
+
+
+class CorpusMainTestCase(TestCase):
+
+    def run_main(self, *argv):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            code = corpus.main(list(argv))
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def test_writes_a_module(self):
+        code, stdout, _ = self.run_main('--size', '4KB', '--profile', 'sdbl')
+
+        self.assertEqual(code, 0)
+        self.assertEqual(stdout, corpus.generate(4096, 'sdbl'))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'module.bsl')
+            self.run_main('--size', '4KB', '-o', path)
+            with open(path, encoding='utf-8') as fh:
+                self.assertEqual(fh.read(), corpus.generate(4096))
+
+    def test_writes_snippet_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            code, _, _ = self.run_main('--snippets', '12', '--profile', 'sdbl', '--output', tmp)
+
+            self.assertEqual(code, 0)
+            names = sorted(os.listdir(tmp))
+            self.assertEqual(len(names), 12)
+            self.assertEqual(names[0], 'snippet00.sdbl')
+
+    def test_invalid_arguments(self):
+        for argv in (('--size', 'big'), ('--snippets', '3')):
+            with self.subTest(argv=argv), self.assertRaises(SystemExit):
+                self.run_main(*argv)
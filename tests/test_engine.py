@@ -0,0 +1,288 @@
+import os
+import re
+from unittest import TestCase, mock
+
+from pygments.lexer import RegexLexer
+from pygments.token import Error, Token, Whitespace
+from pygments.util import OptionError
+
+from pygments_bsl import engine
+from pygments_bsl.lexer import BslLexer, ConstraintLogicLexer, SdblLexer, SdblQueryLexer
+
+CURRENT_DIR = os.path.abspath(os.path.dirname(__file__))
+CORPUS = (
+    (BslLexer, 'bsl/big.bsl'),
+    (BslLexer, 'bsl/samples.bsl'),
+    (BslLexer, 'bsl/samples.os'),
+    (SdblLexer, 'sdbl/samples.sdbl'),
+    (SdblQueryLexer, 'sdbl/samples.sdbl'),
+    (ConstraintLogicLexer, 'sdbl/samples.sdbl'),
+)
+
+
+def read_example(path):
+    with open(os.path.join(CURRENT_DIR, 'examplefiles', path), encoding='utf-8') as fh:
+        return fh.read()
+
+
+class TinyLexer(engine.EngineMixin, RegexLexer):
+    tokens = {
+        'root': [
+            (r'a', Token.Name, 'inner'),
+            (r'\n', Token.Text),
+        ],
+        'inner': [
+            (r'b', Token.Keyword),
+            (r'c', Token.Keyword, '#push'),
+            (r'd', Token.Keyword, '#pop:3'),
+            (r'e+', engine.TokenAction(lambda lexer, match: Token.Number if len(match.group()) > 1 else Token.String)),
+            (r'(f)(g)?(h)', engine.bygroups(Token.Name, None, Token.Operator)),
+            (r'i+', lambda lexer, match: iter([(match.start(), Token.Comment, match.group())])),
+        ],
+    }
+
+
+class EngineEquivalenceTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.reference = {}
+        for lexer_cls, path in CORPUS:
+            text = read_example(path)
+            cls.reference[lexer_cls, path] = (
+                text, list(lexer_cls(engine='regex').get_tokens_unprocessed(text)),
+            )
+
+    def test_engines_match_regex_engine_on_corpus(self):
+        for name in engine.ENGINES:
+            for (lexer_cls, path), (text, expected) in self.reference.items():
+                with self.subTest(engine=name, lexer=lexer_cls.__name__, path=path):
+                    lexer = lexer_cls(engine=name)
+                    self.assertEqual(list(lexer.get_tokens_unprocessed(text)), expected)
+
+    def test_spans_match_regex_engine_tokens_on_corpus(self):
+        for name in (engine.STOCK_ENGINE, *engine.ENGINES):
+            for (lexer_cls, path), (text, expected) in self.reference.items():
+                with self.subTest(engine=name, lexer=lexer_cls.__name__, path=path):
+                    self.assertEqual(
+                        list(lexer_cls(engine=name).get_token_spans(text)),
+                        [(pos, pos + len(value), token) for pos, token, value in expected],
+                    )
+
+
+class EngineOptionTestCase(TestCase):
+
+    def test_default_engine_is_dispatch(self):
+        self.assertEqual(BslLexer().engine, 'dispatch')
+        self.assertEqual(BslLexer(engine='regex').engine, 'regex')
+
+    def test_unknown_engine_is_rejected(self):
+        with self.assertRaises(OptionError):
+            BslLexer(engine='nope')
+
+    def test_engine_option_reaches_embedded_query_lexer(self):
+        source = 'Запрос.Текст = "ВЫБРАТЬ 1 КАК Поле";'
+        for name in engine.ENGINES:
+            with self.subTest(engine=name):
+                self.assertEqual(
+                    list(BslLexer(engine=name).get_tokens(source)),
+                    list(BslLexer(engine='regex').get_tokens(source)),
+                )
+
+    def test_unmatched_characters_recover_like_regex_lexer(self):
+        text = 'ab\nxacccd\n'
+        expected = list(TinyLexer(engine='regex').get_tokens_unprocessed(text))
+        self.assertIn((2, Whitespace, '\n'), expected)
+        self.assertIn((3, Error, 'x'), expected)
+
+        for name in engine.ENGINES:
+            with self.subTest(engine=name):
+                self.assertEqual(list(TinyLexer(engine=name).get_tokens_unprocessed(text)), expected)
+
+    def test_token_actions_emit_the_whole_match(self):
+        text = 'aebeeed\n'
+        expected = [
+            (0, Token.Name, 'a'),
+            (1, Token.String, 'e'),
+            (2, Token.Keyword, 'b'),
+            (3, Token.Number, 'eee'),
+            (6, Token.Keyword, 'd'),
+            (7, Token.Text, '\n'),
+        ]
+
+        for name in (engine.STOCK_ENGINE, *engine.ENGINES):
+            with self.subTest(engine=name):
+                self.assertEqual(list(TinyLexer(engine=name).get_tokens_unprocessed(text)), expected)
+
+    def test_spans_are_the_token_offsets(self):
+        text = 'afhfghiib\nxaeed\n'
+        expected = list(TinyLexer(engine='regex').get_tokens_unprocessed(text))
+        self.assertIn((5, Token.Operator, 'h'), expected)
+        self.assertNotIn((4, Token.Name, 'g'), expected)
+
+        for name in (engine.STOCK_ENGINE, *engine.ENGINES):
+            with self.subTest(engine=name):
+                lexer = TinyLexer(engine=name)
+                self.assertEqual(list(lexer.get_tokens_unprocessed(text)), expected)
+                self.assertEqual(
+                    list(lexer.get_token_spans(text)),
+                    [(pos, pos + len(value), token) for pos, token, value in expected],
+                )
+
+    def test_normalized_tokens_skip_only_the_preprocessing(self):
+        # what get_tokens makes of the file: no blank lines around, one last newline
+        text = read_example('bsl/samples.bsl').strip('\n') + '\n'
+        lexer = BslLexer()
+
+        self.assertEqual(list(lexer.get_tokens_normalized(text)), list(lexer.get_tokens(text)))
+        self.assertEqual(
+            ''.join(value for _, value in lexer.get_tokens_normalized('\ufeff\nА = 1;\r\n\tБ = 2;')),
+            '\ufeff\nА = 1;\r\n\tБ = 2;',
+        )
+
+    def test_normalized_tokens_are_filtered(self):
+        lexer = BslLexer()
+        lexer.add_filter('keywordcase', case='upper')
+
+        self.assertIn((Token.Keyword, 'ЕСЛИ'), list(lexer.get_tokens_normalized('Если А Тогда\nКонецЕсли;\n')))
+        self.assertIn(
+            (Token.Keyword, 'Если'),
+            list(lexer.get_tokens_normalized('Если А Тогда\nКонецЕсли;\n', unfiltered=True)),
+        )
+
+    def test_span_actions_slice_the_values_when_called(self):
+        match = re.compile(r'(f)(g)?(h)').match('fh')
+        action = engine.bygroups(Token.Name, Token.Keyword, Token.Operator)
+
+        self.assertEqual(list(action.spans(None, match)), [(0, 1, Token.Name), (1, 2, Token.Operator)])
+        self.assertEqual(list(action(None, match)), [(0, Token.Name, 'f'), (1, Token.Operator, 'h')])
+
+    def test_apply_transition_follows_regex_lexer_rules(self):
+        cases = (
+            (['root'], ('#pop', 'a', '#push'), ['root', 'a', 'a']),
+            (['root', 'a'], -5, ['root']),
+            (['root', 'a', 'b'], -1, ['root', 'a']),
+            (['root'], '#push', ['root', 'root']),
+        )
+        for stack, new_state, expected in cases:
+            with self.subTest(new_state=new_state):
+                engine.apply_transition(stack, new_state)
+                self.assertEqual(stack, expected)
+
+    def test_apply_transition_rejects_unknown_state_def(self):
+        with self.assertRaises(ValueError):
+            engine.apply_transition(['root'], object())
+
+    def test_matchers_are_rebuilt_after_tables_are_recompiled(self):
+        TinyLexer()
+        first = engine.state_matchers(TinyLexer, 'combined')
+        self.assertIs(engine.state_matchers(TinyLexer, 'combined'), first)
+
+        del TinyLexer._tokens
+        TinyLexer()
+
+        self.assertIsNot(engine.state_matchers(TinyLexer, 'combined'), first)
+
+    def test_dispatch_matchers_do_not_parse_the_rules_again(self):
+        TinyLexer()
+        del TinyLexer._tokens
+        engine.first_char_test.cache_clear()
+        self.addCleanup(engine.first_char_test.cache_clear)
+        with mock.patch.dict(os.environ, {'PYGMENTS_BSL_NO_CACHE': '1'}):
+            TinyLexer()
+            with mock.patch.object(engine, '_analyse_first_chars', side_effect=AssertionError):
+                matchers = engine.state_matchers(TinyLexer, 'dispatch')
+
+        self.assertIn('root', matchers)
+
+
+class TimeBudgetTestCase(TestCase):
+
+    def setUp(self):
+        self.text = read_example('bsl/samples.bsl')
+        self.expected = list(BslLexer().get_tokens_unprocessed(self.text))
+        # every look at the clock is a second later: two batches fit in 1.5 s
+        clock = mock.patch.object(engine.time, 'perf_counter', side_effect=range(10 ** 6))
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def test_rest_of_the_text_is_one_text_token(self):
+        cuts = []
+        lexer = BslLexer(time_budget_ms=1500, on_budget_exceeded=lambda lexer, pos: cuts.append((lexer, pos)))
+
+        tokens = list(lexer.get_tokens_unprocessed(self.text))
+
+        pos = tokens[-1][0]
+        self.assertEqual(tokens[:-1], self.expected[:2 * engine.BUDGET_BATCH])
+        self.assertEqual(tokens[-1], (pos, Token.Text, self.text[pos:]))
+        self.assertEqual(''.join(value for _, _, value in tokens), self.text)
+        self.assertEqual(lexer.budget_exceeded, 1)
+        self.assertEqual(cuts, [(lexer, pos)])
+
+    def test_spans_are_cut_like_the_tokens(self):
+        lexer = BslLexer(time_budget_ms=1500)
+        tokens = list(lexer.get_tokens_unprocessed(self.text))
+
+        self.assertEqual(
+            list(lexer.get_token_spans(self.text)),
+            [(pos, pos + len(value), token) for pos, token, value in tokens],
+        )
+        self.assertEqual(lexer.budget_exceeded, 2)
+
+    def test_text_lexed_within_the_budget_is_not_cut(self):
+        lexer = BslLexer(time_budget_ms=10 ** 9)
+
+        self.assertEqual(list(lexer.get_tokens_unprocessed(self.text)), self.expected)
+        self.assertEqual(list(BslLexer(time_budget_ms=1500).get_tokens_unprocessed('А = 1;\n')), [
+            (0, Token.Name.Variable, 'А'), (1, Token.Text, ' '), (2, Token.Operator, '='),
+            (3, Token.Text, ' '), (4, Token.Literal.Number, '1'), (5, Token.Punctuation, ';'),
+            (6, Token.Text, '\n'),
+        ])
+        self.assertEqual(lexer.budget_exceeded, 0)
+
+    def test_embedded_lexers_have_no_budget_of_their_own(self):
+        lexer = BslLexer(time_budget_ms=10 ** 9)
+        list(lexer.get_tokens_unprocessed('А = "ВЫБРАТЬ 1";\n'))
+
+        self.assertEqual([sub.time_budget_ms for sub in lexer._embedded_lexers.values()], [0])
+
+
+class FirstCharTestTestCase(TestCase):
+
+    def setUp(self):
+        # analyse the patterns here, not in an earlier run that filled the disk cache
+        env = mock.patch.dict(os.environ, {'PYGMENTS_BSL_NO_CACHE': '1'})
+        env.start()
+        self.addCleanup(env.stop)
+        engine.first_char_test.cache_clear()
+        self.addCleanup(engine.first_char_test.cache_clear)
+
+    def assertFirstChars(self, pattern, flags, accepted, rejected, nullable=False):
+        test, is_nullable = engine.first_char_test(pattern, flags)
+        self.assertEqual(is_nullable, nullable)
+        for char in accepted:
+            with self.subTest(pattern=pattern, char=char):
+                self.assertTrue(test(char))
+        for char in rejected:
+            with self.subTest(pattern=pattern, char=char):
+                self.assertFalse(test(char))
+
+    def test_zero_width_prefixes_are_skipped(self):
+        self.assertFirstChars(r'(?<=\.)\b[^\S\n]+x', 0, ' \t', 'x.\n')
+
+    def test_optional_items_add_following_chars(self):
+        self.assertFirstChars(r'(?:\/\/)?[0-9]+|(a|b)*?c', 0, '/5abc', 'd')
+
+    def test_case_insensitive_and_scoped_flags(self):
+        self.assertFirstChars(r'(?:Тип|(?-i:ССЫЛКА))', re.IGNORECASE, 'тТС', 'сx')
+        self.assertFirstChars(r'(?s:.)|[^a]', 0, '\nb', '')
+
+    def test_nullable_patterns_match_anything(self):
+        self.assertFirstChars(r'a*', 0, 'a', 'b', nullable=True)
+        self.assertFirstChars(r'', 0, '', 'a', nullable=True)
+
+    def test_unsupported_constructs_fall_back_to_any_char(self):
+        self.assertFirstChars(r'(a)?\1', 0, 'az', '', nullable=True)
+        self.assertFirstChars(r'\1', 0, 'xyz', '', nullable=True)
+        self.assertFirstChars(r'(', 0, 'xyz', '', nullable=True)
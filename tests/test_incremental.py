@@ -0,0 +1,139 @@
+import os
+import random
+from unittest import TestCase
+
+from pygments.token import Token
+
+from pygments_bsl import incremental
+from pygments_bsl.incremental import IncrementalBslLexer
+from pygments_bsl.lexer import BslLexer
+
+CURRENT_DIR = os.path.abspath(os.path.dirname(__file__))
+SNIPPETS = (
+    '"', '""', '\n', '|', '(', ')', ';', '.', ' ', "'", '//', '#Если ', 'ВЫБРАТЬ ',
+    'Процедура Тест()\n', 'КонецПроцедуры\n', 'en = \'Текст\';', 'Новый Массив',
+)
+
+
+def read_example(path):
+    with open(os.path.join(CURRENT_DIR, 'examplefiles', path), encoding='utf-8') as fh:
+        return fh.read()
+
+
+class IncrementalBslLexerTestCase(TestCase):
+
+    def assertSameAsFullLexing(self, document):
+        self.assertEqual(
+            list(document.get_tokens_unprocessed()),
+            list(BslLexer().get_tokens_unprocessed(document.text)),
+        )
+
+    def test_random_edits_match_full_lexing(self):
+        document = IncrementalBslLexer(read_example('bsl/samples.bsl'))
+        rnd = random.Random(1)
+        for _ in range(150):
+            offset = rnd.randrange(len(document.text) + 1)
+            removed = min(rnd.choice((0, 0, 1, 5, 40)), len(document.text) - offset)
+            inserted = rnd.choice(SNIPPETS) if rnd.random() < 0.8 else ''
+            with self.subTest(offset=offset, removed=removed, inserted=inserted):
+                document.edit(offset, removed, inserted)
+                self.assertSameAsFullLexing(document)
+
+    def test_edit_relexes_only_until_states_converge(self):
+        text = read_example('bsl/samples.bsl')
+        document = IncrementalBslLexer(text)
+        offset = text.index('КонецПроцедуры', len(text) // 2)
+
+        start, stop = document.edit(offset, 0, 'Б = 1;\n')
+
+        self.assertLess(stop - start, 1000)
+        self.assertLessEqual(start, offset)
+        self.assertGreater(stop, offset)
+        self.assertSameAsFullLexing(document)
+
+    def test_edit_inside_a_multiline_query_string(self):
+        text = 'Запрос.Текст = "ВЫБРАТЬ\n|\tПоле\n|ИЗ\n|\tТаблица";\nА = 1;\n'
+        document = IncrementalBslLexer(text)
+
+        start, stop = document.edit(text.index('Поле'), 4, 'ВЫРАЗИТЬ(Поле\n|КАК СТРОКА(10))')
+
+        self.assertEqual(start, 0)
+        self.assertEqual(stop, document.text.index('А = 1'))
+        self.assertIn((Token.Name.Class, 'СТРОКА'), [token[1:] for token in document.get_tokens_unprocessed()])
+        self.assertSameAsFullLexing(document)
+
+    def test_edit_far_inside_a_string_reclassifies_its_opening_quote(self):
+        text = 'Текст = "начало\n|строка 1\n|строка 2\n|строка 3\n|строка 4\n|ИЗ Таблица";\n'
+        document = IncrementalBslLexer(text)
+
+        start, _ = document.edit(text.index('ИЗ'), 0, 'ВЫБРАТЬ 1 ')
+
+        self.assertEqual(start, 0)
+        self.assertIn((8, Token.Literal.String, '"'), list(document.get_tokens_unprocessed(0, 9)))
+        self.assertSameAsFullLexing(document)
+
+    def test_call_lookahead_over_blank_lines(self):
+        text = 'А = Б.Метод\n\n;\n'
+        document = IncrementalBslLexer(text)
+
+        document.edit(text.index(';'), 1, '(1);')
+
+        self.assertIn((6, Token.Name.Function, 'Метод'), list(document.get_tokens_unprocessed()))
+        self.assertSameAsFullLexing(document)
+
+    def test_opening_a_string_relexes_following_lines(self):
+        text = 'А = 1;\n|Б = 2;\n|В = 3;\n'
+        document = IncrementalBslLexer(text)
+
+        _, stop = document.edit(text.index('1;'), 0, '"')
+
+        self.assertEqual(stop, len(document.text))
+        self.assertSameAsFullLexing(document)
+
+    def test_tokens_can_be_read_for_a_range(self):
+        text = 'А = 1;\nБ = 2;\nВ = 3;\n'
+        document = IncrementalBslLexer(text)
+
+        self.assertEqual(
+            list(document.get_tokens_unprocessed(7, 14)),
+            [token for token in BslLexer().get_tokens_unprocessed(text) if 7 <= token[0] < 14],
+        )
+
+    def test_set_text_and_empty_document(self):
+        document = IncrementalBslLexer()
+        self.assertEqual(list(document.get_tokens_unprocessed()), [])
+
+        document.edit(0, 0, 'Возврат;')
+        self.assertSameAsFullLexing(document)
+        document.set_text('А = 1;')
+        self.assertSameAsFullLexing(document)
+
+    def test_fast_mode_document(self):
+        document = IncrementalBslLexer(read_example('bsl/samples.bsl'), mode='fast', fast_mode_above=1)
+        offset = document.text.index('ВЫБРАТЬ')
+        document.edit(offset, 0, '"')
+
+        self.assertEqual(
+            list(document.get_tokens_unprocessed()),
+            list(BslLexer(mode='fast').get_tokens_unprocessed(document.text)),
+        )
+
+    def test_edit_outside_of_the_text_is_rejected(self):
+        document = IncrementalBslLexer('А = 1;')
+        for offset, removed in ((-1, 0), (0, 7), (3, -1)):
+            with self.subTest(offset=offset, removed=removed):
+                with self.assertRaises(ValueError):
+                    document.edit(offset, removed, '')
+
+    def test_restart_offset_backs_up_over_lookahead_lines(self):
+        text = 'А = 1;\nБ = 2;\n\nВ = 3;\nГ = 4;\nД = 5;\n'
+
+        self.assertEqual(incremental.restart_offset(text, text.index('Д')), text.index('Б'))
+        self.assertEqual(incremental.restart_offset(text, 2), 0)
+
+    def test_lookahead_end_covers_lookahead_lines_and_open_strings(self):
+        text = 'А = 1;\n\nБ = 2;\nВ = 3;\nГ = 4;\nД = 5;\nЕ = 6;\n'
+        self.assertEqual(incremental.lookahead_end(text, text.index('Б')), text.index('Е'))
+
+        text = 'А = "начало\n' + 'Б = 1;\n' * 10 + 'В = "конец";\n'
+        self.assertGreater(incremental.lookahead_end(text, text.index('Б')), text.index('конец'))
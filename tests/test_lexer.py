@@ -1,6 +1,7 @@
+import importlib.util
 import os
 import re
-from unittest import TestCase
+from unittest import TestCase, mock
 
 from pygments import lexers as pygments_lexers
 from pygments.token import Token
@@ -17,6 +18,14 @@ LOCAL_LEXER_FACTORIES = {
 }
 
 
+def load_generate_data():
+    path = os.path.join(CURRENT_DIR, os.pardir, 'tools', 'generate_data.py')
+    spec = importlib.util.spec_from_file_location('generate_data', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 def filter_tokens(tokens):
     """Drop whitespace/empty tokens for easier assertions."""
     return [
@@ -29,6 +38,11 @@ class FakeMatch:
     def __init__(self, groups, starts):
         self._groups = groups
         self._starts = starts
+        # the groups at their offsets, blanks between them
+        chars = [' '] * max(starts[index] + len(value) for index, value in groups.items())
+        for index, value in groups.items():
+            chars[starts[index]:starts[index] + len(value)] = value
+        self.string = ''.join(chars)
 
     def group(self, index=0):
         return self._groups[index]
@@ -36,6 +50,43 @@ class FakeMatch:
     def start(self, index=0):
         return self._starts[index]
 
+    def end(self, index=0):
+        return self._starts[index] + len(self._groups[index])
+
+    def span(self, index=0):
+        return self.start(index), self.end(index)
+
+
+class OffsetsOnlyMatch:
+    """A match whose groups can be located but not read."""
+
+    def __init__(self, match):
+        self._match = match
+        self.string = match.string
+
+    def group(self, index=0):
+        raise AssertionError(f'group({index}) was read')
+
+    def start(self, index=0):
+        return self._match.start(index)
+
+    def end(self, index=0):
+        return self._match.end(index)
+
+    def span(self, index=0):
+        return self._match.span(index)
+
+
+def rule_match(lexer_cls, callback, text):
+    """Match ``text`` with the first ``lexer_cls`` rule with ``callback`` that matches it."""
+    lexer_cls()
+    for rules in lexer_cls._tokens.values():
+        for rexmatch, action, _ in rules:
+            match = rexmatch(text, 0) if action is callback else None
+            if match:
+                return match
+    return None
+
 
 class LocalLexersProxy:
     """Return local lexer classes for unit tests instead of installed entry points."""
@@ -3405,6 +3456,118 @@ class BslSdblIntegrationTestCase(LexerTestCase):
             ],
         )
 
+    def test_sdbl_query_string_cast_spans_lines(self):
+        self.assertTokens(
+            '''
+Текст = "ВЫБРАТЬ
+|   ВЫРАЗИТЬ(Т.Поле
+|       КАК СТРОКА(10)) КАК Поле";
+            ''',
+            [
+                (Token.Name.Variable, 'Текст'),
+                (Token.Operator, '='),
+                (Token.Literal.String, '"'),
+                (Token.Keyword.Declaration, 'ВЫБРАТЬ'),
+                (Token.Literal.String, '|'),
+                (Token.Name.Builtin, 'ВЫРАЗИТЬ'),
+                (Token.Punctuation, '('),
+                (Token.Name.Variable, 'Т'),
+                (Token.Operator, '.'),
+                (Token.Name.Variable, 'Поле'),
+                (Token.Literal.String, '|'),
+                (Token.Keyword.Declaration, 'КАК'),
+                (Token.Name.Class, 'СТРОКА'),
+                (Token.Punctuation, '('),
+                (Token.Literal.Number, '10'),
+                (Token.Punctuation, ')'),
+                (Token.Punctuation, ')'),
+                (Token.Keyword.Declaration, 'КАК'),
+                (Token.Name.Variable, 'Поле'),
+                (Token.Literal.String, '"'),
+                (Token.Punctuation, ';'),
+            ],
+        )
+
+    def test_sdbl_query_string_cast_continues_after_escaped_quotes(self):
+        self.assertTokens(
+            '''
+Текст = "ВЫБРАТЬ ВЫРАЗИТЬ(""Имя"" КАК СТРОКА(200))";
+            ''',
+            [
+                (Token.Name.Variable, 'Текст'),
+                (Token.Operator, '='),
+                (Token.Literal.String, '"'),
+                (Token.Keyword.Declaration, 'ВЫБРАТЬ'),
+                (Token.Name.Builtin, 'ВЫРАЗИТЬ'),
+                (Token.Punctuation, '('),
+                (Token.Literal.String.Escape, '""'),
+                (Token.Name.Variable, 'Имя'),
+                (Token.Literal.String.Escape, '""'),
+                (Token.Keyword.Declaration, 'КАК'),
+                (Token.Name.Class, 'СТРОКА'),
+                (Token.Punctuation, '('),
+                (Token.Literal.Number, '200'),
+                (Token.Punctuation, ')'),
+                (Token.Punctuation, ')'),
+                (Token.Literal.String, '"'),
+                (Token.Punctuation, ';'),
+            ],
+        )
+
+    def test_sdbl_query_string_comments_split_the_embedded_tokens(self):
+        source = 'Текст = "ВЫБРАТЬ // Поле\n  |//""Т""\n\t|Поле КАК\n|  Имя";\n'
+        tokens = list(BslLexer().get_tokens_unprocessed(source))
+
+        self.assertEqual(''.join(value for _, _, value in tokens), source)
+        self.assertEqual(
+            [token[1:] for token in tokens[4:14]],
+            [
+                (Token.Literal.String, '"'),
+                (Token.Keyword.Declaration, 'ВЫБРАТЬ'),
+                (Token.Text, ' '),
+                (Token.Comment.Single, '// Поле'),
+                (Token.Text, '\n'),
+                (Token.Text, '  '),
+                (Token.Literal.String, '|'),
+                (Token.Comment.Single, '//""Т""'),
+                (Token.Text, '\n'),
+                (Token.Text, '\t'),
+            ],
+        )
+        self.assertIn((Token.Name.Variable, 'Имя'), [token[1:] for token in tokens])
+
+    def test_sdbl_query_string_tokens_over_line_breaks_are_cut_at_lines(self):
+        source = 'Текст = "ВЫБРАТЬ Поле КАК\n\tИмя";\n'
+        tokens = list(BslLexer().get_tokens_unprocessed(source))
+
+        self.assertEqual(
+            [token[1:] for token in tokens[7:14]],
+            [
+                (Token.Name.Variable, 'Поле'),
+                (Token.Text, ' '),
+                (Token.Keyword.Declaration, 'КАК'),
+                (Token.Text, '\n'),
+                (Token.Text, '\t'),
+                (Token.Name.Variable, 'Имя'),
+                (Token.Literal.String, '"'),
+            ],
+        )
+        self.assertEqual([pos for pos, _, _ in tokens[10:13]], [25, 26, 27])
+
+    def test_embedded_lexer_is_created_once_per_lexer(self):
+        lexer = BslLexer()
+        source = 'А = "ВЫБРАТЬ\n|1";\nБ = "ВЫБРАТЬ\n|2";\nОграничение.Установить("РазрешитьЧтение\n|ГДЕ ИСТИНА");\n'
+
+        first = filter_tokens(lexer.get_tokens(source))
+        embedded = dict(lexer._embedded_lexers)
+        second = filter_tokens(lexer.get_tokens(source))
+
+        self.assertEqual(first, second)
+        self.assertEqual(set(embedded), {lexer_mod.SdblQueryLexer, lexer_mod.ConstraintLogicLexer})
+        self.assertEqual(lexer._embedded_lexers, embedded)
+        self.assertFalse(embedded[lexer_mod.SdblQueryLexer].token_cache)
+
+
 
 class SdblLexerTestCase(LexerTestCase):
 
@@ -4549,6 +4712,115 @@ class ConstraintLogicLexerTestCase(TestCase):
         )
 
 
+class BslFastModeTestCase(TestCase):
+    SOURCE = (
+        '// Параметры:\n'
+        '//   Имя - Строка - имя\n'
+        '// TODO: проверить\n'
+        '&НаСервере\n'
+        'Функция Ф(Знач Имя = Поле, Число = 1) Экспорт\n'
+        '\tЗапрос = Новый Запрос("ВЫБРАТЬ\n'
+        '\t|\tТ.Ссылка // поле\n'
+        '\t|ИЗ Справочник.Т КАК Т");\n'
+        '\tТекст = НСтр("ru = \'Текст %1\'; en = \'Text %1\'");\n'
+        '\tВозврат СтрШаблон(Текст, 42);\n'
+        'КонецФункции\n'
+    )
+
+    def test_fast_mode_keeps_the_basic_tokens(self):
+        tokens = filter_tokens(BslLexer(mode='fast').get_tokens(self.SOURCE))
+
+        for token in (
+            (Token.Keyword, 'Функция'),
+            (Token.Keyword, 'TODO:'),
+            (Token.Name.Decorator, '&НаСервере'),
+            (Token.Keyword, 'Экспорт'),
+            (Token.Name.Class, 'Запрос'),
+            (Token.Comment.Single, '//   Имя - Строка - имя'),
+            (Token.Literal.Number, '42'),
+            (Token.Name.Builtin, 'СтрШаблон'),
+            (Token.Keyword, 'КонецФункции'),
+        ):
+            self.assertIn(token, tokens)
+
+    def test_fast_mode_keeps_todo_and_merge_markers(self):
+        source = (
+            '// Описание\n'
+            '// TODO: проверить границы\n'
+            '// {{MRG[ <-> ]\n'
+            '// }}MRG[ <-> ]\n'
+            'Процедура П()\n'
+            'КонецПроцедуры\n'
+        )
+
+        tokens = filter_tokens(BslLexer(mode='fast').get_tokens(source))
+
+        self.assertEqual(
+            [rule[0] for rule in lexer_mod.BslFastLexer.tokens['doc_comment']],
+            [BslLexer.TODO_COMMENT, BslLexer.MRG_COMMENT, BslLexer.DOC_PLAIN_COMMENT],
+        )
+        self.assertIn((Token.Keyword, 'TODO:'), tokens)
+        self.assertEqual(tokens.count((Token.Keyword, 'MRG')), 2)
+        self.assertIn((Token.Punctuation, '{{'), tokens)
+        self.assertIn((Token.Comment.Single, '// Описание'), tokens)
+
+    def test_fast_mode_skips_the_refinements(self):
+        full = filter_tokens(BslLexer().get_tokens(self.SOURCE))
+        fast = filter_tokens(BslLexer(mode='fast').get_tokens(self.SOURCE))
+
+        self.assertIn((Token.Generic.Error, 'Поле'), full)
+        self.assertIn((Token.Name.Variable, 'Поле'), fast)
+        self.assertIn((Token.Name.Class, 'Строка'), full)
+        self.assertIn((Token.Keyword.Declaration, 'ВЫБРАТЬ'), full)
+        self.assertIn((Token.Name.Attribute, 'ru'), full)
+        for token, value in fast:
+            self.assertNotIn(token, (Token.Generic.Error, Token.Keyword.Declaration, Token.Name.Attribute))
+        self.assertIn((Token.String, "ru = 'Текст "), fast)
+        self.assertIn((Token.String, '\tТ.Ссылка // поле'), fast)
+
+    def test_fast_mode_is_the_same_for_every_engine_and_covers_the_text(self):
+        with open(os.path.join(CURRENT_DIR, 'examplefiles', 'bsl', 'samples.bsl'), encoding='utf-8') as fh:
+            text = fh.read()
+        expected = list(BslLexer(engine='regex', mode='fast').get_tokens_unprocessed(text))
+
+        self.assertEqual(''.join(value for _, _, value in expected), text)
+        for engine in ('dispatch', 'combined'):
+            lexer = BslLexer(engine=engine, mode='fast')
+            with self.subTest(engine=engine):
+                self.assertEqual(list(lexer.get_tokens_unprocessed(text)), expected)
+                self.assertEqual(
+                    list(lexer.get_token_spans(text)),
+                    [(pos, pos + len(value), token) for pos, token, value in expected],
+                )
+
+    def test_fast_mode_above_switches_by_text_size(self):
+        lexer = BslLexer(fast_mode_above=len(self.SOURCE))
+        longer = self.SOURCE + '\n'
+
+        self.assertEqual(lexer.mode, 'full')
+        self.assertEqual(
+            list(lexer.get_tokens_unprocessed(self.SOURCE)),
+            list(BslLexer().get_tokens_unprocessed(self.SOURCE)),
+        )
+        self.assertEqual(
+            list(lexer.get_tokens_unprocessed(longer)),
+            list(BslLexer(mode='fast').get_tokens_unprocessed(longer)),
+        )
+        self.assertIsInstance(lexer._lexer_for(longer), lexer_mod.BslFastLexer)
+        self.assertIs(lexer._lexer_for(longer), lexer._lexer_for(longer))
+
+    def test_fast_lexer_drops_only_unreachable_states(self):
+        fast = lexer_mod.BslFastLexer()
+
+        self.assertEqual(fast.mode, 'fast')
+        self.assertFalse(set(fast._tokens) & lexer_mod._FAST_DROPPED_STATES)
+        for rules in fast._tokens.values():
+            for _, _, new_state in rules:
+                if isinstance(new_state, tuple):
+                    self.assertFalse(set(new_state) & lexer_mod._FAST_DROPPED_STATES)
+        self.assertLess(len(fast.tokens['doc_comment']), 5)
+
+
 class LexerInternalCoverageTestCase(TestCase):
     """Cover fallback/helper branches that are awkward to trigger end-to-end."""
 
@@ -4613,3 +4885,128 @@ class LexerInternalCoverageTestCase(TestCase):
                 (22, Token.Name.Class, 'Массив'),
             ],
         )
+
+    def test_trie_patterns_match_exactly_the_given_names(self):
+        generate_data = load_generate_data()
+        small, large = (
+            re.compile(pattern + r'\b', re.IGNORECASE)
+            for pattern in generate_data.trie_patterns([
+                ['Массив', 'МассивДанных', 'Map'],
+                ['Массив', 'МассивДанных', 'Map', 'ДанныеФормы', 'Мас'],
+            ])
+        )
+
+        for name in ('Массив', 'массивданных', 'MAP'):
+            with self.subTest(name=name):
+                self.assertEqual(small.match(name).group(), name)
+                self.assertEqual(large.match(name).group(), name)
+        for name in ('Масс', 'МассивДан', 'Maps', 'Данные', 'ДанныеФормы', 'Мас'):
+            with self.subTest(name=name):
+                self.assertIsNone(small.match(name))
+        self.assertEqual(large.match('ДанныеФормы').group(), 'ДанныеФормы')
+        self.assertEqual(large.match('мас').group(), 'мас')
+
+    def test_generated_patterns_are_up_to_date(self):
+        generate_data = load_generate_data()
+        from pygments_bsl import generated_patterns
+
+        self.assertEqual(
+            generate_data.trie_patterns([
+                lexer_mod.TYPE_NAMES, lexer_mod.TYPE_NAMES + generated_patterns.DOC_TYPE_EXTRA_NAMES,
+            ]),
+            [generated_patterns.TYPE_NAME_PATTERN, generated_patterns.DOC_TYPE_PATTERN],
+            'run python tools/generate_data.py --patterns-only',
+        )
+        self.assertEqual(generated_patterns.DOC_TYPE_EXTRA_NAMES, generate_data.DOC_TYPE_EXTRA_NAMES)
+        self.assertLessEqual(lexer_mod.CALL_ONLY_BUILTINS, set(BslLexer.DOC_TYPE_NAMES))
+
+    def test_type_name_patterns_cover_every_type_name(self):
+        type_pattern = re.compile(BslLexer.TYPE_NAME_PATTERN + r'$', re.IGNORECASE)
+        doc_pattern = re.compile(BslLexer.DOC_TYPE_PATTERN + r'$', re.IGNORECASE)
+
+        self.assertTrue(all(type_pattern.match(name) for name in lexer_mod.TYPE_NAMES))
+        self.assertTrue(all(doc_pattern.match(name) for name in BslLexer.DOC_TYPE_NAMES))
+
+    def test_name_table_keeps_the_first_token_of_each_kind(self):
+        table = lexer_mod._name_table(
+            [
+                ({'а', 'б'}, None, Token.Name.Builtin),
+                ({'б', 'в'}, Token.Keyword, Token.Keyword),
+            ],
+            (Token.Name.Variable, Token.Name.Function),
+        )
+
+        self.assertEqual(
+            table,
+            {
+                'а': (Token.Name.Variable, Token.Name.Builtin),
+                'б': (Token.Keyword, Token.Name.Builtin),
+                'в': (Token.Keyword, Token.Keyword),
+            },
+        )
+
+    def test_name_table_remembers_names_as_written(self):
+        table = lexer_mod._name_table(
+            [({'массив'}, Token.Name.Class, Token.Name.Class)],
+            (Token.Name.Variable, Token.Name.Function),
+        )
+        with mock.patch.object(lexer_mod, '_casefold', wraps=lexer_mod._casefold) as casefold:
+            self.assertEqual(table.tokens('МАССИВ'), (Token.Name.Class, Token.Name.Class))
+            self.assertEqual(table.tokens('МАССИВ'), (Token.Name.Class, Token.Name.Class))
+            self.assertEqual(table.tokens('Имя'), (Token.Name.Variable, Token.Name.Function))
+
+        self.assertEqual(casefold.call_count, 2)
+
+        with mock.patch.object(lexer_mod._NameTable, 'WRITTEN_NAMES', 2):
+            table.tokens('Другое')
+
+        self.assertEqual(table._written, {'Другое': (Token.Name.Variable, Token.Name.Function)})
+
+    def test_name_callbacks_look_for_calls_only_when_the_token_depends_on_it(self):
+        source = (
+            'Если Значение Тогда\n'
+            '    Сообщить(Значение);\n'
+            '    Результат = Макс(1, Новый Массив);\n'
+            'КонецЕсли;\n'
+        )
+        with mock.patch.object(lexer_mod, '_is_call', wraps=lexer_mod._is_call) as is_call:
+            tokens = list(BslLexer().get_tokens(source))
+
+        self.assertEqual(
+            [re.search(r'\w+$', text[:end]).group() for (text, end), _ in is_call.call_args_list],
+            ['Значение', 'Значение', 'Результат'],
+        )
+        self.assertIn((Token.Name.Builtin, 'Макс'), tokens)
+
+        with mock.patch.object(lexer_mod, '_is_call', wraps=lexer_mod._is_call) as is_call:
+            list(SdblLexer().get_tokens('ВЫБРАТЬ Поле, ЕСТЬNULL(Сумма, 0) ИЗ Таблица'))
+
+        self.assertEqual(
+            [re.search(r'\w+$', text[:end]).group() for (text, end), _ in is_call.call_args_list],
+            ['ЕСТЬNULL', 'Сумма'],
+        )
+
+    def test_span_callbacks_read_offsets_only(self):
+        cases = (
+            (SdblLexer, lexer_mod._sdbl_metadata_callback, 'РегистрСведений.Цены.СрезПоследних(&Дата)'),
+            (SdblLexer, lexer_mod._sdbl_metadata_callback, 'Справочник.Товары.Вид.0.Код'),
+            (BslLexer, lexer_mod._locale_assignment_callback, 'ru = '),
+            (BslLexer, lexer_mod._locale_single_quote_callback, "'Текст %1 %% \"\" %Б конец'"),
+            (BslLexer, lexer_mod._locale_error_pipe_line_callback, '\n  |ошибка'),
+            (BslLexer, lexer_mod._locale_missing_semicolon_callback, "ru = 'Текст' en = 'Text'\n"),
+            (BslLexer, lexer_mod._locale_extra_quote_callback, "ru = 'Текст'' хвост\n"),
+            (BslLexer, lexer_mod._locale_missing_semicolon_pipe_callback, "ru = 'Текст'\n  |en = 'Text'"),
+            (BslLexer, lexer_mod._doc_type_list_with_iz_callback, '// - Массив из Строка - описание'),
+            (BslLexer, lexer_mod._doc_type_list_bullet_callback, '// - Массив, Структура - описание'),
+            (BslLexer, lexer_mod._doc_type_list_after_name_callback, '// Параметр - Массив, Строка - описание'),
+            (BslLexer, lexer_mod._doc_type_list_bullet_with_iz_colon_callback, '// * Ключ - Массив из Строка:'),
+        )
+        for lexer_cls, callback, text in cases:
+            lexer = lexer_cls()
+            match = rule_match(lexer_cls, callback, text)
+            with self.subTest(callback=callback.spans.__name__, text=text):
+                self.assertIsNotNone(match)
+                self.assertEqual(
+                    list(callback.spans(lexer, OffsetsOnlyMatch(match))),
+                    [(pos, pos + len(value), token) for pos, token, value in callback(lexer, match)],
+                )
@@ -0,0 +1,141 @@
+import marshal
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from pygments.formatters import NullFormatter
+from pygments.token import Token
+
+from pygments_bsl import lines
+from pygments_bsl.lexer import BslLexer
+from pygments_bsl.lines import LineIndex, highlight_lines, iter_line_tokens, line_index
+
+CURRENT_DIR = os.path.abspath(os.path.dirname(__file__))
+
+
+def read_example(path):
+    with open(os.path.join(CURRENT_DIR, 'examplefiles', path), encoding='utf-8') as fh:
+        return fh.read()
+
+
+def expected_tokens(text, start, end, **options):
+    first = lines._line_offset(text, 0, start - 1)
+    last = lines._line_offset(text, first, end - start + 1)
+    for offset, token, value in BslLexer(**options).get_tokens_unprocessed(text):
+        if offset < last and offset + len(value) > first:
+            yield max(offset, first), token, value[max(first - offset, 0):last - offset]
+
+
+class LineIndexTestCase(TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        env = mock.patch.dict(os.environ, {'PYGMENTS_BSL_CACHE_DIR': tmp.name})
+        env.start()
+        self.addCleanup(env.stop)
+        self.text = read_example('bsl/samples.bsl')
+
+    def test_every_range_matches_full_lexing(self):
+        index = LineIndex.build(BslLexer(), self.text, every=7)
+        count = self.text.count('\n') + 1
+        for start in range(1, count + 1, 13):
+            for length in (1, 5, 60):
+                with self.subTest(start=start, length=length):
+                    self.assertEqual(
+                        list(iter_line_tokens(self.text, start, start + length - 1, index=index)),
+                        list(expected_tokens(self.text, start, start + length - 1)),
+                    )
+
+    def test_checkpoints_are_spread_over_the_text(self):
+        index = LineIndex.build(BslLexer(), self.text, every=20)
+
+        self.assertEqual(index.checkpoint(1), (1, 0, ('root',)))
+        self.assertGreater(len(index), (self.text.count('\n') + 1) // 40)
+        for line, offset in zip(index.lines, index.offsets):
+            self.assertEqual(self.text.count('\n', 0, offset) + 1, line)
+        for previous, line in zip(index.lines, index.lines[1:]):
+            self.assertGreaterEqual(line - previous, 1)
+            self.assertLessEqual((previous - 1) // 20, (line - 1) // 20 - 1)
+
+    def test_index_is_stored_and_reused(self):
+        index = line_index(self.text, every=10)
+
+        self.assertEqual(len(list(lines.directory().iterdir())), 1)
+        with mock.patch.object(LineIndex, 'build', side_effect=AssertionError):
+            stored = line_index(self.text, every=10)
+        self.assertEqual(stored.lines, index.lines)
+        self.assertEqual(stored.offsets, index.offsets)
+        self.assertEqual(stored.stacks, index.stacks)
+
+        line_index(self.text, every=10, mode='fast')
+        line_index(self.text + '\n', every=10)
+        self.assertEqual(len(list(lines.directory().iterdir())), 3)
+
+        lines.clear()
+        self.assertEqual(list(lines.directory().iterdir()), [])
+
+    def test_disabled_cache_writes_nothing(self):
+        with mock.patch.dict(os.environ, {'PYGMENTS_BSL_NO_CACHE': '1'}):
+            index = line_index(self.text, every=10)
+            self.assertEqual(list(iter_line_tokens(self.text, 5, 9)), list(expected_tokens(self.text, 5, 9)))
+
+        self.assertEqual(index.offsets, LineIndex.build(BslLexer(), self.text, every=10).offsets)
+        self.assertFalse(lines.directory().exists())
+
+    def test_least_recently_used_indexes_are_evicted(self):
+        texts = [self.text + ' ' * number for number in range(3)]
+        for text in texts:
+            line_index(text)
+        paths = sorted(lines.directory().iterdir())
+        for number, path in enumerate(paths):
+            os.utime(path, (number + 1, number + 1))
+
+        line_index(texts[0])
+        newest = sorted(lines.directory().iterdir(), key=lambda path: path.stat().st_mtime)[-1]
+        self.assertGreater(newest.stat().st_mtime, 3)
+        lines.evict(newest.stat().st_size)
+
+        self.assertEqual(list(lines.directory().iterdir()), [newest])
+        with mock.patch.object(LineIndex, 'build', side_effect=AssertionError):
+            line_index(texts[0])
+
+    def test_damaged_entry_is_built_again(self):
+        index = line_index(self.text)
+        path, = lines.directory().iterdir()
+        path.write_bytes(b'broken')
+
+        self.assertEqual(line_index(self.text).offsets, index.offsets)
+        entry = list(marshal.loads(index.dumps()))
+        entry[0] += 1
+        with self.assertRaisesRegex(ValueError, 'format'):
+            LineIndex.loads(marshal.dumps(tuple(entry)))
+
+    def test_highlight_lines(self):
+        text = self.text
+        start, end = 100, 140
+
+        output = highlight_lines(text, start, end, NullFormatter(), mode='fast')
+
+        self.assertEqual(output, ''.join(text.splitlines(keepends=True)[start - 1:end]))
+        self.assertEqual(
+            list(iter_line_tokens(text, start, end, mode='fast')),
+            list(expected_tokens(text, start, end, mode='fast')),
+        )
+
+    def test_ranges_outside_of_the_text(self):
+        self.assertEqual(list(iter_line_tokens('А = 1;\n', 5, 10)), [])
+        self.assertEqual(list(iter_line_tokens('А = 1;\n', 2, 1)), [])
+        self.assertEqual(list(iter_line_tokens('', 1, 1)), [])
+        with self.assertRaises(ValueError):
+            list(iter_line_tokens('А = 1;\n', 0, 1))
+
+    def test_tokens_crossing_the_range_are_cut(self):
+        text = 'А\nБ\nВ\nГ\n'
+        index = LineIndex.build(BslLexer(), text)
+        tokens = [(0, Token.Comment, 'А\nБ'), (3, Token.Text, '\nВ\nГ\n')]
+
+        with mock.patch.object(lines, 'iter_tokens', return_value=iter(tokens)):
+            cut = list(iter_line_tokens(text, 2, 3, index=index))
+
+        self.assertEqual(cut, [(2, Token.Comment, 'Б'), (3, Token.Text, '\nВ\n')])
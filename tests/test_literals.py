@@ -0,0 +1,170 @@
+import random
+import re
+from unittest import TestCase, mock
+
+from pygments_bsl import literals
+from pygments_bsl.lexer import BslLexer
+
+# the lookaheads the string start rules used to run
+QUERY_LOOKAHEAD = re.compile(
+    r'"(?=[^"]*\b(ВЫБРАТЬ|SELECT)\b)(?![^"]*(?:\r?\n)\#(?:Удаление|КонецУдаления|Delete|EndDelete))',
+    BslLexer.flags,
+)
+CONSTRAINT_LOOKAHEAD = re.compile(
+    r'"(?=[^"]*\b(?:' + '|'.join(literals.CONSTRAINT_WORDS) + r')\b)'
+    r'(?![^"]*(?:\r?\n)\#(?:Удаление|КонецУдаления|Delete|EndDelete))',
+    BslLexer.flags,
+)
+LOCALE_LOOKAHEAD = re.compile(r'"(?=(?:[^"]|"")*\b[a-z]{2,3}\b\s*=)', BslLexer.flags)
+# the lookaheads the LineFacts checks stand for
+LINE_LOOKAHEADS = (
+    ('semicolon_after', re.compile(r'(?=[^\n]*;)', BslLexer.flags)),
+    ('key_after', re.compile(r'(?=[^\n]*\b[a-z]{2,3}\b\s*=)', BslLexer.flags)),
+    ('odd_quotes_after', re.compile(BslLexer._ODD_LOCALE_QUOTES_LOOKAHEAD, BslLexer.flags)),
+)
+
+
+class ClassifyTestCase(TestCase):
+
+    def kind(self, text):
+        return literals.classify(text, text.index('"'))
+
+    def test_kinds(self):
+        self.assertEqual(self.kind('А = "ВЫБРАТЬ 1";'), literals.QUERY)
+        self.assertEqual(self.kind('А = "выбрать 1";'), literals.QUERY)
+        self.assertEqual(self.kind('А = "РазрешитьЧтение ГДЕ ИСТИНА";'), literals.CONSTRAINT)
+        self.assertEqual(self.kind('А = НСтр("ru = \'Текст\'");'), literals.LOCALE)
+        self.assertEqual(self.kind('А = "Текст";'), literals.PLAIN)
+        self.assertEqual(self.kind('А = "ВЫБРАТЬВСЕ";'), literals.PLAIN)
+
+    def test_words_are_searched_up_to_the_next_quote(self):
+        self.assertEqual(self.kind('А = "Текст ""ВЫБРАТЬ""";'), literals.PLAIN)
+        self.assertEqual(self.kind('А = "ВЫБРАТЬ ""ru = 1""";'), literals.QUERY | literals.LOCALE)
+        self.assertEqual(self.kind('А = "ВЫБРАТЬ\n|ИЗ Т'), literals.QUERY)
+
+    def test_deleted_lines_cancel_queries(self):
+        self.assertEqual(self.kind('А = "ВЫБРАТЬ\n#Удаление\n|1";'), literals.PLAIN)
+        self.assertEqual(self.kind('А = "ВЫБРАТЬ\n#Удаление\n|ru = 1";'), literals.LOCALE)
+
+    def test_case_folded_letters_use_the_pattern(self):
+        self.assertEqual(self.kind('А = "ſelect 1";'), literals.QUERY)
+        self.assertEqual(self.kind('А = "ListReadıngAllowed";'), literals.CONSTRAINT)
+
+    def test_same_result_as_the_lookaheads(self):
+        parts = ['ВЫБРАТЬ', 'select', 'РазрешитьЧтение', 'ЗначениеРазрешено(', 'ru', 'en', ' = ', '=',
+                 '""', '"', ' ', '\n', '\n#Удаление', '|', 'Т', 'ſ', "'", 'x']
+        rng = random.Random(11)
+        for _ in range(3000):
+            text = ''.join(rng.choice(parts) for _ in range(rng.randint(1, 12)))
+            for quote in (match.start() for match in re.finditer('"', text)):
+                expected = (
+                    (literals.QUERY if QUERY_LOOKAHEAD.match(text, quote) else 0)
+                    | (literals.CONSTRAINT if CONSTRAINT_LOOKAHEAD.match(text, quote) else 0)
+                    | (literals.LOCALE if LOCALE_LOOKAHEAD.match(text, quote) else 0)
+                )
+                self.assertEqual(literals.classify(text, quote), expected, (text, quote))
+
+
+class StringIndexTestCase(TestCase):
+
+    def test_literals_are_classified_once(self):
+        text = 'А = "ВЫБРАТЬ 1";'
+        index = literals.StringIndex(text)
+        with mock.patch.object(literals, 'classify', wraps=literals.classify) as classify:
+            self.assertEqual(index.kind(4), literals.QUERY)
+            self.assertEqual(index.kind(4), literals.QUERY)
+
+        classify.assert_called_once_with(text, 4)
+
+    def test_index_is_shared_while_the_text_is_held(self):
+        text = ''.join(['А = "', 'ВЫБРАТЬ', '";'])
+        same = ''.join(['А = "', 'ВЫБРАТЬ', '";'])
+
+        literals.hold(text)
+        literals.hold(text)
+        self.assertIs(literals.string_index(text), literals.string_index(text))
+        self.assertIsNot(literals.string_index(text), literals.string_index(same))
+        literals.release(text)
+        self.assertIs(literals.string_index(text), literals.string_index(text))
+        literals.release(text)
+
+        self.assertIsNot(literals.string_index(text), literals.string_index(text))
+        self.assertEqual(literals._held, {})
+
+    def test_lexing_runs_drop_the_index(self):
+        text = 'А = "ВЫБРАТЬ 1";\nБ = "Текст";\n'
+        with mock.patch.object(literals, 'classify', wraps=literals.classify) as classify:
+            for engine in ('dispatch', 'combined', 'regex'):
+                tokens = BslLexer(engine=engine).get_tokens_unprocessed(text)
+                next(tokens)
+                self.assertIn(id(text), literals._held)
+                list(tokens)
+                self.assertEqual(literals._held, {}, engine)
+
+        # one classification per literal and engine, not one per rule
+        self.assertEqual(classify.call_count, 6)
+
+        tokens = BslLexer().get_tokens_unprocessed(text)
+        next(tokens)
+        tokens.close()
+        self.assertEqual(literals._held, {})
+
+    def test_string_start_matches_only_its_kind(self):
+        text = 'А = "ВЫБРАТЬ 1";'
+        query = literals.StringStart(literals.QUERY).compile(BslLexer.flags)
+
+        self.assertEqual(query.match(text, 4).group(), '"')
+        self.assertEqual(query.flags, re.compile('"', BslLexer.flags).flags)
+        self.assertIsNone(query.match(text, 3))
+        self.assertIsNone(literals.StringStart(literals.LOCALE).match(text, 4))
+        self.assertEqual(repr(query), 'StringStart(1)')
+
+    def test_lexers_agree_on_every_engine(self):
+        text = (
+            'А = "ВЫБРАТЬ 1";\nБ = НСтр("ru = \'Р\'; en = \'E\'");\n'
+            'В = "Текст";\nГ("РазрешитьЧтение ГДЕ ИСТИНА");\nД = "";\n'
+        )
+        tokens = [list(BslLexer(engine=engine).get_tokens(text)) for engine in ('regex', 'combined', 'dispatch')]
+
+        self.assertEqual(tokens[0], tokens[1])
+        self.assertEqual(tokens[0], tokens[2])
+
+
+class LineFactsTestCase(TestCase):
+
+    def test_same_result_as_the_lookaheads(self):
+        parts = ['ru', 'en', ' = ', '=', "'", '"', '""', ';', '\n', 'x', 'K', 'ſ', ' ', '|', 'abcd', '\n=']
+        rng = random.Random(15)
+        for _ in range(3000):
+            text = ''.join(rng.choice(parts) for _ in range(rng.randint(0, 12)))
+            index = literals.StringIndex(text)
+            for pos in rng.sample(range(len(text) + 1), len(text) + 1):
+                line = index.line(pos)
+                for name, lookahead in LINE_LOOKAHEADS:
+                    self.assertEqual(
+                        getattr(line, name)(pos), bool(lookahead.match(text, pos)), (name, text, pos),
+                    )
+
+    def test_lines_are_scanned_once(self):
+        text = "ru = 'а'; en = 'b';\nde = 'c'"
+        index = literals.StringIndex(text)
+        first = index.line(3)
+
+        self.assertIs(index.line(19), first)
+        self.assertEqual((first.start, first.end), (0, 19))
+        self.assertEqual((index.line(20).start, index.line(20).end), (20, len(text)))
+        self.assertIsNot(index.line(0), first)
+
+    def test_line_pattern_checks_the_line_first(self):
+        pattern = literals.LinePattern(r'[^\n"]+', semicolon=False, odd_quotes=False).compile(BslLexer.flags)
+
+        self.assertEqual(pattern.match('ru = Текст\n', 0).group(), 'ru = Текст')
+        self.assertIsNone(pattern.match('ru = Текст;\n', 0))
+        self.assertIsNone(pattern.match("ru = 'Текст\n", 0))
+        self.assertEqual(pattern.match("ru = 'Текст\n", 6).group(), 'Текст')
+        self.assertIsNone(literals.LinePattern('x', key=True).match('x', 0))
+        self.assertEqual(pattern.flags, re.compile('x', BslLexer.flags).flags)
+        self.assertEqual(
+            repr(pattern),
+            "LinePattern('[^\\\\n\"]+', semicolon=False, key=None, odd_quotes=False)",
+        )
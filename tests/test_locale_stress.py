@@ -0,0 +1,61 @@
+import time
+from unittest import TestCase
+
+from pygments_bsl import engine
+from pygments_bsl.lexer import BslLexer
+
+# adversarial localized strings: long single lines with many "key =" pairs,
+# odd numbers of single quotes, missing separators and continuation lines
+CORPUS = {
+    'pairs': lambda n: ' '.join(f"ru = 'Текст {i}'; en = 'Text {i}';" for i in range(n)),
+    'odd_quotes': lambda n: "ru = '" + "Слово ' " * n,
+    'odd_quotes_with_keys': lambda n: ' '.join(f"ru = 'Т{i}" for i in range(n)),
+    'missing_quotes': lambda n: 'ru = ' + 'слово ' * n,
+    'missing_semicolons': lambda n: ' '.join(f"ru = 'Т{i}' en = 'T{i}'" for i in range(n)),
+    'escaped_quotes': lambda n: "ru = '" + '""слово"" ' * n + "'",
+    'continuation': lambda n: "ru = 'x';\n|" + ' '.join(f"en = 'T{i}" for i in range(n)),
+    'pipe_lines': lambda n: "ru = 'x" + ''.join(f"\n|ru = 'Т{i}'; en = 'T{i}'" for i in range(n)) + "'",
+}
+# a quadratic rule makes the 4x longer line at least 16x slower
+MAX_GROWTH = 8.0
+
+
+def module(body):
+    return f'Текст = НСтр("{body}");\nСообщить(НСтр("{body}"));\n'
+
+
+def lex_time(lexer, text, repeat=5):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in lexer.get_tokens_unprocessed(text):
+            pass
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+class LocaleStressTestCase(TestCase):
+
+    def test_engines_agree_on_the_corpus(self):
+        for name, body in CORPUS.items():
+            text = module(body(30))
+            expected = list(BslLexer(engine='regex').get_tokens(text))
+            for engine_name in engine.ENGINES:
+                with self.subTest(case=name, engine=engine_name):
+                    self.assertEqual(list(BslLexer(engine=engine_name).get_tokens(text)), expected)
+
+    def test_tokens_cover_the_corpus(self):
+        for name, body in CORPUS.items():
+            text = module(body(30))
+            with self.subTest(case=name):
+                self.assertEqual(''.join(value for _, value in BslLexer().get_tokens(text)), text)
+
+    def test_lexing_time_grows_linearly_with_line_length(self):
+        lexer = BslLexer()
+        lex_time(lexer, module(CORPUS['pairs'](10)), repeat=1)
+        for name, body in CORPUS.items():
+            short, long = module(body(150)), module(body(600))
+            with self.subTest(case=name, chars=len(long)):
+                growth = lex_time(lexer, long) / lex_time(lexer, short)
+                self.assertLess(growth, MAX_GROWTH)
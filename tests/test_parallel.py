@@ -0,0 +1,107 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase, mock
+
+from pygments_bsl import parallel
+from pygments_bsl.lexer import BslLexer
+
+CURRENT_DIR = os.path.abspath(os.path.dirname(__file__))
+PROCEDURE = 'Процедура П{0}()\n\tА = "ВЫБРАТЬ\n\t|\tПоле{0}\n\t|ИЗ Т";\nКонецПроцедуры\n\n'
+# a procedure end inside a parameter list: the pre-scan splits there, the lexer is in params
+TRAP = 'Процедура Л(Первый,\nКонецПроцедуры\n, Второй)\nКонецПроцедуры\n\n'
+
+
+def read_example(path):
+    with open(os.path.join(CURRENT_DIR, 'examplefiles', path), encoding='utf-8') as fh:
+        return fh.read()
+
+
+class ParallelGetTokensTestCase(TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(parallel, 'MIN_CHUNK_SIZE', 64)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.executor = ThreadPoolExecutor(2)
+        self.addCleanup(self.executor.shutdown)
+
+    def assertSameAsSequential(self, text, workers=4):
+        self.assertEqual(
+            list(parallel.parallel_get_tokens_unprocessed(text, workers, executor=self.executor)),
+            list(BslLexer().get_tokens_unprocessed(text)),
+        )
+
+    def test_split_points_follow_procedure_ends(self):
+        text = ''.join(PROCEDURE.format(i) for i in range(20))
+
+        points = parallel.split_points(text, 4)
+
+        self.assertEqual(len(points), 3)
+        for point in points:
+            self.assertTrue(text[:point].endswith('КонецПроцедуры\n'))
+
+    def test_split_points_skip_lines_with_quotes(self):
+        text = ('Процедура А()\nКонецПроцедуры // "\n' * 20)
+
+        self.assertEqual(parallel.split_points(text, 4), [])
+
+    def test_output_matches_sequential_lexing(self):
+        self.assertSameAsSequential(read_example('bsl/samples.bsl'))
+        self.assertSameAsSequential(read_example('bsl/samples.os'))
+
+    def test_wrong_split_points_are_lexed_on_sequentially(self):
+        text = (
+            ''.join(PROCEDURE.format(i) for i in range(10))
+            + TRAP * 3
+            + ''.join(PROCEDURE.format(i) for i in range(10))
+        )
+
+        self.assertSameAsSequential(text, workers=20)
+
+    def test_split_point_inside_an_unfinished_string(self):
+        text = ''.join(PROCEDURE.format(i) for i in range(10)) + 'А = "\n|' + PROCEDURE.format('Х') * 10
+
+        self.assertSameAsSequential(text, workers=20)
+
+    def test_unclosed_state_runs_to_the_end(self):
+        text = (
+            ''.join(PROCEDURE.format(i) for i in range(10))
+            + '// ' + '-' * 100 + '\nПроцедура Л(Первый,\nКонецПроцедуры\n'
+            + 'Второй,\n' * 20 + 'Третий'
+        )
+
+        self.assertSameAsSequential(text, workers=20)
+
+    def test_fast_mode_lexes_every_chunk_fast(self):
+        text = ''.join(PROCEDURE.format(i) for i in range(20))
+        lexer = BslLexer(fast_mode_above=len(text) - 1)
+
+        self.assertEqual(
+            list(parallel.parallel_get_tokens_unprocessed(text, 4, lexer, self.executor)),
+            list(BslLexer(mode='fast').get_tokens_unprocessed(text)),
+        )
+
+    def test_chunk_ending_inside_a_match_resumes_at_the_last_line_start(self):
+        text = 'А = 1;\nБ = 2;\n'
+
+        names, tokens, resume = parallel._lex_chunk(BslLexer, {}, text, 0, 9)
+
+        self.assertEqual(resume, (7, ('root',)))
+        self.assertEqual(tokens[-1][0], 6)
+        self.assertIn('Token.Punctuation', names)
+
+    def test_small_text_is_lexed_in_process(self):
+        text = 'А = 1;\n'
+        with mock.patch.object(parallel, 'ProcessPoolExecutor', side_effect=AssertionError):
+            self.assertEqual(
+                list(parallel.parallel_get_tokens_unprocessed(text, workers=4)),
+                list(BslLexer().get_tokens_unprocessed(text)),
+            )
+
+    def test_get_tokens_in_a_process_pool(self):
+        text = ''.join(PROCEDURE.format(i) for i in range(40))
+
+        self.assertEqual(
+            list(parallel.parallel_get_tokens(text, workers=2)),
+            list(BslLexer().get_tokens(text)),
+        )
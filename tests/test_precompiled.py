@@ -0,0 +1,145 @@
+import os
+import re
+import tempfile
+from unittest import TestCase, mock
+
+import pygments_bsl
+from pygments_bsl import precompiled
+from pygments_bsl.lexer import SdblLexer
+
+
+class PrecompiledCacheTestCase(TestCase):
+
+    def setUp(self):
+        precompiled.unload()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        env = mock.patch.dict(os.environ, {'PYGMENTS_BSL_CACHE_DIR': self.tmp.name})
+        env.start()
+        self.addCleanup(env.stop)
+        self.addCleanup(precompiled.unload)
+
+    def test_compiled_pattern_behaves_like_re_compile(self):
+        pattern, flags = r'(?P<name>[а-я]+)(\s*)(=)', re.IGNORECASE | re.MULTILINE
+
+        compiled = precompiled.compile_pattern(pattern, flags)
+        expected = re.compile(pattern, flags)
+
+        self.assertEqual(compiled.pattern, expected.pattern)
+        self.assertEqual(compiled.flags, expected.flags)
+        self.assertEqual(compiled.groupindex, expected.groupindex)
+        self.assertEqual(compiled.match('Ключ = 1').groups(), expected.match('Ключ = 1').groups())
+
+    def test_programs_are_reused_by_the_next_process(self):
+        precompiled.compile_pattern(r'\b(?:ВЫБРАТЬ|SELECT)\b', re.IGNORECASE)
+        path = precompiled.save()
+
+        self.assertEqual(path, precompiled.cache_path())
+        self.assertTrue(path.exists())
+        self.assertIsNone(precompiled.save())
+
+        precompiled.unload()
+        with mock.patch.object(precompiled, '_compile_program', side_effect=AssertionError):
+            compiled = precompiled.compile_pattern(r'\b(?:ВЫБРАТЬ|SELECT)\b', re.IGNORECASE)
+        self.assertTrue(compiled.match('select'))
+
+    def test_first_char_analysis_is_cached(self):
+        analyse = mock.Mock(return_value=('[a]', False))
+
+        self.assertEqual(precompiled.cached_first_chars('a+', 0, analyse), ('[a]', False))
+        self.assertEqual(precompiled.cached_first_chars('a+', 0, analyse), ('[a]', False))
+        precompiled.unload()
+        self.assertEqual(precompiled.cached_first_chars('a+', 0, analyse), ('[a]', False))
+
+        analyse.assert_called_once_with('a+', 0)
+
+    def test_broken_cache_file_is_ignored(self):
+        path = precompiled.cache_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b'not a marshal stream')
+
+        self.assertTrue(precompiled.compile_pattern('a|b', 0).match('b'))
+
+    def test_invalid_cached_program_is_recompiled(self):
+        precompiled.compile_pattern('a|b', 0)
+        precompiled._programs[('a|b', 0)] = (0, b'\0\0\0\0', 0, {}, (None,))
+
+        self.assertTrue(precompiled.compile_pattern('a|b', 0).match('b'))
+
+    def test_invalid_pattern_raises_re_error(self):
+        with self.assertRaises(re.error):
+            precompiled.compile_pattern('(', 0)
+
+    def test_reset_drops_new_entries_without_saving(self):
+        precompiled.compile_pattern('a+b', 0)
+
+        precompiled.reset()
+
+        self.assertFalse(precompiled.cache_path().exists())
+        self.assertIsNone(precompiled.save())
+
+    def test_lexing_does_not_write_the_cache_file(self):
+        del SdblLexer._tokens
+
+        list(SdblLexer().get_tokens('ВЫБРАТЬ 1'))
+
+        self.assertFalse(precompiled.cache_path().exists())
+        self.assertEqual(precompiled.save(), precompiled.cache_path())
+
+    def test_disabled_cache_compiles_directly(self):
+        analyse = mock.Mock(return_value=(None, True))
+        with mock.patch.dict(os.environ, {'PYGMENTS_BSL_NO_CACHE': '1'}):
+            self.assertTrue(precompiled.compile_pattern('a', 0).match('a'))
+            self.assertEqual(precompiled.cached_first_chars('a', 0, analyse), (None, True))
+            self.assertEqual(precompiled.cached_first_chars('a', 0, analyse), (None, True))
+            self.assertIsNone(precompiled.save())
+
+        self.assertEqual(analyse.call_count, 2)
+        self.assertFalse(precompiled.cache_path().exists())
+
+    def test_analysis_of_the_parse_tree_is_not_repeated(self):
+        analyse = mock.Mock(return_value=('[ac]', False))
+        reanalyse = mock.Mock(side_effect=AssertionError)
+        with mock.patch.dict(os.environ, {'PYGMENTS_BSL_NO_CACHE': '1'}):
+            compiled = precompiled.compile_pattern('ab|c', 0, analyse)
+            result = precompiled.cached_first_chars('ab|c', compiled.flags, reanalyse)
+
+        self.assertEqual(result, ('[ac]', False))
+        self.assertEqual(analyse.call_count, 1)
+        self.assertTrue(compiled.match('c'))
+
+    def test_unwritable_cache_dir_is_not_an_error(self):
+        blocker = os.path.join(self.tmp.name, 'file')
+        with open(blocker, 'w', encoding='utf-8'):
+            pass
+        with mock.patch.dict(os.environ, {'PYGMENTS_BSL_CACHE_DIR': os.path.join(blocker, 'sub')}):
+            precompiled.compile_pattern('x+y', 0)
+            self.assertIsNone(precompiled.save())
+
+    def test_default_cache_dir_follows_platform_conventions(self):
+        with mock.patch.dict(os.environ, {'PYGMENTS_BSL_CACHE_DIR': '', 'XDG_CACHE_HOME': '/xdg'}):
+            with mock.patch.object(precompiled.sys, 'platform', 'linux'):
+                self.assertEqual(str(precompiled.cache_dir()), os.path.join('/xdg', 'pygments-bsl'))
+        with mock.patch.dict(os.environ, {'PYGMENTS_BSL_CACHE_DIR': '', 'LOCALAPPDATA': '/local'}):
+            with mock.patch.object(precompiled.sys, 'platform', 'win32'):
+                self.assertEqual(str(precompiled.cache_dir()), os.path.join('/local', 'pygments-bsl'))
+
+    def test_cache_file_name_is_versioned(self):
+        name = precompiled.cache_path().name
+
+        self.assertIn(precompiled.sys.implementation.cache_tag, name)
+        self.assertIn(str(precompiled._sre.MAGIC), name)
+        precompiled.package_version.cache_clear()
+        self.addCleanup(precompiled.package_version.cache_clear)
+        with mock.patch.object(precompiled, 'version', side_effect=precompiled.PackageNotFoundError):
+            self.assertIn('-dev-', precompiled.cache_path().name)
+
+    def test_warmup_persists_tables_and_clear_removes_them(self):
+        del SdblLexer._tokens
+
+        path = pygments_bsl.warmup([SdblLexer])
+
+        self.assertTrue(path.exists())
+        self.assertIsNone(pygments_bsl.warmup([SdblLexer]))
+        precompiled.clear()
+        self.assertFalse(path.exists())
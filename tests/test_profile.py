@@ -0,0 +1,119 @@
+import contextlib
+import io
+import os
+import tempfile
+from unittest import TestCase
+
+from pygments.lexer import bygroups
+from pygments.token import Token
+
+from pygments_bsl import engine, profile
+from pygments_bsl.lexer import BslLexer, SdblLexer
+
+SOURCE = (
+    'Процедура Тест(Параметр) Экспорт\n'
+    '    // Комментарий\n'
+    '    Запрос = Новый Запрос("ВЫБРАТЬ Т.Поле ИЗ Справочник.Т КАК Т");\n'
+    '    Сообщить(НСтр("ru = \'Текст\'"));\n'
+    'КонецПроцедуры\n'
+)
+
+
+class ProfileOptionTestCase(TestCase):
+
+    def test_profiled_tokens_are_unchanged(self):
+        expected = list(BslLexer().get_tokens(SOURCE))
+        for name in (engine.STOCK_ENGINE, *engine.ENGINES):
+            with self.subTest(engine=name):
+                self.assertEqual(list(BslLexer(engine=name, profile=True).get_tokens(SOURCE)), expected)
+
+    def test_profile_is_off_by_default(self):
+        self.assertIsNone(BslLexer().profile)
+        self.assertIsNone(BslLexer(profile='false').profile)
+        self.assertIsInstance(BslLexer(profile='true').profile, profile.RuleProfile)
+
+    def test_rules_and_callbacks_are_counted(self):
+        result = profile.profile_text(BslLexer, SOURCE)
+
+        root = BslLexer._tokens['root']
+        names = [
+            index for index, rule in enumerate(root)
+            if rule[1] is not None and profile.callback_name(rule[1]) == '_bsl_name_token'
+        ]
+        stats = result.rules['BslLexer', 'root', names[0]]
+        self.assertEqual(stats.callback, '_bsl_name_token')
+        self.assertGreaterEqual(stats.attempts, stats.hits)
+        self.assertGreater(stats.hits, 0)
+        self.assertGreater(stats.callback_time, 0)
+        self.assertEqual(stats.total_time, stats.match_time + stats.callback_time)
+
+        self.assertIn(('BslLexer', 'root'), result.states())
+        self.assertEqual(result.callbacks()['_bsl_name_token'][0], stats.hits)
+        self.assertEqual(
+            [key for key, _ in result.hottest()][:3], [key for key, _ in result.hottest(3)],
+        )
+
+    def test_embedded_lexers_add_to_the_same_profile(self):
+        shared = profile.RuleProfile()
+        lexer = BslLexer(profile=shared)
+        list(lexer.get_tokens(SOURCE))
+
+        self.assertIs(lexer.profile, shared)
+        self.assertTrue(any(key[0] == 'SdblQueryLexer' and stats.hits for key, stats in shared.rules.items()))
+        self.assertGreater(shared.callbacks()['_embedded_code'][1], 0)
+
+    def test_matchers_are_built_once_per_table(self):
+        result = profile.RuleProfile()
+        lexer = SdblLexer(profile=result)
+
+        self.assertIs(result.matchers(lexer), result.matchers(lexer))
+        self.assertIsNot(result.matchers(lexer), result.matchers(SdblLexer(profile=result, engine='regex')))
+
+    def test_callback_names(self):
+        self.assertIsNone(profile.callback_name(None))
+        self.assertIsNone(profile.callback_name(Token.Name))
+        self.assertEqual(profile.callback_name(bygroups(Token.Name, Token.Text)), 'bygroups')
+        self.assertEqual(profile.callback_name(engine.TokenAction(len)), 'len')
+        self.assertEqual(profile.callback_name(engine.bygroups(Token.Name)), 'bygroups')
+        self.assertEqual(profile.callback_name(engine.SpanAction(len)), 'len')
+
+
+class ProfileMainTestCase(TestCase):
+
+    def run_main(self, *argv):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            code = profile.main(list(argv))
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def write(self, directory, name, text):
+        path = os.path.join(directory, name)
+        with open(path, 'w', encoding='utf-8') as fh:
+            fh.write(text)
+        return path
+
+    def test_prints_the_hottest_rules(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.write(directory, 'Module.bsl', SOURCE)
+            code, out, _ = self.run_main(path, '--top', '5')
+
+        self.assertEqual(code, 0)
+        self.assertIn('BslLexer/root', out)
+        self.assertIn('_bsl_name_token', out)
+        self.assertIn('BslLexer lexed', out)
+        self.assertEqual(len(out.split('\n\n')[0].splitlines()), 2 + 5)
+
+    def test_lexer_follows_the_extension_or_the_option(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.write(directory, 'Query.sdbl', 'ВЫБРАТЬ 1 КАК Поле')
+            _, out, _ = self.run_main(path, '--engine', 'regex')
+            _, forced, _ = self.run_main(path, '--lexer', 'bsl')
+
+        self.assertIn('SdblLexer lexed', out)
+        self.assertIn('BslLexer lexed', forced)
+
+    def test_missing_file_is_an_error(self):
+        code, _, err = self.run_main(os.path.join(tempfile.gettempdir(), 'missing-module.bsl'))
+
+        self.assertEqual(code, 2)
+        self.assertTrue(err)
@@ -0,0 +1,128 @@
+import gc
+import math
+import time
+from unittest import TestCase
+
+from pygments_bsl import corpus
+from pygments_bsl.lexer import BslLexer, ConstraintLogicLexer, SdblLexer, SdblQueryLexer
+
+# exponent of the fitted time ~ size ** k; quadratic rules give about 2
+MAX_EXPONENT = 1.35
+REPEAT = 3
+# a slow run on a busy machine looks like a steeper curve, such fits are measured again
+ATTEMPTS = 3
+
+
+def repeat_unit(unit, prefix='', suffix=''):
+    def build(size):
+        parts = [prefix]
+        length = len(prefix) + len(suffix)
+        number = 0
+        while length < size:
+            part = unit(number)
+            parts.append(part)
+            length += len(part)
+            number += 1
+        parts.append(suffix)
+        return ''.join(parts)
+    return build
+
+
+# (lexer, construct, build(size)): whole modules and single constructs that grow
+PROFILES = (
+    (BslLexer, 'mixed module', lambda size: corpus.generate(size, 'mixed')),
+    (BslLexer, 'query-heavy module', lambda size: corpus.generate(size, 'query-heavy')),
+    (BslLexer, 'comment-heavy module', lambda size: corpus.generate(size, 'comment-heavy')),
+    (BslLexer, 'multi-line string', repeat_unit(
+        lambda n: f'\n\t|Строка {n} ""цитата"" %1 // не комментарий', 'Текст = "Начало', '";\n',
+    )),
+    (BslLexer, 'multi-line query literal', repeat_unit(
+        lambda n: f'\n\t|\tТаблица.Поле{n} КАК Поле{n}, // поле {n}', 'Запрос.Текст = "ВЫБРАТЬ', '\n\t|ИЗ Т";\n',
+    )),
+    (BslLexer, 'one-line string with escapes', repeat_unit(
+        lambda n: f'""часть {n}"" ', 'Текст = "', '";\n',
+    )),
+    (BslLexer, 'many strings on one line', repeat_unit(
+        lambda n: f' + "часть {n}"', 'Текст = ""', ';\n',
+    )),
+    (BslLexer, 'long localized string', repeat_unit(
+        lambda n: f" ru = 'Текст {n}'; en = 'Text {n}';", 'Текст = НСтр("', '");\n',
+    )),
+    (BslLexer, 'long comment line', repeat_unit(
+        lambda n: f' слово{n} "кавычка ', '// ', '\n',
+    )),
+    (BslLexer, 'preprocessor blocks', repeat_unit(
+        lambda n: f'#Если Сервер Тогда\nА{n} = 1;\n#Иначе\nБ{n} = "строка";\n#КонецЕсли\n',
+    )),
+    (SdblLexer, 'query text', lambda size: corpus.generate(size, 'sdbl')),
+    (SdblLexer, 'long query line', repeat_unit(
+        lambda n: f' Т.Поле{n} КАК П{n},', 'ВЫБРАТЬ', ' 1 КАК Последнее ИЗ Справочник.Т КАК Т',
+    )),
+    (SdblQueryLexer, 'query literal text', repeat_unit(
+        lambda n: f'\n|\tТ.Поле{n} КАК П{n}, // поле', 'ВЫБРАТЬ', '\n|ИЗ Справочник.Т КАК Т',
+    )),
+    (ConstraintLogicLexer, 'restriction text', repeat_unit(
+        lambda n: f'\n\tИЛИ ЗначениеРазрешено(Т.Поле{n}, "Организации")',
+        'РазрешитьЧтение\nГДЕ\n\tИСТИНА', '\n;\n',
+    )),
+)
+
+
+def lex_time(lexer, text):
+    best = None
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(REPEAT):
+            started = time.perf_counter()
+            for _ in lexer.get_tokens_unprocessed(text):
+                pass
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+    finally:
+        if enabled:
+            gc.enable()
+    return best
+
+
+def growth_exponent(sizes, times):
+    """Least squares slope of ``log(time)`` over ``log(size)``."""
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(elapsed, 1e-9)) for elapsed in times]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    return (
+        sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+        / sum((x - mean_x) ** 2 for x in xs)
+    )
+
+
+class SizeScalingTestCase(TestCase):
+
+    def test_growth_exponent_fit(self):
+        sizes = (1000, 2000, 4000)
+
+        self.assertAlmostEqual(growth_exponent(sizes, [size * 3 for size in sizes]), 1.0)
+        self.assertAlmostEqual(growth_exponent(sizes, [size ** 2 for size in sizes]), 2.0)
+
+    def test_lexing_grows_near_linearly_with_input_size(self):
+        base = 16 * 1024
+        sizes = (base, 2 * base, 4 * base)
+        for lexer_cls, construct, build in PROFILES:
+            lexer = lexer_cls(token_cache=False)
+            texts = [build(size) for size in sizes]
+            lengths = [len(text) for text in texts]
+            lex_time(lexer, texts[0])
+            times = [lex_time(lexer, text) for text in texts]
+            exponent = growth_exponent(lengths, times)
+            for _ in range(ATTEMPTS - 1):
+                if exponent < MAX_EXPONENT:
+                    break
+                times = [min(best, lex_time(lexer, text)) for best, text in zip(times, texts)]
+                exponent = growth_exponent(lengths, times)
+            with self.subTest(lexer=lexer_cls.__name__, construct=construct):
+                self.assertLess(
+                    exponent, MAX_EXPONENT,
+                    f'{lexer_cls.__name__} lexing of "{construct}" grows as n^{exponent:.2f} '
+                    f'({", ".join(f"{length} chars: {elapsed * 1000:.1f} ms" for length, elapsed in zip(lengths, times))})',
+                )
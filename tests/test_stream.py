@@ -0,0 +1,133 @@
+import os
+import random
+import tempfile
+from unittest import TestCase
+
+from pygments.token import Token
+
+from pygments_bsl.lexer import BslLexer
+from pygments_bsl.stream import BslStreamLexer, iter_file, lex_file
+
+CURRENT_DIR = os.path.abspath(os.path.dirname(__file__))
+PROCEDURE = 'Процедура П{0}()\n\tА = "Строка";\nКонецПроцедуры\n\n'
+
+
+def read_example(path):
+    with open(os.path.join(CURRENT_DIR, 'examplefiles', path), encoding='utf-8') as fh:
+        return fh.read()
+
+
+def feed_all(stream, text, sizes):
+    tokens = []
+    pos = 0
+    while pos < len(text):
+        size = sizes()
+        tokens.extend(stream.feed(text[pos:pos + size]))
+        pos += size
+    return tokens
+
+
+class BslStreamLexerTestCase(TestCase):
+
+    def test_random_chunks_match_full_lexing(self):
+        rnd = random.Random(1)
+        for path in ('bsl/samples.bsl', 'bsl/samples.os'):
+            text = read_example(path)
+            for sizes in ((1, 3), (10, 100), (1000, 5000)):
+                stream = BslStreamLexer()
+                with self.subTest(path=path, sizes=sizes):
+                    tokens = feed_all(stream, text, lambda: rnd.randint(*sizes))
+                    tokens += stream.close()
+                    self.assertEqual(tokens, list(BslLexer().get_tokens_unprocessed(text)))
+
+    def test_unfinished_query_string_is_held_back(self):
+        head = ''.join(PROCEDURE.format(i) for i in range(5))
+        query = 'Запрос.Текст = "ВЫБРАТЬ\n\t|\tТ.Поле\n' + '\t|\tТ.Поле,\n' * 20
+        tail = '\t|ИЗ Т";\n' + head
+        stream = BslStreamLexer()
+
+        tokens = stream.feed(head + query)
+
+        self.assertTrue(tokens)
+        self.assertLessEqual(tokens[-1][0], len(head))
+        self.assertTrue(stream.pending.endswith(query))
+
+        tokens += stream.feed(tail)
+        self.assertIn((Token.Keyword.Declaration, 'ИЗ'), [(token, value) for _, token, value in tokens])
+        tokens += stream.close()
+        self.assertEqual(tokens, list(BslLexer().get_tokens_unprocessed(head + query + tail)))
+
+    def test_held_back_text_stays_bounded(self):
+        stream = BslStreamLexer()
+        longest = 0
+        for number in range(200):
+            for line in PROCEDURE.format(number).splitlines(keepends=True):
+                stream.feed(line)
+                longest = max(longest, len(stream.pending))
+
+        self.assertLess(longest, 4 * len(PROCEDURE))
+        self.assertLess(len(stream._buffer), 4 * len(PROCEDURE))
+
+    def test_close_ends_the_stream(self):
+        stream = BslStreamLexer()
+        self.assertEqual(stream.feed('А = 1;'), [])
+
+        self.assertEqual(stream.close(), list(BslLexer().get_tokens_unprocessed('А = 1;')))
+        self.assertEqual(stream.close(), [])
+        self.assertEqual(stream.pending, '')
+        with self.assertRaises(ValueError):
+            stream.feed('Б = 2;')
+
+    def test_options_reach_the_lexer(self):
+        text = read_example('bsl/samples.bsl')
+        stream = BslStreamLexer(mode='fast', engine='combined')
+
+        tokens = feed_all(stream, text, lambda: 256) + stream.close()
+
+        self.assertEqual(tokens, list(BslLexer(mode='fast').get_tokens_unprocessed(text)))
+
+
+
+class LexFileTestCase(TestCase):
+
+    def write(self, data):
+        fd, path = tempfile.mkstemp(suffix='.bsl')
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(data)
+        self.addCleanup(os.unlink, path)
+        return path
+
+    def test_windows_match_full_lexing(self):
+        text = read_example('bsl/samples.bsl')
+        path = self.write(text.encode('utf-8'))
+        expected = list(BslLexer().get_tokens_unprocessed(text))
+        for window_size in (7, 1000, 1 << 20):
+            batches = []
+            with self.subTest(window_size=window_size):
+                count = lex_file(path, batches.append, window_size=window_size)
+                self.assertEqual([token for batch in batches for token in batch], expected)
+                self.assertEqual(count, len(expected))
+                self.assertEqual(list(iter_file(path, window_size=window_size)), expected)
+
+    def test_small_windows_give_several_batches(self):
+        text = ''.join(PROCEDURE.format(i) for i in range(100))
+        path = self.write(text.encode('utf-8'))
+        batches = []
+
+        lex_file(path, batches.append, window_size=256)
+
+        self.assertGreater(len(batches), 10)
+        self.assertTrue(all(batches))
+
+    def test_encoding_and_bom(self):
+        text = 'Процедура П()\r\n\tА = "Строка";\r\nКонецПроцедуры\r\n'
+        expected = list(BslLexer().get_tokens_unprocessed(text))
+
+        self.assertEqual(list(iter_file(self.write(b'\xef\xbb\xbf' + text.encode('utf-8')))), expected)
+        self.assertEqual(list(iter_file(self.write(text.encode('cp1251')), encoding='cp1251', window_size=5)), expected)
+
+    def test_empty_file(self):
+        batches = []
+
+        self.assertEqual(lex_file(self.write(b''), batches.append), 0)
+        self.assertEqual(batches, [])
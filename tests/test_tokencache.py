@@ -0,0 +1,163 @@
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from pygments.token import Token
+
+from pygments_bsl import engine, tokencache
+from pygments_bsl.lexer import BslLexer, SdblLexer
+
+CURRENT_DIR = os.path.abspath(os.path.dirname(__file__))
+
+
+def read_example(path):
+    with open(os.path.join(CURRENT_DIR, 'examplefiles', path), encoding='utf-8') as fh:
+        return fh.read()
+
+
+class TokenCacheTestCase(TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        env = mock.patch.dict(os.environ, {'PYGMENTS_BSL_CACHE_DIR': tmp.name})
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop('PYGMENTS_BSL_TOKEN_CACHE', None)
+        os.environ.pop('PYGMENTS_BSL_TOKEN_CACHE_SIZE', None)
+        self.text = read_example('bsl/samples.bsl')
+
+    def entries(self):
+        if not tokencache.directory().exists():
+            return []
+        return sorted(path.name for path in tokencache.directory().iterdir())
+
+    def test_cache_hit_returns_the_same_tokens(self):
+        expected = list(BslLexer().get_tokens_unprocessed(self.text))
+        lexer = BslLexer(token_cache=True)
+
+        self.assertEqual(list(lexer.get_tokens_unprocessed(self.text)), expected)
+        self.assertEqual(len(self.entries()), 1)
+        with mock.patch.object(BslLexer, '_lex', side_effect=AssertionError):
+            cached = list(BslLexer(token_cache=True).get_tokens_unprocessed(self.text))
+
+        self.assertEqual(cached, expected)
+        self.assertTrue(all(token[1] is original[1] for token, original in zip(cached, expected)))
+
+    def test_cache_hit_serves_the_stored_pairs_to_get_tokens(self):
+        expected = list(BslLexer().get_tokens(self.text))
+        normalized = list(BslLexer().get_tokens_normalized(self.text))
+
+        self.assertEqual(list(BslLexer(token_cache=True).get_tokens(self.text)), expected)
+        self.assertEqual(list(BslLexer(token_cache=True).get_tokens_normalized(self.text)), normalized)
+        with mock.patch.object(BslLexer, '_lex', side_effect=AssertionError):
+            cached = list(BslLexer(token_cache=True).get_tokens(self.text))
+            cached_normalized = list(BslLexer(token_cache=True).get_tokens_normalized(self.text))
+
+        self.assertEqual(cached, expected)
+        self.assertEqual(cached_normalized, normalized)
+        # equal tokens are one tuple of the entry table
+        self.assertLess(len(set(map(id, cached))), len(cached))
+
+    def test_filters_apply_to_cache_hits(self):
+        lexer = BslLexer(token_cache=True)
+        lexer.add_filter('keywordcase', case='upper')
+        list(lexer.get_tokens(self.text))
+
+        with mock.patch.object(BslLexer, '_lex', side_effect=AssertionError):
+            tokens = list(lexer.get_tokens(self.text))
+
+        self.assertIn((Token.Keyword, 'ПРОЦЕДУРА'), tokens)
+
+    def test_key_covers_text_lexer_and_options(self):
+        key = tokencache.cache_key(BslLexer(token_cache=True), self.text)
+
+        self.assertEqual(key, tokencache.cache_key(BslLexer(), self.text))
+        self.assertNotEqual(key, tokencache.cache_key(BslLexer(), self.text + ' '))
+        self.assertNotEqual(key, tokencache.cache_key(SdblLexer(), self.text))
+        self.assertNotEqual(key, tokencache.cache_key(BslLexer(engine='regex'), self.text))
+        with mock.patch.object(tokencache, 'package_version', return_value='0.0'):
+            self.assertNotEqual(key, tokencache.cache_key(BslLexer(), self.text))
+
+    def test_streams_cut_by_the_time_budget_are_not_stored(self):
+        lexer = BslLexer(token_cache=True, time_budget_ms=1)
+        with mock.patch.object(engine.time, 'perf_counter', side_effect=range(10 ** 6)):
+            tokens = list(lexer.get_tokens_unprocessed(self.text))
+
+        self.assertEqual(lexer.budget_exceeded, 1)
+        self.assertEqual(self.entries(), [])
+        self.assertEqual(tokens[-1][1], Token.Text)
+
+        expected = list(BslLexer(token_cache=True).get_tokens_unprocessed(self.text))
+        self.assertEqual(len(self.entries()), 1)
+        self.assertEqual(list(lexer.get_tokens_unprocessed(self.text)), expected)
+
+    def test_small_texts_and_default_lexers_are_not_cached(self):
+        list(BslLexer(token_cache=True).get_tokens_unprocessed('А = 1;'))
+        list(BslLexer().get_tokens_unprocessed(self.text))
+
+        self.assertEqual(self.entries(), [])
+
+    def test_environment_turns_the_cache_on(self):
+        with mock.patch.dict(os.environ, {'PYGMENTS_BSL_TOKEN_CACHE': '1'}):
+            lexer = SdblLexer()
+        self.assertTrue(lexer.token_cache)
+
+        text = read_example('sdbl/samples.sdbl')
+        self.assertEqual(list(lexer.get_tokens_unprocessed(text)), list(SdblLexer().get_tokens_unprocessed(text)))
+        self.assertEqual(len(self.entries()), 1)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        tokens = list(BslLexer().get_tokens_unprocessed(self.text))
+        tokencache.store('a', tokens)
+        tokencache.store('b', tokens)
+        size = (tokencache.directory() / 'a.tokens').stat().st_size
+        os.utime(tokencache.directory() / 'a.tokens', (1, 1))
+        os.utime(tokencache.directory() / 'b.tokens', (2, 2))
+        tokencache.load('a')
+
+        with mock.patch.dict(os.environ, {'PYGMENTS_BSL_TOKEN_CACHE_SIZE': str(2.5 * size / 1024 / 1024)}):
+            tokencache.store('c', tokens)
+
+        self.assertEqual(self.entries(), ['a.tokens', 'c.tokens'])
+        tokencache.clear()
+        self.assertEqual(self.entries(), [])
+
+    def test_damaged_entries_are_dropped(self):
+        tokens = list(BslLexer().get_tokens_unprocessed(self.text))
+        tokencache.store('a', tokens)
+        path = tokencache.directory() / 'a.tokens'
+        path.write_bytes(path.read_bytes()[:-10])
+
+        self.assertIsNone(tokencache.load('a'))
+        self.assertFalse(path.exists())
+        self.assertIsNone(tokencache.load('missing'))
+
+    def test_foreign_entries_are_rejected(self):
+        for data in (
+            tokencache.marshal.dumps((0, (), (), b'', b'', 0)),
+            tokencache.marshal.dumps((tokencache.FORMAT, (), (), b'\0\0\0\0', b'', 0)),
+            tokencache.marshal.dumps((tokencache.FORMAT, (), (), b'\0\0\0\0', b'\0\0\0\0', 0)),
+        ):
+            with self.subTest(data=data), self.assertRaises(ValueError):
+                tokencache.loads(data)
+
+    def test_key_accepts_lone_surrogates(self):
+        self.assertNotEqual(
+            tokencache.cache_key(BslLexer(), '\ud800'),
+            tokencache.cache_key(BslLexer(), '\ud801'),
+        )
+
+    def test_unwritable_cache_dir_is_not_an_error(self):
+        blocker = os.path.join(os.environ['PYGMENTS_BSL_CACHE_DIR'], 'file')
+        with open(blocker, 'w', encoding='utf-8'):
+            pass
+        with mock.patch.dict(os.environ, {'PYGMENTS_BSL_CACHE_DIR': blocker}):
+            tokens = list(BslLexer(token_cache=True).get_tokens_unprocessed(self.text))
+            tokencache.evict()
+
+        self.assertEqual(tokens, list(BslLexer().get_tokens_unprocessed(self.text)))
+
+    def test_size_limit_falls_back_to_the_default(self):
+        with mock.patch.dict(os.environ, {'PYGMENTS_BSL_TOKEN_CACHE_SIZE': 'lots'}):
+            self.assertEqual(tokencache.size_limit(), tokencache.DEFAULT_SIZE_MB * 1024 * 1024)
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""Generate deterministic synthetic BSL/SDBL sources for scaling benchmarks.
+
+    python tools/gen_corpus.py --size 10MB --profile query-heavy -o big-query.bsl
+    python tools/gen_corpus.py --snippets 50000 --output snippets/
+
+See ``pygments_bsl/corpus.py`` for the profiles.
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from pygments_bsl.corpus import main  # noqa: E402
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,16 +4,28 @@ Generate static Python data from 3rd_party JSON assets.
 
 The JSON files stay in 3rd_party/, and this script converts them into
 pygments_bsl/generated_data.py with tuples that the lexer imports at runtime.
+The type name regexes built from those tuples go to
+pygments_bsl/generated_patterns.py (``--patterns-only`` rebuilds just them).
 """
 
+import argparse
 import json
 import re
+import runpy
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Sequence
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC_DIR = ROOT / "3rd_party"
 OUT_FILE = ROOT / "pygments_bsl" / "generated_data.py"
+PATTERNS_FILE = ROOT / "pygments_bsl" / "generated_patterns.py"
+
+# names doc comments highlight as types on top of TYPE_NAMES
+DOC_TYPE_EXTRA_NAMES = (
+    "Булево", "Число", "Строка", "Дата", "Массив", "ТаблицаЗначений", "Структура", "Соответствие",
+    "ПланОбменаСсылка", "ДанныеФормыСтруктура", "КомпоновщикНастроекКомпоновкиДанных",
+    "Boolean", "Number", "String", "Date",
+)
 
 
 def _unique(names: Iterable[str]) -> List[str]:
@@ -56,6 +68,67 @@ def _format_tuple(name: str, values: List[str]) -> str:
     return f"{name} = (\n{body})\n"
 
 
+def trie_patterns(name_sets: Sequence[Iterable[str]]) -> List[str]:
+    """Build one non-capturing regex per set of ``name_sets`` matching exactly
+    its names (case-insensitively), all from one prefix trie.
+
+    A flat ``(?:a|b|...)`` over thousands of names is slow to compile and is
+    scanned branch by branch; the trie shares common prefixes instead.
+    """
+    # node: {char: child}, the '' key holds the bits of the sets ending there
+    trie: Dict[str, dict] = {}
+    for bit, names in enumerate(name_sets):
+        for name in names:
+            node = trie
+            for char in name:
+                lowered = char.lower()
+                node = node.setdefault(lowered if len(lowered) == 1 else char, {})
+            node[""] = node.get("", 0) | 1 << bit
+
+    reach: Dict[int, int] = {}
+
+    def sets_below(node: dict) -> int:
+        bits = node.get("", 0)
+        for char, child in node.items():
+            if char:
+                bits |= sets_below(child)
+        reach[id(node)] = bits
+        return bits
+
+    sets_below(trie)
+
+    def build(node: dict, bit: int) -> str:
+        branches = [
+            re.escape(char) + build(child, bit)
+            for char, child in sorted(node.items())
+            if char and reach[id(child)] & bit
+        ]
+        if node.get("", 0) & bit:
+            return f'(?:{"|".join(branches)})?' if branches else ""
+        if len(branches) == 1:
+            return branches[0]
+        return f'(?:{"|".join(branches)})'
+
+    return [f"(?:{build(trie, 1 << bit)})" for bit in range(len(name_sets))]
+
+
+def write_patterns() -> None:
+    type_names = runpy.run_path(str(OUT_FILE))["TYPE_NAMES"]
+    type_pattern, doc_pattern = trie_patterns([type_names, type_names + DOC_TYPE_EXTRA_NAMES])
+    content = (
+        "# Auto-generated by tools/generate_data.py. Do not edit by hand.\n"
+        "# Source data: TYPE_NAMES of generated_data.py\n\n"
+        "__all__ = ['DOC_TYPE_EXTRA_NAMES', 'TYPE_NAME_PATTERN', 'DOC_TYPE_PATTERN']\n\n"
+        + _format_tuple("DOC_TYPE_EXTRA_NAMES", list(DOC_TYPE_EXTRA_NAMES))
+        + "\n"
+        + f"TYPE_NAME_PATTERN = {type_pattern!r}\n"
+        + "\n"
+        + f"DOC_TYPE_PATTERN = {doc_pattern!r}\n"
+    )
+    PATTERNS_FILE.write_text(content, encoding="utf-8")
+    print(f"Wrote {PATTERNS_FILE}")
+
+
 def main() -> None:
     type_names = [
         n
@@ -78,7 +151,14 @@ def main() -> None:
 
     OUT_FILE.write_text(content, encoding="utf-8")
     print(f"Wrote {OUT_FILE}")
+    write_patterns()
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--patterns-only", action="store_true",
+                        help="rebuild generated_patterns.py from the current generated_data.py")
+    if parser.parse_args().patterns_only:
+        write_patterns()
+    else:
+        main()